@@ -0,0 +1,243 @@
+# -*- coding: utf-8 -*-
+"""Content-addressed attachment store for DataSniffR backups.
+
+Attachment contents are stored once per backup manager, keyed by their
+checksum, next to the backup files on the configured storage. Backups
+only reference the checksums; ``datasniffr.backup.blob`` remembers which
+blobs are already stored so unchanged attachments are never uploaded
+twice, and links every blob to the backups referencing it, so only blobs
+no remaining backup references are ever dropped.
+"""
+
+import hashlib
+import io
+import logging
+import os
+import shutil
+
+from odoo import models, fields, api
+from psycopg2.extras import execute_values
+
+_logger = logging.getLogger(__name__)
+
+COPY_BUFFER_SIZE = 1024 * 1024
+
+
+class _HashingReader(io.RawIOBase):
+    """Wraps a file object, SHA-1 hashing what is read through it"""
+
+    def __init__(self, fileobj):
+        self.fileobj = fileobj
+        self.sha1 = hashlib.sha1()
+        self.size = 0
+
+    def readable(self):
+        return True
+
+    def readinto(self, target):
+        data = self.fileobj.read(len(target))
+        self.sha1.update(data)
+        self.size += len(data)
+        target[:len(data)] = data
+        return len(data)
+
+    def read(self, size=-1):
+        data = self.fileobj.read(size)
+        self.sha1.update(data)
+        self.size += len(data)
+        return data
+
+
+class LocalBlobStore:
+    """Blobs as files under ``<root>/ab/abcdef...``"""
+
+    def __init__(self, root):
+        self.root = root
+
+    def _path(self, checksum):
+        return os.path.join(self.root, checksum[:2], checksum)
+
+    def put(self, checksum, fileobj):
+        path = self._path(checksum)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        # Write aside and rename, so a blob is either complete or absent
+        with open(path + '.part', 'wb') as f:
+            shutil.copyfileobj(fileobj, f, COPY_BUFFER_SIZE)
+        os.replace(path + '.part', path)
+
+    def get(self, checksum, fileobj):
+        with open(self._path(checksum), 'rb') as f:
+            shutil.copyfileobj(f, fileobj, COPY_BUFFER_SIZE)
+
+    def delete(self, checksum):
+        if os.path.exists(self._path(checksum)):
+            os.remove(self._path(checksum))
+
+    def close(self):
+        pass
+
+
+class S3BlobStore:
+    """Blobs as objects under ``<prefix>/ab/abcdef...``"""
+
+    def __init__(self, client, bucket, prefix):
+        self.client = client
+        self.bucket = bucket
+        self.prefix = prefix
+
+    def _key(self, checksum):
+        return f"{self.prefix}/{checksum[:2]}/{checksum}"
+
+    def put(self, checksum, fileobj):
+        self.client.upload_fileobj(fileobj, self.bucket, self._key(checksum))
+
+    def get(self, checksum, fileobj):
+        self.client.download_fileobj(self.bucket, self._key(checksum), fileobj)
+
+    def delete(self, checksum):
+        self.client.delete_object(Bucket=self.bucket, Key=self._key(checksum))
+
+    def close(self):
+        pass
+
+
+class GcsBlobStore(S3BlobStore):
+    """Blobs as GCS objects under ``<prefix>/ab/abcdef...``"""
+
+    def put(self, checksum, fileobj):
+        self.bucket.blob(self._key(checksum)).upload_from_file(fileobj)
+
+    def get(self, checksum, fileobj):
+        self.bucket.blob(self._key(checksum)).download_to_file(fileobj)
+
+    def delete(self, checksum):
+        self.bucket.blob(self._key(checksum)).delete()
+
+
+class FtpBlobStore:
+    """Blobs as files in one remote directory, over FTP or SFTP"""
+
+    def __init__(self, path, ftp=None, sftp=None, transport=None):
+        self.path = path
+        self.ftp = ftp
+        self.sftp = sftp
+        self.transport = transport
+
+        try:
+            if self.sftp:
+                self.sftp.mkdir(path)
+            else:
+                self.ftp.mkd(path)
+        except Exception:
+            # Already there
+            pass
+
+    def _path(self, checksum):
+        return f"{self.path}/{checksum}"
+
+    def put(self, checksum, fileobj):
+        if self.sftp:
+            self.sftp.putfo(fileobj, self._path(checksum))
+        else:
+            self.ftp.storbinary(f'STOR {self._path(checksum)}', fileobj)
+
+    def get(self, checksum, fileobj):
+        if self.sftp:
+            self.sftp.getfo(self._path(checksum), fileobj)
+        else:
+            self.ftp.retrbinary(f'RETR {self._path(checksum)}', fileobj.write)
+
+    def delete(self, checksum):
+        if self.sftp:
+            self.sftp.remove(self._path(checksum))
+        else:
+            self.ftp.delete(self._path(checksum))
+
+    def close(self):
+        if self.sftp:
+            self.sftp.close()
+            self.transport.close()
+        else:
+            self.ftp.quit()
+
+
+class DatasniffrBackupBlob(models.Model):
+    _name = 'datasniffr.backup.blob'
+    _description = 'Backup Attachment Blob'
+    _order = 'id desc'
+
+    backup_manager_id = fields.Many2one('datasniffr.backup.manager', string='Backup Manager', required=True, ondelete='cascade')
+    checksum = fields.Char('Checksum', required=True, help='SHA-1 of the attachment content, as in ir.attachment')
+    file_size = fields.Integer('File Size')
+    stored_at = fields.Datetime('Stored At', default=fields.Datetime.now)
+    backup_history_ids = fields.Many2many('datasniffr.backup.history', 'datasniffr_backup_blob_history_rel',
+                                          'blob_id', 'history_id', string='Referencing Backups')
+
+    _sql_constraints = [
+        ('checksum_unique', 'unique(backup_manager_id, checksum)', 'A blob is stored once per backup manager!'),
+    ]
+
+    @api.model
+    def _get_stored(self, manager, checksums):
+        """Subset of the checksums already in the manager's blob store"""
+        if not checksums:
+            return set()
+        self.env.cr.execute("""
+            SELECT checksum FROM datasniffr_backup_blob
+             WHERE backup_manager_id = %s AND checksum IN %s
+        """, (manager.id, tuple(checksums)))
+        return {row[0] for row in self.env.cr.fetchall()}
+
+    @api.model
+    def _mark_stored(self, manager, blobs):
+        """Register ``{checksum: file_size}`` as stored in the manager's blob store"""
+        if blobs:
+            execute_values(self.env.cr, """
+                INSERT INTO datasniffr_backup_blob
+                    (backup_manager_id, checksum, file_size, stored_at,
+                     create_uid, create_date, write_uid, write_date)
+                SELECT v.manager_id, v.checksum, v.file_size, now() at time zone 'UTC',
+                       v.uid, now() at time zone 'UTC', v.uid, now() at time zone 'UTC'
+                  FROM (VALUES %s) AS v(manager_id, checksum, file_size, uid)
+                ON CONFLICT (backup_manager_id, checksum) DO NOTHING
+            """, [(manager.id, checksum, size, self.env.uid) for checksum, size in blobs.items()],
+                template='(%s, %s, %s::integer, %s)', page_size=5000)
+
+    @api.model
+    def _link_history(self, backup_history, checksums):
+        """Record that the backup references these blobs"""
+        checksums = list(checksums)
+        for start in range(0, len(checksums), 5000):
+            self.env.cr.execute("""
+                INSERT INTO datasniffr_backup_blob_history_rel (blob_id, history_id)
+                SELECT b.id, %s FROM datasniffr_backup_blob b
+                 WHERE b.backup_manager_id = %s AND b.checksum = ANY(%s)
+                ON CONFLICT DO NOTHING
+            """, (backup_history.id, backup_history.backup_manager_id.id, checksums[start:start + 5000]))
+
+    @api.model
+    def _collect_garbage(self, manager):
+        """Drop blobs no remaining backup of the manager references"""
+        self.env['datasniffr.backup.history'].flush()
+        self.env.cr.execute("""
+            SELECT b.id FROM datasniffr_backup_blob b
+             WHERE b.backup_manager_id = %s
+               AND NOT EXISTS (SELECT 1 FROM datasniffr_backup_blob_history_rel r WHERE r.blob_id = b.id)
+        """, (manager.id,))
+        stale = self.browse([row[0] for row in self.env.cr.fetchall()])
+        if not stale:
+            return 0
+
+        store = manager._open_blob_store()
+        try:
+            for blob in stale:
+                try:
+                    store.delete(blob.checksum)
+                except Exception as e:
+                    _logger.warning(f"Failed to delete backup blob {blob.checksum}: {str(e)}")
+        finally:
+            store.close()
+
+        count = len(stale)
+        stale.unlink()
+        return count
@@ -0,0 +1,156 @@
+# -*- coding: utf-8 -*-
+"""Parallel per-model export for DataSniffR full database backups.
+
+A coordinator connection opens a REPEATABLE READ transaction and exports
+its snapshot; worker processes import that snapshot on their own
+connections, so every segment sees the database at the same instant.
+Each task exports the stored columns of one model (or one id range of a
+large model) into its own compressed NDJSON segment.
+
+Plain psycopg2 on purpose: no Odoo environment is used in the workers.
+"""
+
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import psycopg2
+from psycopg2 import sql
+
+from .datasniffr_backup_stream import BackupStreamWriter
+
+# Tables with more (estimated) rows than this are split into id ranges
+RANGE_ROWS = 500000
+
+# Rows fetched per round trip by the workers' server-side cursors
+FETCH_SIZE = 2000
+
+
+def split_id_range(min_id, max_id, estimated_rows, range_rows=RANGE_ROWS):
+    """``[(id_from, id_to)]`` (id_to exclusive) covering min_id..max_id in about range_rows slices"""
+    if min_id is None:
+        return []
+
+    slices = max(1, int(estimated_rows // range_rows) + (1 if estimated_rows % range_rows else 0))
+    bounds = np.linspace(min_id, max_id + 1, slices + 1).astype(np.int64)
+    bounds = np.unique(bounds)
+    return [(int(lower), int(upper)) for lower, upper in zip(bounds[:-1], bounds[1:])]
+
+
+def _range_clause(task):
+    """WHERE clause and params limiting a task to its id range (and changes)"""
+    conditions = [sql.SQL('TRUE')]
+    params = []
+    if task.get('id_from') is not None:
+        conditions.append(sql.SQL('t.id >= %s'))
+        params.append(task['id_from'])
+    if task.get('id_to') is not None:
+        conditions.append(sql.SQL('t.id < %s'))
+        params.append(task['id_to'])
+    return sql.SQL(' AND ').join(conditions), params
+
+
+def export_segment(connection_info, snapshot, task):
+    """Worker: export one task into its segment file, inside the shared snapshot
+
+    Returns the segment summary plus the sorted ids of the task's range,
+    which the coordinator needs for id snapshots and tombstones.
+    """
+    conn = psycopg2.connect(**connection_info)
+    try:
+        conn.set_session(isolation_level='REPEATABLE READ', readonly=True)
+        cr = conn.cursor()
+        cr.execute('SET TRANSACTION SNAPSHOT %s', (snapshot,))
+
+        table = sql.Identifier(task['table'])
+        where, params = _range_clause(task)
+
+        cr.execute(sql.SQL('SELECT t.id FROM {} t WHERE {} ORDER BY t.id').format(table, where), params)
+        ids = np.array([row[0] for row in cr.fetchall()], dtype=np.int64)
+
+        # Only records written since the parent backup, when there is one
+        if task.get('since'):
+            where = sql.SQL('{} AND t.write_date >= %s').format(where)
+            params = params + [task['since']]
+
+        names = list(task['columns']) + [m2m['name'] for m2m in task['m2m']]
+        selects = [sql.SQL('t.{}').format(sql.Identifier(column)) for column in task['columns']]
+        selects += [
+            sql.SQL('ARRAY(SELECT r.{column2} FROM {relation} r WHERE r.{column1} = t.id ORDER BY 1)').format(
+                column2=sql.Identifier(m2m['column2']),
+                relation=sql.Identifier(m2m['relation']),
+                column1=sql.Identifier(m2m['column1'])
+            ) for m2m in task['m2m']
+        ]
+        query = sql.SQL('SELECT {} FROM {} t WHERE {} ORDER BY t.id').format(sql.SQL(', ').join(selects), table, where)
+
+        record_count = 0
+        reader = conn.cursor(name='datasniffr_export')
+        reader.itersize = FETCH_SIZE
+        reader.execute(query, params)
+
+        with BackupStreamWriter(task['segment_path'], task['compression'], task.get('encryption_key')) as writer:
+            for row in reader:
+                writer.write_line({'type': 'record', 'model': task['model'], 'values': dict(zip(names, row))})
+                record_count += 1
+
+        reader.close()
+        conn.rollback()
+
+        segment = writer.close()
+        segment.update({'model': task['model'], 'record_count': record_count, 'ids': ids})
+        return segment
+    finally:
+        conn.close()
+
+
+class ParallelExporter:
+    """Holds the exported snapshot open while worker processes export tasks"""
+
+    def __init__(self, connection_info, workers=4):
+        self.connection_info = connection_info
+        self.workers = max(1, min(workers, multiprocessing.cpu_count()))
+        self.conn = None
+        self.snapshot = None
+
+    def __enter__(self):
+        self.conn = psycopg2.connect(**self.connection_info)
+        self.conn.set_session(isolation_level='REPEATABLE READ', readonly=True)
+        cr = self.conn.cursor()
+        cr.execute('SELECT pg_export_snapshot()')
+        self.snapshot = cr.fetchone()[0]
+        return self
+
+    def table_stats(self, tables):
+        """``{table: (min id, max id, estimated rows)}`` as of the snapshot"""
+        cr = self.conn.cursor()
+        cr.execute('SELECT relname, reltuples FROM pg_class WHERE relname IN %s AND relkind = %s', (tuple(tables), 'r'))
+        estimates = dict(cr.fetchall())
+
+        stats = {}
+        for table in tables:
+            cr.execute(sql.SQL('SELECT min(id), max(id) FROM {}').format(sql.Identifier(table)))
+            min_id, max_id = cr.fetchone()
+            stats[table] = (min_id, max_id, max(estimates.get(table, 0), 0))
+        return stats
+
+    def run(self, tasks, while_running=None):
+        """Export the tasks on the process pool; ``while_running`` runs here meanwhile
+
+        Large tasks are submitted first so they don't end up last in the queue.
+        Returns the segment summaries in task order.
+        """
+        context = multiprocessing.get_context('fork')
+        with ProcessPoolExecutor(max_workers=self.workers, mp_context=context) as pool:
+            order = sorted(range(len(tasks)), key=lambda index: -tasks[index].get('estimated_rows', 0))
+            futures = {index: pool.submit(export_segment, self.connection_info, self.snapshot, tasks[index]) for index in order}
+
+            if while_running:
+                while_running()
+
+            return [futures[index].result() for index in range(len(tasks))]
+
+    def __exit__(self, exc_type, exc, traceback):
+        if self.conn:
+            self.conn.rollback()
+            self.conn.close()
@@ -2,20 +2,31 @@
 
 import json
 import base64
+import io
 import os
 import shutil
-import gzip
 import tarfile
 from datetime import datetime, timedelta
 from odoo import models, fields, api, _
 from odoo.exceptions import ValidationError, UserError
+from odoo.sql_db import connection_info_for
 import logging
 import hashlib
+import numpy as np
 import boto3
 from google.cloud import storage as gcs
 import paramiko
 import ftplib
 
+from psycopg2 import sql
+from psycopg2.extras import execute_values
+
+from .datasniffr_backup_blobs import LocalBlobStore, S3BlobStore, GcsBlobStore, FtpBlobStore, _HashingReader
+from .datasniffr_backup_export import ParallelExporter, split_id_range
+from .datasniffr_backup_upload import StreamingUpload, S3MultipartUploader, GcsResumableUploader, FtpUploader, SftpUploader
+from .datasniffr_backup_stream import BackupStreamWriter, BackupStreamReader, COMPRESSION_EXTENSIONS, fernet_for_key, _HashingSink
+from .datasniffr_fix_writer import _pack_ids, _unpack_ids
+
 _logger = logging.getLogger(__name__)
 
 class DatasniffrBackupManager(models.Model):
@@ -73,6 +84,7 @@ class DatasniffrBackupManager(models.Model):
     aws_secret_key = fields.Char('AWS Secret Key')
     aws_bucket = fields.Char('AWS S3 Bucket')
     aws_region = fields.Char('AWS Region', default='us-east-1')
+    aws_endpoint_url = fields.Char('S3 Endpoint URL', help='For S3-compatible storage (e.g. a local MinIO); empty for AWS')
     
     gcp_credentials = fields.Text('GCP Service Account JSON')
     gcp_bucket = fields.Char('GCP Storage Bucket')
@@ -98,6 +110,16 @@ class DatasniffrBackupManager(models.Model):
     retention_days = fields.Integer('Retention Days', default=30, help='Keep backups for X days')
     max_backups = fields.Integer('Max Backup Count', default=10, help='Maximum number of backups to keep')
     compress_backups = fields.Boolean('Compress Backups', default=True)
+    compression_format = fields.Selection([
+        ('gzip', 'gzip'),
+        ('zstd', 'Zstandard')
+    ], string='Compression Format', default='gzip')
+    backup_chunk_size = fields.Integer('Records per Chunk', default=1000, help='Records read and serialized at a time; bounds backup memory')
+    parallel_export = fields.Boolean('Parallel Export', default=True, help='Export full database backups model by model on worker processes')
+    backup_workers = fields.Integer('Export Workers', default=4)
+    upload_part_size = fields.Integer('Upload Part Size (MB)', default=8, help='Backups are uploaded in parts of this size while being produced')
+    upload_retries = fields.Integer('Upload Retries', default=5, help='Retries per part, with exponential backoff')
+    upload_bandwidth_limit = fields.Integer('Upload Bandwidth Limit (KB/s)', default=0, help='0 = unlimited')
     encrypt_backups = fields.Boolean('Encrypt Backups', default=False)
     encryption_key = fields.Char('Encryption Key')
     
@@ -166,11 +188,13 @@ class DatasniffrBackupManager(models.Model):
             self.state = 'running'
             start_time = datetime.now()
             
-            # Prepare backup data
-            backup_data = self._prepare_backup_data()
+            # Incremental/differential backups only capture changes since their parent
+            parent_backup = self._get_parent_backup()
+            backup_type = self._effective_backup_type(parent_backup)
+            backup_until = self._get_change_cutoff()
             
-            # Create backup file
-            backup_file = self._create_backup_file(backup_data)
+            # Stream the backup data straight into the backup file
+            backup_file, backup_data = self._create_backup_file(parent_backup)
             
             # Upload to storage
             storage_result = self._upload_backup(backup_file)
@@ -183,29 +207,48 @@ class DatasniffrBackupManager(models.Model):
             
             # Calculate backup size
             backup_size = os.path.getsize(backup_file['path']) / (1024**3)  # GB
+            backup_ok = verification_result['verified'] and storage_result.get('success', False)
+            # A failed upload keeps its local file and resume state
+            upload_state = storage_result.get('upload_state') if not storage_result.get('success') else None
             
             # Create backup history record
             backup_history = self.env['datasniffr.backup.history'].create({
                 'backup_manager_id': self.id,
-                'backup_type': self.backup_type,
+                'backup_type': backup_type,
                 'backup_date': start_time,
+                'backup_until': backup_until,
+                'parent_backup_id': parent_backup.id if parent_backup else False,
                 'backup_size_gb': backup_size,
                 'storage_location': storage_result.get('location', ''),
-                'status': 'success' if verification_result['verified'] else 'failed',
+                'status': 'success' if backup_ok else 'failed',
+                'error_message': storage_result.get('error') or (False if verification_result['verified'] else verification_result.get('message')),
+                'upload_state': json.dumps(upload_state) if upload_state else False,
                 'backup_hash': backup_file.get('hash', ''),
                 'metadata': json.dumps({
                     'records_backed_up': backup_data.get('record_count', 0),
                     'models_included': backup_data.get('models', []),
-                    'compression_ratio': backup_file.get('compression_ratio', 1.0)
-                })
+                    'tombstones': backup_data.get('tombstone_count', 0),
+                    'compression_ratio': backup_file.get('compression_ratio', 1.0),
+                    'filename': backup_file['filename'],
+                    'compression': backup_file['compression'],
+                    'encrypted': backup_file['encrypted'],
+                    'format': backup_file['format']
+                }),
+                'model_state_ids': [(0, 0, {
+                    'model': model_name,
+                    'record_count': len(ids),
+                    'record_ids_blob': base64.b64encode(_pack_ids(ids))
+                }) for model_name, ids in backup_data.get('id_snapshots', {}).items()]
             })
+            backup_history._record_chain_manifest()
+            self.env['datasniffr.backup.blob']._link_history(backup_history, backup_data.get('blob_checksums', ()))
             
             # Update statistics
             self.total_backups += 1
             self.total_backup_size += backup_size
             self.last_backup = start_time
             
-            if verification_result['verified']:
+            if backup_ok:
                 self.successful_backups += 1
                 self.last_backup_status = 'success'
                 self.state = 'active'
@@ -223,17 +266,18 @@ class DatasniffrBackupManager(models.Model):
             # Clean up old backups
             self._cleanup_old_backups()
             
-            # Clean up local temp file
-            if os.path.exists(backup_file['path']):
+            # Clean up local temp file, unless it is the stored backup or an upload may resume from it
+            if os.path.exists(backup_file['path']) and backup_file['path'] != storage_result.get('location') and not upload_state:
                 os.remove(backup_file['path'])
             
             return {
                 'type': 'ir.actions.client',
                 'tag': 'display_notification',
                 'params': {
-                    'message': f'🎯 Backup "{self.name}" created successfully! Size: {backup_size:.2f} GB',
-                    'type': 'success',
-                    'sticky': False,
+                    'message': f'🎯 Backup "{self.name}" created successfully! Size: {backup_size:.2f} GB' if backup_ok
+                               else f'❌ Backup "{self.name}" created but not stored: {backup_history.error_message}',
+                    'type': 'success' if backup_ok else 'warning',
+                    'sticky': not backup_ok,
                 }
             }
             
@@ -244,120 +288,232 @@ class DatasniffrBackupManager(models.Model):
             _logger.error(f"Backup creation failed: {str(e)}")
             raise UserError(f"Backup creation failed: {str(e)}")
 
-    def _prepare_backup_data(self):
-        """Prepare data for backup"""
-        backup_data = {
+    def _get_parent_backup(self):
+        """Backup an incremental/differential run builds on, False for a full backup"""
+        if self.backup_type not in ('incremental', 'differential'):
+            return False
+        
+        domain = [
+            ('backup_manager_id', '=', self.id),
+            ('status', '=', 'success'),
+            ('backup_until', '!=', False)
+        ]
+        if self.backup_type == 'differential':
+            # Differential backups always diff against the last full backup
+            domain.append(('backup_type', '=', 'full'))
+        
+        return self.env['datasniffr.backup.history'].search(domain, order='backup_until desc, id desc', limit=1)
+
+    def _effective_backup_type(self, parent_backup):
+        """Incremental/differential without a parent to build on run as a full backup"""
+        if self.backup_type in ('incremental', 'differential') and not parent_backup:
+            return 'full'
+        return self.backup_type
+
+    def _get_change_cutoff(self):
+        """Point in time the next incremental backup captures changes from
+        
+        Transactions still running now may commit rows with an older write_date
+        after our snapshot, so the cutoff moves back to the oldest of them.
+        Rows written in between end up in both backups, which is harmless.
+        """
+        self.env.cr.execute("""
+            SELECT least(now(), coalesce(min(xact_start), now())) at time zone 'UTC'
+              FROM pg_stat_activity
+             WHERE datname = current_database() AND xact_start IS NOT NULL
+        """)
+        return self.env.cr.fetchone()[0]
+
+    def _new_backup_header(self, parent_backup=False):
+        """Header describing the backup, written first in every backup"""
+        return {
             'timestamp': datetime.now().isoformat(),
-            'backup_type': self.backup_type,
+            'backup_type': self._effective_backup_type(parent_backup),
             'backup_scope': self.backup_scope,
-            'data': {},
-            'metadata': {},
+            'parent_backup_id': parent_backup.id if parent_backup else False,
+            'changes_since': fields.Datetime.to_string(parent_backup.backup_until) if parent_backup else False,
+            'metadata': {
+                'odoo_version': self.env['ir.module.module'].get_module_info('base')['version'],
+                'database_name': self.env.cr.dbname,
+                'backup_manager_id': self.id,
+                'user_id': self.env.user.id,
+                'company_id': self.env.company.id
+            },
             'record_count': 0,
+            'tombstone_count': 0,
             'models': []
         }
+
+    def _prepare_backup_data(self, writer, parent_backup=False):
+        """Stream data for backup into the writer, returns the backup summary"""
+        backup_data = self._new_backup_header(parent_backup)
+        writer.write_line({'type': 'header', **backup_data})
+        
+        # Record ids of every model in the parent backup, for tombstones and new models
+        parent_ids = parent_backup._get_id_snapshots() if parent_backup else None
         
         if self.backup_scope == 'database':
             # Full database backup
-            backup_data['data'] = self._backup_full_database()
+            result = self._backup_full_database(writer, parent_backup, parent_ids)
         elif self.backup_scope == 'models':
             # Specific models backup
-            backup_data['data'] = self._backup_models()
+            result = self._backup_models(writer, parent_backup, parent_ids)
         elif self.backup_scope == 'records':
             # Specific records backup
-            backup_data['data'] = self._backup_records()
+            result = self._backup_records(writer, parent_backup, parent_ids)
         elif self.backup_scope == 'files':
             # File attachments backup
-            backup_data['data'] = self._backup_attachments()
-        
-        # Add system metadata
-        backup_data['metadata'] = {
-            'odoo_version': self.env['ir.module.module'].get_module_info('base')['version'],
-            'database_name': self.env.cr.dbname,
-            'backup_manager_id': self.id,
-            'user_id': self.env.user.id,
-            'company_id': self.env.company.id
-        }
+            result = self._backup_attachments(writer, parent_backup, parent_ids)
+        else:
+            result = self._new_backup_result()
+        
+        backup_data.update(result)
+        
+        writer.write_line({
+            'type': 'footer',
+            'record_count': backup_data['record_count'],
+            'tombstone_count': backup_data['tombstone_count'],
+            'models': backup_data['models']
+        })
+        
+        # Id snapshots and blob references are kept on the history, not in the header/footer lines
+        backup_data['id_snapshots'] = result['id_snapshots']
+        backup_data['blob_checksums'] = result['blob_checksums']
         
         return backup_data
 
-    def _backup_full_database(self):
+    def _new_backup_result(self):
+        """Empty summary the _backup_* methods fill in"""
+        return {'models': [], 'record_count': 0, 'tombstone_count': 0, 'id_snapshots': {}, 'blob_checksums': set()}
+
+    def _iter_record_chunks(self, model, domain=None):
+        """Yield records of the model in id order, backup_chunk_size at a time"""
+        chunk_size = max(1, self.backup_chunk_size or 1000)
+        model = model.with_context(active_test=False)
+        last_id = 0
+        
+        while True:
+            records = model.search((domain or []) + [('id', '>', last_id)], order='id', limit=chunk_size)
+            if not records:
+                break
+            
+            yield records
+            
+            last_id = records[-1].id
+            # Drop the chunk from the cache so memory stays bounded
+            model.invalidate_cache(ids=records.ids)
+
+    def _get_model_ids(self, model, domain=None):
+        """Sorted int64 array of the model's record ids (matching the domain)"""
+        if domain:
+            ids = model.with_context(active_test=False).search(domain, order='id').ids
+            return np.array(ids, dtype=np.int64)
+        
+        self.env.cr.execute(sql.SQL('SELECT id FROM {} ORDER BY id').format(sql.Identifier(model._table)))
+        return np.array([row[0] for row in self.env.cr.fetchall()], dtype=np.int64)
+
+    def _changed_domain(self, model, domain, parent_backup, parent_ids):
+        """Domain of the records to back up, given the parent backup"""
+        domain = list(domain or [])
+        # Models without write_date, or missing from the parent, are backed up whole
+        if parent_backup and model._log_access and parent_ids is not None and model._name in parent_ids:
+            domain.append(('write_date', '>=', fields.Datetime.to_string(parent_backup.backup_until)))
+        return domain
+
+    def _write_tombstones(self, writer, model_name, ids, parent_ids, result):
+        """Write the ids deleted since the parent backup and keep the id snapshot"""
+        result['id_snapshots'][model_name] = ids
+        
+        if parent_ids and model_name in parent_ids:
+            deleted = np.setdiff1d(parent_ids[model_name], ids, assume_unique=True)
+            if len(deleted):
+                # Records that merely left a filter domain still exist
+                self.env.cr.execute(
+                    sql.SQL('SELECT id FROM {} WHERE id = ANY(%s)').format(sql.Identifier(self.env[model_name]._table)),
+                    (deleted.tolist(),)
+                )
+                deleted = np.setdiff1d(deleted, [row[0] for row in self.env.cr.fetchall()])
+            if len(deleted):
+                writer.write_line({'type': 'tombstone', 'model': model_name, 'ids': deleted.tolist()})
+                result['tombstone_count'] += len(deleted)
+
+    def _serialize_record(self, record):
+        """Plain dict of a record's field values"""
+        record_data = {}
+        for field_name, field in record._fields.items():
+            try:
+                value = record[field_name]
+                # Handle different field types
+                if isinstance(value, models.BaseModel):
+                    value = value.ids if field.type in ('one2many', 'many2many') else value.id
+                elif isinstance(value, bytes):
+                    value = value.decode()
+                record_data[field_name] = value
+            except Exception:
+                pass
+        return record_data
+
+    def _stream_model(self, writer, model_name, result, domain=None, parent_backup=False, parent_ids=None):
+        """Write the model's (changed) records and tombstones to the backup stream"""
+        model = self.env[model_name]
+        ids = self._get_model_ids(model, domain)
+        count = 0
+        
+        for records in self._iter_record_chunks(model, self._changed_domain(model, domain, parent_backup, parent_ids)):
+            for record in records:
+                writer.write_line({'type': 'record', 'model': model_name, 'values': self._serialize_record(record)})
+            count += len(records)
+        
+        self._write_tombstones(writer, model_name, ids, parent_ids, result)
+        result['record_count'] += count
+        if model_name not in result['models']:
+            result['models'].append(model_name)
+        
+        return count
+
+    def _backup_full_database(self, writer, parent_backup=False, parent_ids=None):
         """Create full database backup"""
-        data = {}
-        record_count = 0
+        result = self._new_backup_result()
         
         # Get all models
-        model_names = self.env.registry.keys()
-        
-        for model_name in model_names:
+        for model_name in list(self.env.registry.keys()):
             try:
                 model = self.env[model_name]
-                records = model.search([])
+                if model._abstract:
+                    continue
                 
-                if records:
-                    model_data = []
-                    for record in records:
-                        record_data = {}
-                        for field_name, field in model._fields.items():
-                            try:
-                                value = record[field_name]
-                                # Handle different field types
-                                if hasattr(value, 'id'):
-                                    value = value.id
-                                elif hasattr(value, 'ids'):
-                                    value = value.ids
-                                record_data[field_name] = value
-                            except:
-                                pass
-                        model_data.append(record_data)
-                    
-                    data[model_name] = model_data
-                    record_count += len(model_data)
+                # Attachments go through the blob store, their contents never into the stream
+                if model_name == 'ir.attachment':
+                    if self.include_attachments:
+                        self._backup_attachments(writer, parent_backup, parent_ids, result)
+                    continue
+                
+                self._stream_model(writer, model_name, result, parent_backup=parent_backup, parent_ids=parent_ids)
                     
             except Exception as e:
                 _logger.warning(f"Failed to backup model {model_name}: {str(e)}")
         
-        return {'models': data, 'record_count': record_count}
+        return result
 
-    def _backup_models(self):
+    def _backup_models(self, writer, parent_backup=False, parent_ids=None):
         """Backup specific models"""
-        data = {}
-        record_count = 0
+        result = self._new_backup_result()
         
         if self.model_names:
             model_list = [m.strip() for m in self.model_names.split(',')]
             
             for model_name in model_list:
                 try:
-                    model = self.env[model_name]
-                    records = model.search([])
-                    
-                    model_data = []
-                    for record in records:
-                        record_data = {}
-                        for field_name, field in model._fields.items():
-                            try:
-                                value = record[field_name]
-                                if hasattr(value, 'id'):
-                                    value = value.id
-                                elif hasattr(value, 'ids'):
-                                    value = value.ids
-                                record_data[field_name] = value
-                            except:
-                                pass
-                        model_data.append(record_data)
-                    
-                    data[model_name] = model_data
-                    record_count += len(model_data)
+                    self._stream_model(writer, model_name, result, parent_backup=parent_backup, parent_ids=parent_ids)
                     
                 except Exception as e:
                     _logger.error(f"Failed to backup model {model_name}: {str(e)}")
         
-        return {'models': data, 'record_count': record_count}
+        return result
 
-    def _backup_records(self):
+    def _backup_records(self, writer, parent_backup=False, parent_ids=None):
         """Backup specific records based on filters"""
-        data = {}
-        record_count = 0
+        result = self._new_backup_result()
         
         try:
             filters = json.loads(self.record_filters) if self.record_filters else []
@@ -367,131 +523,325 @@ class DatasniffrBackupManager(models.Model):
                 domain = filter_config.get('domain', [])
                 
                 if model_name:
-                    model = self.env[model_name]
-                    records = model.search(domain)
-                    
-                    model_data = []
-                    for record in records:
-                        record_data = {}
-                        for field_name, field in model._fields.items():
-                            try:
-                                value = record[field_name]
-                                if hasattr(value, 'id'):
-                                    value = value.id
-                                elif hasattr(value, 'ids'):
-                                    value = value.ids
-                                record_data[field_name] = value
-                            except:
-                                pass
-                        model_data.append(record_data)
-                    
-                    data[model_name] = data.get(model_name, []) + model_data
-                    record_count += len(model_data)
+                    self._stream_model(writer, model_name, result, domain, parent_backup, parent_ids)
                     
         except Exception as e:
             _logger.error(f"Failed to backup filtered records: {str(e)}")
         
-        return {'models': data, 'record_count': record_count}
+        return result
+
+    def _backup_attachments(self, writer, parent_backup=False, parent_ids=None, result=None):
+        """Backup file attachments, their contents stored once in the blob store"""
+        if result is None:
+            result = self._new_backup_result()
+        Attachment = self.env['ir.attachment']
+        Blob = self.env['datasniffr.backup.blob']
+        ids = self._get_model_ids(Attachment)
+        
+        store = self._open_blob_store()
+        try:
+            for attachments in self._iter_record_chunks(Attachment, self._changed_domain(Attachment, [], parent_backup, parent_ids)):
+                stored = Blob._get_stored(self, {attachment.checksum for attachment in attachments if attachment.checksum})
+                referenced = {}
+                
+                for attachment in attachments:
+                    try:
+                        checksum = self._store_attachment_blob(store, attachment, stored)
+                        if checksum:
+                            stored.add(checksum)
+                            referenced[checksum] = attachment.file_size
+                        
+                        writer.write_line({'type': 'attachment', 'values': {
+                            'id': attachment.id,
+                            'name': attachment.name,
+                            'type': attachment.type,
+                            'url': attachment.url,
+                            'mimetype': attachment.mimetype,
+                            'res_model': attachment.res_model,
+                            'res_field': attachment.res_field,
+                            'res_id': attachment.res_id,
+                            'public': attachment.public,
+                            'company_id': attachment.company_id.id,
+                            'file_size': attachment.file_size,
+                            'checksum': attachment.checksum,
+                            'blob': checksum
+                        }})
+                        result['record_count'] += 1
+                    except Exception as e:
+                        _logger.warning(f"Failed to backup attachment {attachment.id}: {str(e)}")
+                
+                Blob._mark_stored(self, referenced)
+                result['blob_checksums'].update(referenced)
+        finally:
+            store.close()
+        
+        self._write_tombstones(writer, 'ir.attachment', ids, parent_ids, result)
+        result['models'].append('ir.attachment')
+        
+        return result
+
+    def _store_attachment_blob(self, store, attachment, stored):
+        """Stream an attachment's content into the blob store unless already there, returns its checksum"""
+        if attachment.type != 'binary':
+            return False
+        
+        checksum = attachment.checksum
+        if checksum and checksum in stored:
+            return checksum
+        
+        if attachment.store_fname:
+            # Straight from the filestore, never loaded in memory as a whole
+            fileobj = open(attachment._full_path(attachment.store_fname), 'rb')
+        elif attachment.db_datas:
+            fileobj = io.BytesIO(attachment.db_datas)
+        else:
+            return False
+        
+        with fileobj:
+            if not checksum:
+                checksum = self._file_sha1(fileobj)
+                fileobj.seek(0)
+                if checksum in stored:
+                    return checksum
+            
+            reader = _HashingReader(fileobj)
+            store.put(checksum, reader)
+            
+            actual = reader.sha1.hexdigest()
+            if actual != checksum:
+                # Content changed under its checksum, key the blob by what was actually read
+                _logger.warning(f"Attachment {attachment.id} checksum mismatch, storing as {actual}")
+                store.delete(checksum)
+                checksum = actual
+                if checksum not in stored:
+                    fileobj.seek(0)
+                    store.put(checksum, fileobj)
+        
+        return checksum
+
+    def _file_sha1(self, fileobj):
+        """SHA-1 of an open file, read in chunks"""
+        sha1 = hashlib.sha1()
+        for chunk in iter(lambda: fileobj.read(1024 * 1024), b""):
+            sha1.update(chunk)
+        return sha1.hexdigest()
 
-    def _backup_attachments(self):
-        """Backup file attachments"""
-        attachments = self.env['ir.attachment'].search([])
-        attachment_data = []
+    def _open_blob_store(self):
+        """Attachment blob store on the configured storage"""
+        if self.storage_type == 'ftp':
+            blob_path = os.path.join(self.ftp_path, 'datasniffr_blobs')
+            if self.use_sftp:
+                transport, sftp = self._connect_sftp()
+                return FtpBlobStore(blob_path, sftp=sftp, transport=transport)
+            return FtpBlobStore(blob_path, ftp=self._connect_ftp())
+        elif self.storage_type == 'aws_s3':
+            s3_client = self._get_s3_client()
+            return S3BlobStore(s3_client, self.aws_bucket, 'datasniffr_backups/blobs')
+        elif self.storage_type == 'google_cloud':
+            client = self._get_gcs_client()
+            return GcsBlobStore(client, client.bucket(self.gcp_bucket), 'datasniffr_backups/blobs')
+        else:
+            return LocalBlobStore(os.path.join(self.local_path, 'blobs'))
+
+    def _get_stream_settings(self):
+        """Compression, encryption key and file suffix of the backup streams"""
+        compression = (self.compression_format or 'gzip') if self.compress_backups else 'none'
+        suffix = COMPRESSION_EXTENSIONS[compression]
         
-        for attachment in attachments:
+        encryption_key = None
+        if self.encrypt_backups and self.encryption_key:
             try:
-                attachment_info = {
-                    'id': attachment.id,
-                    'name': attachment.name,
-                    'datas_fname': attachment.datas_fname,
-                    'mimetype': attachment.mimetype,
-                    'res_model': attachment.res_model,
-                    'res_id': attachment.res_id,
-                    'datas': attachment.datas.decode() if attachment.datas else None,
-                    'file_size': attachment.file_size,
-                    'checksum': attachment.checksum
-                }
-                attachment_data.append(attachment_info)
+                fernet_for_key(self.encryption_key)
+                encryption_key = self.encryption_key
+                suffix += '.enc'
             except Exception as e:
-                _logger.warning(f"Failed to backup attachment {attachment.id}: {str(e)}")
+                # If encryption isn't available, keep the backup unencrypted
+                _logger.error(f"Encryption failed: {str(e)}")
         
-        return {'attachments': attachment_data, 'record_count': len(attachment_data)}
+        return compression, encryption_key, suffix
 
-    def _create_backup_file(self, backup_data):
-        """Create backup file with compression and encryption"""
+    def _create_backup_file(self, parent_backup=False):
+        """Create backup file, streaming data through compression, encryption and hashing"""
         timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-        filename = f"{self.name}_{timestamp}_backup.json"
+        backup_type = self._effective_backup_type(parent_backup)
         
-        # Create temp directory
-        temp_dir = '/tmp/datasniffr_backups'
-        os.makedirs(temp_dir, exist_ok=True)
+        backup_dir = self._get_backup_dir()
         
-        file_path = os.path.join(temp_dir, filename)
+        if self.backup_scope == 'database' and self.parallel_export:
+            return self._create_segmented_backup_file(os.path.join(backup_dir, f"{self.name}_{timestamp}_{backup_type}_backup"), parent_backup)
         
-        # Write backup data to file
-        with open(file_path, 'w') as f:
-            json.dump(backup_data, f, indent=2, default=str)
+        compression, encryption_key, suffix = self._get_stream_settings()
+        filename = f"{self.name}_{timestamp}_{backup_type}_backup.ndjson{suffix}"
+        file_path = os.path.join(backup_dir, filename)
         
-        original_size = os.path.getsize(file_path)
+        # Storage receives the backup part by part while it is written
+        upload = self._open_streaming_upload(filename, file_path)
+        try:
+            with BackupStreamWriter(file_path, compression, encryption_key, tee=upload) as writer:
+                backup_data = self._prepare_backup_data(writer, parent_backup)
+        except Exception:
+            if upload:
+                upload.abort()
+            raise
         
-        # Compress if enabled
-        if self.compress_backups:
-            compressed_path = file_path + '.gz'
-            with open(file_path, 'rb') as f_in:
-                with gzip.open(compressed_path, 'wb') as f_out:
-                    shutil.copyfileobj(f_in, f_out)
+        backup_file = writer.close()
+        backup_file.update({
+            'upload': upload.close() if upload else None,
+            'filename': filename,
+            'compression': compression,
+            'encrypted': bool(encryption_key),
+            'format': 'ndjson'
+        })
+        
+        return backup_file, backup_data
+
+    def _get_export_models(self):
+        """Models the parallel export covers, one per table"""
+        export_models = {}
+        for model_name in list(self.env.registry.keys()):
+            model = self.env[model_name]
+            # SQL views are derived data; attachments go through the blob store
+            if model._abstract or not model._auto or model_name == 'ir.attachment':
+                continue
+            export_models.setdefault(model._table, model)
+        return export_models
+
+    def _get_export_columns(self, model):
+        """Stored columns and many2many relations of a model, as export task fields"""
+        columns = [name for name, field in model._fields.items() if field.store and field.column_type]
+        m2m = [{
+            'name': field.name,
+            'relation': field.relation,
+            'column1': field.column1,
+            'column2': field.column2
+        } for field in model._fields.values() if field.store and field.type == 'many2many']
+        return columns, m2m
+
+    def _create_segmented_backup_file(self, base_path, parent_backup=False):
+        """Full database backup exported in parallel: per-model segments plus a manifest, in one tar"""
+        compression, encryption_key, suffix = self._get_stream_settings()
+        segment_dir = base_path + '_segments'
+        os.makedirs(segment_dir, exist_ok=True)
+        
+        backup_data = self._new_backup_header(parent_backup)
+        parent_ids = parent_backup._get_id_snapshots() if parent_backup else None
+        result = self._new_backup_result()
+        segments = []
+        
+        try:
+            with ParallelExporter(connection_info_for(self.env.cr.dbname)[1], self.backup_workers or 1) as exporter:
+                export_models = self._get_export_models()
+                stats = exporter.table_stats(list(export_models))
+                
+                tasks = []
+                for table, model in export_models.items():
+                    columns, m2m = self._get_export_columns(model)
+                    min_id, max_id, estimated_rows = stats[table]
+                    since = None
+                    if parent_backup and model._log_access and parent_ids is not None and model._name in parent_ids:
+                        since = fields.Datetime.to_string(parent_backup.backup_until)
+                    
+                    # Large tables are split into id ranges exported side by side
+                    ranges = split_id_range(min_id, max_id, estimated_rows) or [(None, None)]
+                    for index, (id_from, id_to) in enumerate(ranges):
+                        tasks.append({
+                            'model': model._name,
+                            'table': table,
+                            'columns': columns,
+                            'm2m': m2m,
+                            'id_from': id_from,
+                            'id_to': id_to,
+                            'since': since,
+                            'estimated_rows': estimated_rows / len(ranges),
+                            'segment_path': os.path.join(segment_dir, f"{table}.{index}.ndjson{suffix}"),
+                            'compression': compression,
+                            'encryption_key': encryption_key
+                        })
+                
+                def export_attachments():
+                    # Runs here while the workers export the tables
+                    if self.include_attachments:
+                        path = os.path.join(segment_dir, f"ir_attachment.0.ndjson{suffix}")
+                        with BackupStreamWriter(path, compression, encryption_key) as writer:
+                            count = result['record_count']
+                            self._backup_attachments(writer, parent_backup, parent_ids, result)
+                        segments.append(dict(writer.close(), model='ir.attachment', record_count=result['record_count'] - count))
+                
+                exported = exporter.run(tasks, export_attachments)
+            
+            # Id snapshots and tombstones, from the ids the workers saw
+            ids_by_model = {}
+            for segment in exported:
+                ids_by_model.setdefault(segment['model'], []).append(segment.pop('ids'))
+                result['record_count'] += segment['record_count']
+                if segment['model'] not in result['models']:
+                    result['models'].append(segment['model'])
+            segments = exported + segments
+            
+            path = os.path.join(segment_dir, f"tombstones.ndjson{suffix}")
+            with BackupStreamWriter(path, compression, encryption_key) as writer:
+                for model_name, id_chunks in ids_by_model.items():
+                    self._write_tombstones(writer, model_name, np.concatenate(id_chunks), parent_ids, result)
+            segments.append(dict(writer.close(), model=False, record_count=0))
             
-            os.remove(file_path)
-            file_path = compressed_path
-            filename += '.gz'
+            backup_data.update(result)
+            backup_file = self._write_segment_archive(base_path + '.tar', backup_data, segments)
+        finally:
+            shutil.rmtree(segment_dir, ignore_errors=True)
         
-        # Encrypt if enabled
-        if self.encrypt_backups and self.encryption_key:
-            encrypted_path = file_path + '.enc'
-            self._encrypt_file(file_path, encrypted_path, self.encryption_key)
-            os.remove(file_path)
-            file_path = encrypted_path
-            filename += '.enc'
+        backup_file.update({
+            'compression': compression,
+            'encrypted': bool(encryption_key),
+            'format': 'segments'
+        })
         
-        # Calculate hash
-        file_hash = self._calculate_file_hash(file_path)
+        return backup_file, backup_data
+
+    def _write_segment_archive(self, tar_path, backup_data, segments):
+        """Stream the segments and their manifest into one tar, hashing (and uploading) it on the way"""
+        manifest = {key: value for key, value in backup_data.items() if key not in ('id_snapshots', 'blob_checksums')}
+        manifest['segments'] = []
+        original_size = 0
         
-        final_size = os.path.getsize(file_path)
-        compression_ratio = original_size / final_size if final_size > 0 else 1.0
+        # Storage receives the archive part by part while it is written
+        upload = self._open_streaming_upload(os.path.basename(tar_path), tar_path)
+        try:
+            with open(tar_path, 'wb') as f:
+                sink = _HashingSink(f, tee=upload)
+                with tarfile.open(fileobj=sink, mode='w|') as tar:
+                    for segment in segments:
+                        name = os.path.basename(segment['path'])
+                        tar.add(segment['path'], arcname=name)
+                        os.remove(segment['path'])
+                        original_size += segment['original_size']
+                        manifest['segments'].append({
+                            'name': name,
+                            'model': segment['model'],
+                            'record_count': segment['record_count'],
+                            'hash': segment['hash'],
+                            'size': segment['final_size']
+                        })
+                    
+                    # Manifest last: it's only complete once every segment is in
+                    data = json.dumps(manifest, default=str).encode()
+                    info = tarfile.TarInfo('manifest.json')
+                    info.size = len(data)
+                    tar.addfile(info, io.BytesIO(data))
+        except Exception:
+            if upload:
+                upload.abort()
+            raise
         
         return {
-            'path': file_path,
-            'filename': filename,
-            'hash': file_hash,
+            'path': tar_path,
+            'filename': os.path.basename(tar_path),
+            'upload': upload.close() if upload else None,
+            'hash': sink.sha256.hexdigest(),
             'original_size': original_size,
-            'final_size': final_size,
-            'compression_ratio': compression_ratio
+            'final_size': sink.size,
+            'compression_ratio': original_size / sink.size if sink.size > 0 else 1.0
         }
 
-    def _encrypt_file(self, input_path, output_path, key):
-        """Encrypt backup file"""
-        try:
-            from cryptography.fernet import Fernet
-            import base64
-            
-            # Create Fernet key from our key
-            key_bytes = key.encode()[:32].ljust(32, b'0')
-            fernet_key = base64.urlsafe_b64encode(key_bytes)
-            fernet = Fernet(fernet_key)
-            
-            with open(input_path, 'rb') as f_in:
-                data = f_in.read()
-            
-            encrypted_data = fernet.encrypt(data)
-            
-            with open(output_path, 'wb') as f_out:
-                f_out.write(encrypted_data)
-                
-        except Exception as e:
-            _logger.error(f"Encryption failed: {str(e)}")
-            # If encryption fails, just copy the file
-            shutil.copy2(input_path, output_path)
-
     def _calculate_file_hash(self, file_path):
         """Calculate SHA256 hash of backup file"""
         sha256_hash = hashlib.sha256()
@@ -500,9 +850,70 @@ class DatasniffrBackupManager(models.Model):
                 sha256_hash.update(chunk)
         return sha256_hash.hexdigest()
 
+    def _get_s3_client(self):
+        """S3 client for the configured bucket (or S3-compatible endpoint)"""
+        return boto3.client(
+            's3',
+            aws_access_key_id=self.aws_access_key,
+            aws_secret_access_key=self.aws_secret_key,
+            region_name=self.aws_region,
+            endpoint_url=self.aws_endpoint_url or None
+        )
+
+    def _get_gcs_client(self):
+        """Google Cloud Storage client from the service account"""
+        return gcs.Client.from_service_account_info(json.loads(self.gcp_credentials))
+
+    def _connect_ftp(self):
+        """Logged-in FTP connection"""
+        ftp = ftplib.FTP()
+        ftp.connect(self.ftp_host, self.ftp_port)
+        ftp.login(self.ftp_username, self.ftp_password)
+        return ftp
+
+    def _connect_sftp(self):
+        """(transport, sftp client) pair"""
+        transport = paramiko.Transport((self.ftp_host, self.ftp_port))
+        transport.connect(username=self.ftp_username, password=self.ftp_password)
+        return transport, paramiko.SFTPClient.from_transport(transport)
+
+    def _get_backup_dir(self):
+        """Where backup files are produced: straight into local storage, else a temp dir"""
+        backup_dir = self.local_path if self.storage_type == 'local' else '/tmp/datasniffr_backups'
+        os.makedirs(backup_dir, exist_ok=True)
+        return backup_dir
+
+    def _open_streaming_upload(self, filename, local_path, state=None):
+        """Upload that streams the backup to storage while it is produced, None for local storage"""
+        if self.storage_type == 'ftp':
+            remote_path = f"{self.ftp_path.rstrip('/')}/{filename}"
+            location = f'{self.ftp_host}:{self.ftp_path}/{filename}'
+            if self.use_sftp:
+                uploader = SftpUploader(self._connect_sftp, remote_path, location)
+            else:
+                uploader = FtpUploader(self._connect_ftp, remote_path, location)
+        elif self.storage_type == 'aws_s3':
+            uploader = S3MultipartUploader(self._get_s3_client(), self.aws_bucket, f"datasniffr_backups/{filename}")
+        elif self.storage_type == 'google_cloud':
+            client = self._get_gcs_client()
+            uploader = GcsResumableUploader(client, client.bucket(self.gcp_bucket), f"datasniffr_backups/{filename}")
+        else:
+            return None
+        
+        state = dict(state or {}, filename=filename, local_path=local_path, storage_type=self.storage_type)
+        return StreamingUpload(
+            uploader, state,
+            part_size=max(5, self.upload_part_size or 8) * 1024 * 1024,
+            retries=max(0, self.upload_retries),
+            bytes_per_second=max(0, self.upload_bandwidth_limit or 0) * 1024
+        )
+
     def _upload_backup(self, backup_file):
         """Upload backup to configured storage"""
-        if self.storage_type == 'local':
+        if backup_file.get('upload'):
+            # Already streamed to storage while the backup was produced
+            return backup_file['upload']
+        elif self.storage_type == 'local':
             return self._upload_to_local(backup_file)
         elif self.storage_type == 'ftp':
             return self._upload_to_ftp(backup_file)
@@ -517,7 +928,9 @@ class DatasniffrBackupManager(models.Model):
         """Upload backup to local storage"""
         os.makedirs(self.local_path, exist_ok=True)
         destination = os.path.join(self.local_path, backup_file['filename'])
-        shutil.copy2(backup_file['path'], destination)
+        # Backups for local storage are produced in place
+        if os.path.abspath(backup_file['path']) != os.path.abspath(destination):
+            shutil.copy2(backup_file['path'], destination)
         return {'location': destination, 'success': True}
 
     def _upload_to_ftp(self, backup_file):
@@ -555,12 +968,7 @@ class DatasniffrBackupManager(models.Model):
     def _upload_to_s3(self, backup_file):
         """Upload backup to Amazon S3"""
         try:
-            s3_client = boto3.client(
-                's3',
-                aws_access_key_id=self.aws_access_key,
-                aws_secret_access_key=self.aws_secret_key,
-                region_name=self.aws_region
-            )
+            s3_client = self._get_s3_client()
             
             s3_key = f"datasniffr_backups/{backup_file['filename']}"
             s3_client.upload_file(backup_file['path'], self.aws_bucket, s3_key)
@@ -574,8 +982,7 @@ class DatasniffrBackupManager(models.Model):
     def _upload_to_gcs(self, backup_file):
         """Upload backup to Google Cloud Storage"""
         try:
-            credentials_dict = json.loads(self.gcp_credentials)
-            client = gcs.Client.from_service_account_info(credentials_dict)
+            client = self._get_gcs_client()
             bucket = client.bucket(self.gcp_bucket)
             
             blob_name = f"datasniffr_backups/{backup_file['filename']}"
@@ -589,6 +996,39 @@ class DatasniffrBackupManager(models.Model):
             _logger.error(f"GCS upload failed: {str(e)}")
             return {'location': '', 'success': False, 'error': str(e)}
 
+    def _download_backup(self, backup_history, destination):
+        """Fetch a stored backup file back to a local path"""
+        filename = json.loads(backup_history.metadata or '{}').get('filename') or os.path.basename(backup_history.storage_location)
+        
+        if self.storage_type == 'local':
+            shutil.copy2(backup_history.storage_location, destination)
+        elif self.storage_type == 'ftp':
+            if self.use_sftp:
+                transport = paramiko.Transport((self.ftp_host, self.ftp_port))
+                transport.connect(username=self.ftp_username, password=self.ftp_password)
+                sftp = paramiko.SFTPClient.from_transport(transport)
+                sftp.get(os.path.join(self.ftp_path, filename), destination)
+                sftp.close()
+                transport.close()
+            else:
+                ftp = ftplib.FTP()
+                ftp.connect(self.ftp_host, self.ftp_port)
+                ftp.login(self.ftp_username, self.ftp_password)
+                ftp.cwd(self.ftp_path)
+                with open(destination, 'wb') as f:
+                    ftp.retrbinary(f'RETR {filename}', f.write)
+                ftp.quit()
+        elif self.storage_type == 'aws_s3':
+            s3_client = self._get_s3_client()
+            s3_client.download_file(self.aws_bucket, f"datasniffr_backups/{filename}", destination)
+        elif self.storage_type == 'google_cloud':
+            client = self._get_gcs_client()
+            client.bucket(self.gcp_bucket).blob(f"datasniffr_backups/{filename}").download_to_filename(destination)
+        else:
+            raise UserError(f"Restoring from {self.storage_type} storage is not supported")
+        
+        return destination
+
     def _verify_backup(self, backup_file):
         """Verify backup integrity"""
         try:
@@ -664,6 +1104,14 @@ class DatasniffrBackupManager(models.Model):
                     excess_backups = all_backups[self.max_backups:]
                     old_backups |= excess_backups
             
+            # Never drop a backup a kept incremental/differential backup builds on
+            needed = self.env['datasniffr.backup.history']
+            parents = (self.backup_history - old_backups).mapped('parent_backup_id')
+            while parents - needed:
+                needed |= parents
+                parents = parents.mapped('parent_backup_id')
+            old_backups -= needed
+            
             # Delete old backup files and records
             for backup in old_backups:
                 try:
@@ -673,6 +1121,9 @@ class DatasniffrBackupManager(models.Model):
                     backup.unlink()
                 except Exception as e:
                     _logger.warning(f"Failed to cleanup backup {backup.id}: {str(e)}")
+            
+            # Attachment blobs only the deleted backups referenced
+            self.env['datasniffr.backup.blob']._collect_garbage(self)
                     
         except Exception as e:
             _logger.error(f"Backup cleanup failed: {str(e)}")
@@ -806,10 +1257,315 @@ class DatasniffrBackupHistory(models.Model):
     
     metadata = fields.Text('Metadata', help='JSON metadata about the backup')
     error_message = fields.Text('Error Message')
+    upload_state = fields.Text('Upload State', help='JSON resume state of an interrupted upload')
+    
+    # Backup chain
+    backup_until = fields.Datetime('Changes Captured Until', help='Next incremental backup captures changes written from this point on')
+    parent_backup_id = fields.Many2one('datasniffr.backup.history', string='Parent Backup', ondelete='set null',
+                                       help='Backup this incremental/differential backup builds on')
+    chain_manifest = fields.Text('Chain Manifest', help='JSON list of the backups to replay, base first')
+    model_state_ids = fields.One2many('datasniffr.backup.model.state', 'backup_history_id', string='Model Id Snapshots')
+    
+    def action_resume_upload(self):
+        """Finish an interrupted upload from its local file, skipping the parts already stored"""
+        self.ensure_one()
+        state = json.loads(self.upload_state or '{}')
+        local_path = state.get('local_path')
+        if not local_path or not os.path.exists(local_path):
+            raise UserError("The local file of this backup is gone, its upload can't be resumed")
+        
+        manager = self.backup_manager_id
+        if manager._calculate_file_hash(local_path) != self.backup_hash:
+            raise UserError("The local file of this backup changed, its upload can't be resumed")
+        
+        upload = manager._open_streaming_upload(state['filename'], local_path, state)
+        upload.send_file(local_path)
+        result = upload.close()
+        
+        if not result['success']:
+            self.write({'upload_state': json.dumps(result['upload_state']), 'error_message': result['error']})
+            return {
+                'type': 'ir.actions.client',
+                'tag': 'display_notification',
+                'params': {
+                    'message': f'❌ Upload still failing: {result["error"]}',
+                    'type': 'warning',
+                    'sticky': True,
+                }
+            }
+        
+        self.write({
+            'status': 'success',
+            'storage_location': result['location'],
+            'upload_state': False,
+            'error_message': False
+        })
+        self._record_chain_manifest()
+        manager.write({
+            'successful_backups': manager.successful_backups + 1,
+            'failed_backups': max(0, manager.failed_backups - 1)
+        })
+        os.remove(local_path)
+        
+        return {
+            'type': 'ir.actions.client',
+            'tag': 'display_notification',
+            'params': {
+                'message': f'🎯 Upload resumed and completed: {result["location"]}',
+                'type': 'success',
+                'sticky': False,
+            }
+        }
+
+    def _get_chain(self):
+        """Backups to replay for this one, base full backup first"""
+        self.ensure_one()
+        chain = self
+        while chain[0].parent_backup_id:
+            chain = chain[0].parent_backup_id | chain
+        return chain
+
+    def _record_chain_manifest(self):
+        """Store the chain manifest of the backup"""
+        for record in self:
+            record.chain_manifest = json.dumps([{
+                'backup_history_id': backup.id,
+                'backup_type': backup.backup_type,
+                'backup_until': fields.Datetime.to_string(backup.backup_until),
+                'storage_location': backup.storage_location,
+                'backup_hash': backup.backup_hash
+            } for backup in record._get_chain()])
+
+    def _get_id_snapshots(self):
+        """Record ids per model at the time of the backup"""
+        self.ensure_one()
+        return {state.model: state._get_ids() for state in self.model_state_ids}
+
+    def action_restore_chain(self):
+        """Restore the database to this backup by replaying its base and deltas"""
+        self.ensure_one()
+        manager = self.backup_manager_id
+        chain_ids = [entry['backup_history_id'] for entry in json.loads(self.chain_manifest or '[]')] or self._get_chain().ids
+        chain = self.browse(chain_ids)
+        
+        if chain[0].backup_type != 'full' or chain[0].status != 'success':
+            raise UserError("The backup chain does not start with a successful full backup")
+        
+        temp_dir = '/tmp/datasniffr_backups'
+        os.makedirs(temp_dir, exist_ok=True)
+        stats = {'records_restored': 0, 'records_deleted': 0, 'failed_batches': 0}
+        touched_tables = set()
+        blob_store = manager._open_blob_store()
+        
+        for backup in chain:
+            info = json.loads(backup.metadata or '{}')
+            file_path = os.path.join(temp_dir, f"restore_{backup.id}_{info.get('filename', 'backup')}")
+            
+            try:
+                manager._download_backup(backup, file_path)
+                if backup.backup_hash and manager._calculate_file_hash(file_path) != backup.backup_hash:
+                    raise UserError(f"Backup {backup.display_name} is corrupted (hash mismatch)")
+                
+                encryption_key = manager.encryption_key if info.get('encrypted') else None
+                backup._replay_documents(
+                    backup._iter_backup_documents(file_path, info, encryption_key), stats, touched_tables, blob_store
+                )
+            finally:
+                if os.path.exists(file_path):
+                    os.remove(file_path)
+        
+        blob_store.close()
+        
+        # Restored rows keep their ids, so sequences must move past them
+        for table in touched_tables:
+            self.env.cr.execute(
+                sql.SQL("SELECT setval(pg_get_serial_sequence(%s, 'id'), (SELECT coalesce(max(id), 1) FROM {}))").format(sql.Identifier(table)),
+                (table,)
+            )
+        self.invalidate_cache()
+        
+        return {
+            'type': 'ir.actions.client',
+            'tag': 'display_notification',
+            'params': {
+                'message': f'🎯 Restored {stats["records_restored"]} records from {len(chain)} backups ({stats["records_deleted"]} deleted, {stats["failed_batches"]} failed batches)',
+                'type': 'success' if not stats['failed_batches'] else 'warning',
+                'sticky': bool(stats['failed_batches']),
+            }
+        }
+
+    def _iter_backup_documents(self, file_path, info, encryption_key=None):
+        """Documents of a backup file, single stream or segment archive"""
+        compression = info.get('compression', 'gzip')
+        
+        if info.get('format') == 'segments':
+            with tarfile.open(file_path, 'r:') as tar:
+                manifest = json.load(tar.extractfile('manifest.json'))
+                for segment in manifest['segments']:
+                    with BackupStreamReader(tar.extractfile(segment['name']), compression, encryption_key) as reader:
+                        yield from reader
+        else:
+            with BackupStreamReader(file_path, compression, encryption_key) as reader:
+                yield from reader
+
+    def _replay_documents(self, documents, stats, touched_tables, blob_store=None):
+        """Apply the records and tombstones of one backup, batch by batch"""
+        chunk_size = max(1, self.backup_manager_id.backup_chunk_size or 1000)
+        pending = {}
+        
+        for document in documents:
+            if document['type'] in ('record', 'attachment'):
+                model_name = document.get('model', 'ir.attachment')
+                if document['type'] == 'attachment':
+                    document['values'].setdefault('type', 'binary')
+                batch = pending.setdefault(model_name, [])
+                batch.append(document['values'])
+                if len(batch) >= chunk_size:
+                    self._restore_batch(model_name, pending.pop(model_name), stats, touched_tables, blob_store)
+            elif document['type'] == 'tombstone':
+                # Changes queued before the deletion must land first
+                if document['model'] in pending:
+                    self._restore_batch(document['model'], pending.pop(document['model']), stats, touched_tables, blob_store)
+                self._delete_batch(document['model'], document['ids'], stats)
+        
+        for model_name, batch in pending.items():
+            self._restore_batch(model_name, batch, stats, touched_tables, blob_store)
+
+    def _restore_batch(self, model_name, batch, stats, touched_tables, blob_store=None):
+        """Upsert a batch of backed-up records by id, stored columns only"""
+        if model_name not in self.env:
+            return
+        
+        model = self.env[model_name]
+        columns = [name for name, field in model._fields.items() if field.store and field.column_type]
+        m2m_fields = [field for field in model._fields.values() if field.store and field.type == 'many2many']
+        
+        datas = [(values['id'], values['datas']) for values in batch if model_name == 'ir.attachment' and values.get('datas')]
+        
+        try:
+            with self.env.cr.savepoint():
+                # Attachment contents come back from the blob store first
+                for values in batch:
+                    if values.get('blob') and blob_store:
+                        values.update(self._restore_blob(blob_store, values.pop('blob')))
+                
+                # Rows with the same backed-up columns go in one statement
+                groups = {}
+                for values in batch:
+                    if values.get('id'):
+                        names = tuple(name for name in columns if name in values)
+                        groups.setdefault(names, []).append(values)
+                
+                for names, rows in groups.items():
+                    query = sql.SQL("""
+                        INSERT INTO {table} ({columns}) VALUES %s
+                        ON CONFLICT (id) DO UPDATE SET {updates}
+                    """).format(
+                        table=sql.Identifier(model._table),
+                        columns=sql.SQL(', ').join(map(sql.Identifier, names)),
+                        updates=sql.SQL(', ').join(
+                            sql.SQL('{0} = EXCLUDED.{0}').format(sql.Identifier(name)) for name in names if name != 'id'
+                        ) if len(names) > 1 else sql.SQL('id = EXCLUDED.id')
+                    )
+                    execute_values(
+                        self.env.cr, query.as_string(self.env.cr._obj),
+                        [[self._restore_value(model._fields[name], values[name]) for name in names] for values in rows],
+                        page_size=len(rows)
+                    )
+                
+                for field in m2m_fields:
+                    rows = [values for values in batch if values.get('id') and field.name in values]
+                    if not rows:
+                        continue
+                    self.env.cr.execute(
+                        sql.SQL('DELETE FROM {} WHERE {} = ANY(%s)').format(
+                            sql.Identifier(field.relation), sql.Identifier(field.column1)
+                        ),
+                        ([values['id'] for values in rows],)
+                    )
+                    pairs = [(values['id'], target_id) for values in rows for target_id in values[field.name] or []]
+                    if pairs:
+                        execute_values(self.env.cr, sql.SQL('INSERT INTO {} ({}, {}) VALUES %s ON CONFLICT DO NOTHING').format(
+                            sql.Identifier(field.relation), sql.Identifier(field.column1), sql.Identifier(field.column2)
+                        ).as_string(self.env.cr._obj), pairs)
+                
+                # Attachment content goes back through the filestore
+                for attachment_id, data in datas:
+                    model.browse(attachment_id).write({'datas': data})
+            
+            stats['records_restored'] += len(batch)
+            touched_tables.add(model._table)
+            
+        except Exception as e:
+            stats['failed_batches'] += 1
+            _logger.error(f"Failed to restore {len(batch)} {model_name} records: {str(e)}")
+
+    def _restore_blob(self, blob_store, checksum):
+        """Put a blob back into the filestore (or the database), returns the attachment columns to set"""
+        Attachment = self.env['ir.attachment']
+        
+        if Attachment._storage() != 'file':
+            buffer = io.BytesIO()
+            blob_store.get(checksum, buffer)
+            return {'db_datas': buffer.getvalue(), 'store_fname': None}
+        
+        fname, full_path = Attachment._get_path(b'', checksum)
+        if not os.path.exists(full_path):
+            # Streamed to disk, never loaded in memory as a whole
+            with open(full_path + '.part', 'wb') as f:
+                blob_store.get(checksum, f)
+            os.replace(full_path + '.part', full_path)
+        
+        return {'store_fname': fname, 'db_datas': None}
+
+    def _restore_value(self, field, value):
+        """Backed-up JSON value as a column value"""
+        if value is False and field.type != 'boolean':
+            return None
+        if isinstance(value, dict) and '$bytea' in value:
+            return base64.b64decode(value['$bytea'])
+        if isinstance(value, (dict, list)):
+            return json.dumps(value)
+        return value
+
+    def _delete_batch(self, model_name, ids, stats):
+        """Drop the records a tombstone lists"""
+        if model_name not in self.env or not ids:
+            return
+        
+        model = self.env[model_name]
+        try:
+            with self.env.cr.savepoint():
+                self.env.cr.execute(
+                    sql.SQL('DELETE FROM {} WHERE id = ANY(%s)').format(sql.Identifier(model._table)),
+                    (list(ids),)
+                )
+                stats['records_deleted'] += self.env.cr.rowcount
+        except Exception as e:
+            stats['failed_batches'] += 1
+            _logger.error(f"Failed to delete {len(ids)} {model_name} records: {str(e)}")
     
     def name_get(self):
         result = []
         for record in self:
             name = f"{record.backup_manager_id.name} - {record.backup_date.strftime('%Y-%m-%d %H:%M')} ({record.backup_size_gb:.2f}GB)"
             result.append((record.id, name))
-        return result
\ No newline at end of file
+        return result
+
+
+class DatasniffrBackupModelState(models.Model):
+    _name = 'datasniffr.backup.model.state'
+    _description = 'Backup Model Id Snapshot'
+
+    backup_history_id = fields.Many2one('datasniffr.backup.history', string='Backup', required=True, ondelete='cascade', index=True)
+    model = fields.Char('Model', required=True)
+    record_count = fields.Integer('Records')
+    # Sorted, delta-encoded int64 ids, zlib-compressed
+    record_ids_blob = fields.Binary('Record IDs', attachment=False)
+
+    def _get_ids(self):
+        """Sorted record ids of the snapshot"""
+        self.ensure_one()
+        self.env.cr.execute("SELECT record_ids_blob FROM datasniffr_backup_model_state WHERE id = %s", (self.id,))
+        blob = self.env.cr.fetchone()[0]
+        return _unpack_ids(base64.b64decode(bytes(blob))) if blob else np.array([], dtype=np.int64)
@@ -0,0 +1,226 @@
+# -*- coding: utf-8 -*-
+"""Streaming writer for DataSniffR backup files.
+
+A backup is written as NDJSON (one JSON document per line) and piped
+through the compressor, the optional Fernet encryptor and a SHA-256
+hasher into the output file in a single pass. Only one frame of output
+is ever buffered, so memory stays bounded by the reader's chunk size.
+
+Encrypted files are a sequence of Fernet tokens, one per line, each
+holding up to ``FRAME_SIZE`` bytes of compressed stream.
+
+``BackupStreamReader`` undoes the same pipeline to replay a backup.
+"""
+
+import base64
+import gzip
+import hashlib
+import io
+import json
+
+# Compressed bytes encrypted per Fernet token
+FRAME_SIZE = 1024 * 1024
+
+COMPRESSION_EXTENSIONS = {
+    'gzip': '.gz',
+    'zstd': '.zst',
+    'none': '',
+}
+
+
+def _json_default(value):
+    """JSON fallback: raw bytea as ``{"$bytea": base64}``, everything else as text"""
+    if isinstance(value, (bytes, memoryview)):
+        return {'$bytea': base64.b64encode(bytes(value)).decode()}
+    return str(value)
+
+
+def fernet_for_key(key):
+    """Fernet instance for a backup manager encryption key"""
+    from cryptography.fernet import Fernet
+
+    key_bytes = key.encode()[:32].ljust(32, b'0')
+    return Fernet(base64.urlsafe_b64encode(key_bytes))
+
+
+class _HashingSink:
+    """Final stage: hashes and counts every byte before writing it
+
+    ``tee`` (e.g. a streaming upload) receives the same bytes as the file.
+    """
+
+    def __init__(self, fileobj, tee=None):
+        self.fileobj = fileobj
+        self.tee = tee
+        self.sha256 = hashlib.sha256()
+        self.size = 0
+
+    def write(self, data):
+        self.sha256.update(data)
+        self.size += len(data)
+        self.fileobj.write(data)
+        if self.tee is not None:
+            self.tee.write(data)
+        return len(data)
+
+    def flush(self):
+        self.fileobj.flush()
+
+    def close(self):
+        self.flush()
+
+
+class _FernetFrameWriter:
+    """Encrypts the stream frame by frame, one token per line"""
+
+    def __init__(self, target, key, frame_size=FRAME_SIZE):
+        self.target = target
+        self.fernet = fernet_for_key(key)
+        self.frame_size = frame_size
+        self.buffer = bytearray()
+
+    def write(self, data):
+        self.buffer += data
+        while len(self.buffer) >= self.frame_size:
+            self._emit(bytes(self.buffer[:self.frame_size]))
+            del self.buffer[:self.frame_size]
+        return len(data)
+
+    def _emit(self, frame):
+        self.target.write(self.fernet.encrypt(frame) + b'\n')
+
+    def flush(self):
+        self.target.flush()
+
+    def close(self):
+        if self.buffer:
+            self._emit(bytes(self.buffer))
+            self.buffer.clear()
+        self.target.close()
+
+
+class BackupStreamWriter:
+    """NDJSON -> compressor -> encryptor -> SHA-256 -> file, in one pass"""
+
+    def __init__(self, path, compression='gzip', encryption_key=None, tee=None):
+        self.path = path
+        self.file = open(path, 'wb')
+        self.sink = _HashingSink(self.file, tee)
+
+        target = self.sink
+        if encryption_key:
+            target = _FernetFrameWriter(target, encryption_key)
+        self.encryptor = target
+
+        if compression == 'gzip':
+            self.stream = gzip.GzipFile(fileobj=target, mode='wb', mtime=0)
+        elif compression == 'zstd':
+            import zstandard
+            self.stream = zstandard.ZstdCompressor().stream_writer(target, closefd=False)
+        else:
+            self.stream = target
+
+        self.original_size = 0
+        self.line_count = 0
+        self.closed = False
+
+    def write_line(self, document):
+        """Serialize one document as an NDJSON line"""
+        data = json.dumps(document, default=_json_default, separators=(',', ':')).encode() + b'\n'
+        self.stream.write(data)
+        self.original_size += len(data)
+        self.line_count += 1
+
+    def close(self):
+        """Flush every stage and return the file summary"""
+        if not self.closed:
+            if self.stream is not self.encryptor:
+                self.stream.close()
+            self.encryptor.close()
+            self.file.close()
+            self.closed = True
+
+        final_size = self.sink.size
+        return {
+            'path': self.path,
+            'hash': self.sink.sha256.hexdigest(),
+            'original_size': self.original_size,
+            'final_size': final_size,
+            'compression_ratio': self.original_size / final_size if final_size > 0 else 1.0,
+        }
+
+    def abort(self):
+        """Close the file without caring about the stream state"""
+        if not self.closed:
+            self.file.close()
+            self.closed = True
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, traceback):
+        if exc_type:
+            self.abort()
+        else:
+            self.close()
+
+
+class _FernetFrameReader(io.RawIOBase):
+    """Decrypts a framed file token by token, exposed as a byte stream"""
+
+    def __init__(self, fileobj, key):
+        self.fileobj = fileobj
+        self.fernet = fernet_for_key(key)
+        self.buffer = b''
+
+    def readable(self):
+        return True
+
+    def readinto(self, target):
+        while not self.buffer:
+            token = self.fileobj.readline()
+            if not token:
+                return 0
+            token = token.strip()
+            if token:
+                self.buffer = self.fernet.decrypt(token)
+        size = min(len(target), len(self.buffer))
+        target[:size] = self.buffer[:size]
+        self.buffer = self.buffer[size:]
+        return size
+
+
+class BackupStreamReader:
+    """file -> decryptor -> decompressor -> NDJSON documents"""
+
+    def __init__(self, source, compression='gzip', encryption_key=None):
+        # A path, or an already open binary file (e.g. a tar member)
+        self.owns_file = isinstance(source, str)
+        self.file = open(source, 'rb') if self.owns_file else source
+
+        raw = self.file
+        if encryption_key:
+            raw = io.BufferedReader(_FernetFrameReader(raw, encryption_key), FRAME_SIZE)
+
+        if compression == 'gzip':
+            self.stream = gzip.GzipFile(fileobj=raw, mode='rb')
+        elif compression == 'zstd':
+            import zstandard
+            self.stream = io.BufferedReader(zstandard.ZstdDecompressor().stream_reader(raw), FRAME_SIZE)
+        else:
+            self.stream = raw
+
+    def __iter__(self):
+        for line in self.stream:
+            if line.strip():
+                yield json.loads(line)
+
+    def close(self):
+        if self.owns_file:
+            self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, traceback):
+        self.close()
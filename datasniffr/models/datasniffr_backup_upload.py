@@ -0,0 +1,342 @@
+# -*- coding: utf-8 -*-
+"""Streaming, resumable uploads for DataSniffR backups.
+
+``StreamingUpload`` sits at the end of the backup stream: the bytes written
+to the backup file are cut into fixed-size parts and uploaded by a
+background thread while the backup is still being produced. Part ``n``
+always covers bytes ``n * part_size`` to ``(n + 1) * part_size``, so an
+interrupted upload resumes from its saved state by re-reading the local
+file and skipping the parts already stored.
+
+Backends: S3 multipart uploads (any S3-compatible endpoint), GCS
+resumable sessions, and positional writes over FTP (REST + STOR) or SFTP.
+"""
+
+import io
+import logging
+import queue
+import threading
+import time
+
+_logger = logging.getLogger(__name__)
+
+# S3 needs parts of at least 5MB (but the last), GCS multiples of 256KB
+PART_SIZE = 8 * 1024 * 1024
+
+# Parts waiting for the upload thread before the backup stream blocks
+QUEUE_PARTS = 4
+
+MAX_RETRY_DELAY = 60
+
+
+def with_retries(action, retries, description):
+    """Run ``action``, retrying with exponential backoff on any error"""
+    for attempt in range(retries + 1):
+        try:
+            return action()
+        except Exception as e:
+            if attempt >= retries:
+                raise
+            delay = min(2 ** attempt, MAX_RETRY_DELAY)
+            _logger.warning(f"{description} failed ({str(e)}), retry {attempt + 1}/{retries} in {delay}s")
+            time.sleep(delay)
+
+
+class Throttle:
+    """Keeps the average upload rate under ``bytes_per_second`` (0 = unlimited)"""
+
+    def __init__(self, bytes_per_second=0):
+        self.rate = bytes_per_second
+        self.start = time.monotonic()
+        self.sent = 0
+
+    def wait(self, size):
+        if not self.rate:
+            return
+        self.sent += size
+        delay = self.start + self.sent / self.rate - time.monotonic()
+        if delay > 0:
+            time.sleep(delay)
+
+
+class S3MultipartUploader:
+    """S3 multipart upload; parts are independent, so any missing part can be resent"""
+
+    def __init__(self, client, bucket, key):
+        self.client = client
+        self.bucket = bucket
+        self.key = key
+
+    def begin(self, state):
+        if state.get('upload_id'):
+            # Trust the server about what it already has
+            parts = {}
+            paginator = self.client.get_paginator('list_parts')
+            for page in paginator.paginate(Bucket=self.bucket, Key=self.key, UploadId=state['upload_id']):
+                for part in page.get('Parts', []):
+                    parts[str(part['PartNumber'] - 1)] = part['ETag']
+            state['parts'] = parts
+        else:
+            response = self.client.create_multipart_upload(Bucket=self.bucket, Key=self.key)
+            state['upload_id'] = response['UploadId']
+            state['parts'] = {}
+        return state
+
+    def put_part(self, state, number, offset, data, last):
+        if not data and number:
+            # Nothing left for a last part
+            return
+        response = self.client.upload_part(
+            Bucket=self.bucket, Key=self.key, UploadId=state['upload_id'], PartNumber=number + 1, Body=data
+        )
+        state['parts'][str(number)] = response['ETag']
+
+    def complete(self, state):
+        parts = sorted((int(number), etag) for number, etag in state['parts'].items())
+        self.client.complete_multipart_upload(
+            Bucket=self.bucket, Key=self.key, UploadId=state['upload_id'],
+            MultipartUpload={'Parts': [{'PartNumber': number + 1, 'ETag': etag} for number, etag in parts]}
+        )
+        return f's3://{self.bucket}/{self.key}'
+
+    def abort(self, state):
+        if state.get('upload_id'):
+            self.client.abort_multipart_upload(Bucket=self.bucket, Key=self.key, UploadId=state['upload_id'])
+
+
+class GcsResumableUploader:
+    """GCS resumable session; parts must arrive in order"""
+
+    def __init__(self, client, bucket, blob_name):
+        self.client = client
+        self.bucket = bucket
+        self.blob_name = blob_name
+
+    def begin(self, state):
+        if state.get('session_url'):
+            # Ask the session how far it got
+            response = self.client._http.put(state['session_url'], headers={'Content-Range': 'bytes */*'})
+            if response.status_code in (200, 201):
+                state['finished'] = True
+            elif response.status_code == 308:
+                received = response.headers.get('Range')
+                offset = int(received.split('-')[1]) + 1 if received else 0
+                state['parts'] = {str(number): True for number in range(offset // state['part_size'])}
+            else:
+                raise IOError(f"GCS upload session query failed: {response.status_code}")
+        else:
+            state['session_url'] = self.bucket.blob(self.blob_name).create_resumable_upload_session()
+            state['parts'] = {}
+        return state
+
+    def put_part(self, state, number, offset, data, last):
+        if state.get('finished'):
+            return
+        total = str(offset + len(data)) if last else '*'
+        content_range = f'bytes {offset}-{offset + len(data) - 1}/{total}' if data else f'bytes */{total}'
+        response = self.client._http.put(state['session_url'], data=data, headers={'Content-Range': content_range})
+        if response.status_code not in (200, 201, 308):
+            raise IOError(f"GCS upload failed: {response.status_code} {response.text}")
+        state['parts'][str(number)] = True
+
+    def complete(self, state):
+        return f'gs://{self.bucket.name}/{self.blob_name}'
+
+    def abort(self, state):
+        if state.get('session_url'):
+            self.client._http.delete(state['session_url'])
+
+
+class FtpUploader:
+    """Positional writes over FTP (REST + STOR), reconnecting after errors"""
+
+    def __init__(self, connect, path, location):
+        self.connect = connect
+        self.path = path
+        self.location = location
+        self.ftp = None
+
+    def begin(self, state):
+        state.setdefault('parts', {})
+        return state
+
+    def put_part(self, state, number, offset, data, last):
+        if not data and number:
+            return
+        try:
+            if not self.ftp:
+                self.ftp = self.connect()
+            self.ftp.storbinary(f'STOR {self.path}', io.BytesIO(data), rest=offset or None)
+        except Exception:
+            self._disconnect()
+            raise
+        state['parts'][str(number)] = True
+
+    def _disconnect(self):
+        if self.ftp:
+            try:
+                self.ftp.close()
+            except Exception:
+                pass
+            self.ftp = None
+
+    def complete(self, state):
+        if self.ftp:
+            self.ftp.quit()
+            self.ftp = None
+        return self.location
+
+    def abort(self, state):
+        self._disconnect()
+
+
+class SftpUploader(FtpUploader):
+    """Positional writes over SFTP, reconnecting after errors"""
+
+    def put_part(self, state, number, offset, data, last):
+        if not data and number:
+            return
+        try:
+            if not self.ftp:
+                self.ftp = self.connect()
+            transport, sftp = self.ftp
+            try:
+                sftp.stat(self.path)
+                mode = 'r+b'
+            except IOError:
+                mode = 'wb'
+            with sftp.open(self.path, mode) as remote:
+                remote.seek(offset)
+                remote.write(data)
+        except Exception:
+            self._disconnect()
+            raise
+        state['parts'][str(number)] = True
+
+    def _disconnect(self):
+        if self.ftp:
+            transport, sftp = self.ftp
+            try:
+                sftp.close()
+                transport.close()
+            except Exception:
+                pass
+            self.ftp = None
+
+    def complete(self, state):
+        self._disconnect()
+        return self.location
+
+
+class StreamingUpload:
+    """File-like sink uploading what is written to it part by part, in the background
+
+    ``state`` is JSON-able and is everything needed to resume: pass it back
+    with the same local file to ``send_file`` after a failure. When the
+    upload can't even start, writes are ignored and ``close`` reports the
+    failure, so the local file is still produced.
+    """
+
+    def __init__(self, uploader, state=None, part_size=PART_SIZE, retries=5, bytes_per_second=0):
+        self.uploader = uploader
+        self.state = dict(state or {})
+        self.state.setdefault('part_size', part_size)
+        self.part_size = self.state['part_size']
+        self.retries = retries
+        self.throttle = Throttle(bytes_per_second)
+
+        self.buffer = bytearray()
+        self.part_number = 0
+        self.queue = queue.Queue(QUEUE_PARTS)
+        self.error = None
+        self.closed = False
+
+        try:
+            self.state = with_retries(lambda: self.uploader.begin(self.state), self.retries, 'Starting upload')
+        except Exception as e:
+            # Storage unreachable or credentials refused: nothing to upload to
+            self.error = e
+            self.closed = True
+            _logger.error(f"Backup upload could not start: {str(e)}")
+            return
+
+        self.thread = threading.Thread(target=self._run, name='datasniffr-backup-upload', daemon=True)
+        self.thread.start()
+
+    def write(self, data):
+        if self.closed:
+            return len(data)
+        self.buffer += data
+        while len(self.buffer) >= self.part_size:
+            self._enqueue(bytes(self.buffer[:self.part_size]), False)
+            del self.buffer[:self.part_size]
+        return len(data)
+
+    def flush(self):
+        pass
+
+    def send_file(self, path):
+        """Feed a finished local file, e.g. to resume an interrupted upload"""
+        with open(path, 'rb') as f:
+            for chunk in iter(lambda: f.read(self.part_size), b""):
+                self.write(chunk)
+
+    def _enqueue(self, data, last):
+        number = self.part_number
+        self.part_number += 1
+        if str(number) in self.state['parts']:
+            # Already stored before a resume
+            return
+        # Blocks while QUEUE_PARTS parts are waiting, so memory stays bounded
+        self.queue.put((number, data, last))
+
+    def _run(self):
+        while True:
+            item = self.queue.get()
+            if item is None:
+                break
+            if self.error:
+                # Keep draining so the backup stream never blocks
+                continue
+
+            number, data, last = item
+            try:
+                self.throttle.wait(len(data))
+                with_retries(
+                    lambda: self.uploader.put_part(self.state, number, number * self.part_size, data, last),
+                    self.retries, f'Uploading part {number + 1}'
+                )
+            except Exception as e:
+                self.error = e
+                _logger.error(f"Backup upload failed at part {number + 1}: {str(e)}")
+
+    def close(self):
+        """Upload the last part, wait for the thread and complete the upload"""
+        if not self.closed:
+            self._enqueue(bytes(self.buffer), True)
+            self.buffer.clear()
+            self.queue.put(None)
+            self.thread.join()
+            self.closed = True
+
+        if self.error:
+            return {'success': False, 'location': '', 'error': str(self.error), 'upload_state': self.state}
+
+        try:
+            location = with_retries(lambda: self.uploader.complete(self.state), self.retries, 'Completing upload')
+        except Exception as e:
+            return {'success': False, 'location': '', 'error': str(e), 'upload_state': self.state}
+
+        return {'success': True, 'location': location, 'upload_state': self.state}
+
+    def abort(self):
+        """Stop and throw away what was uploaded so far"""
+        if not self.closed:
+            self.error = self.error or IOError('Upload aborted')
+            self.queue.put(None)
+            self.thread.join()
+            self.closed = True
+        try:
+            self.uploader.abort(self.state)
+        except Exception as e:
+            _logger.warning(f"Failed to abort backup upload: {str(e)}")
@@ -0,0 +1,402 @@
+#!/usr/bin/env python3
+"""
+DataSniffR Bulk Merger 🔀💾
+===========================
+
+Merge thousands of duplicate partners in one transaction!
+Every many2one pointing at the model is re-pointed with set-based SQL.
+
+Features:
+- 🔎 Foreign keys discovered from ir.model.fields (no hardcoded models)
+- ⚡ One UPDATE per referencing column per merge batch
+- 🔐 Rows that would break a unique index stay on the loser, one by one
+- 🗄️ Losers archived in a single statement
+- 📝 Compact undo log per batch
+- ⏪ One-call undo of a whole batch
+
+mmm lol 🐶💾 - Merge big, undo bigger! 🔀✨
+"""
+
+from odoo import models, fields, api
+import json
+import logging
+from datetime import datetime
+import psycopg2
+from psycopg2 import sql
+from psycopg2.extras import execute_values
+
+from .datasniffr_field_validator import QUALITY_RULES
+
+_logger = logging.getLogger(__name__)
+
+# Merges (loser -> master pairs) handled per batch / undo log entry
+MERGE_BATCH_SIZE = 1000
+
+# Referencing models that must keep pointing at the original record
+MERGE_EXCLUDED_MODELS = {
+    'datasniffr.match.key',
+    'datasniffr.duplicate.group.member',
+}
+
+# Master fields filled from a loser when the master has no value
+MERGE_FILL_FIELDS = ('email', 'phone')
+
+
+class DataSniffRMergeBatch(models.Model):
+    _name = 'datasniffr.merge.batch'
+    _description = 'DataSniffR Merge Batch - Bulk Merge With Undo Log 🔀'
+    _order = 'id desc'
+
+    name = fields.Char(string='Merge Batch', required=True)
+    hunter_id = fields.Many2one('datasniffr.duplicate.hunter', string='Duplicate Hunt', index=True, ondelete='set null')
+    model_name = fields.Char(string='Merged Model', required=True, default='res.partner')
+    state = fields.Selection([
+        ('done', 'Merged ✅'),
+        ('undone', 'Undone ⏪'),
+    ], string='State', default='done', required=True)
+    merge_count = fields.Integer(string='Records Merged', default=0)
+    references_moved = fields.Integer(string='References Re-pointed', default=0)
+    undo_log = fields.Text(string='Undo Log (JSON)')
+    executed_at = fields.Datetime(string='Executed At', default=fields.Datetime.now)
+
+    @api.model
+    def merge_records(self, merge_map, model_name='res.partner', hunter=None, batch_size=MERGE_BATCH_SIZE):
+        """🔀 Merge every ``loser_id -> master_id`` of ``merge_map``
+
+        Chains (a master that is itself merged away) are resolved to the
+        final master. Returns the merge batches created, one per
+        ``batch_size`` merges, all inside the current transaction.
+        """
+
+        merge_map = self._resolve_merge_chains(merge_map)
+        if not merge_map:
+            return self.browse()
+
+        references = self._get_many2one_references(model_name)
+        unique_keys = self._get_unique_keys(references)
+        losers = sorted(merge_map)
+        batches = self.browse()
+
+        # Pending ORM writes must hit the database before raw SQL moves rows
+        self.env['base'].flush()
+
+        for start in range(0, len(losers), batch_size):
+            batch_map = {loser: merge_map[loser] for loser in losers[start:start + batch_size]}
+            batches |= self._merge_batch(batch_map, model_name, references, unique_keys, hunter)
+
+        # Everything cached about the moved rows is stale now
+        self.env[model_name].invalidate_cache()
+
+        _logger.info(f"Bulk merge: {len(merge_map)} {model_name} records merged in {len(batches)} batches")
+
+        return batches
+
+    @api.model
+    def _resolve_merge_chains(self, merge_map):
+        """🪢 Point every loser at its final master, dropping self-merges"""
+
+        resolved = {}
+        for loser in merge_map:
+            master = merge_map[loser]
+            seen = {loser}
+            while master in merge_map and master not in seen:
+                seen.add(master)
+                master = merge_map[master]
+            if master != loser and master not in merge_map:
+                resolved[loser] = master
+
+        return resolved
+
+    @api.model
+    def _get_many2one_references(self, model_name):
+        """🔎 (model, table, column) of every stored many2one pointing at the model"""
+
+        referencing_fields = self.env['ir.model.fields'].sudo().search([
+            ('ttype', '=', 'many2one'),
+            ('relation', '=', model_name),
+            ('store', '=', True),
+            ('model', 'not in', list(MERGE_EXCLUDED_MODELS)),
+        ])
+
+        references = set()
+        for field in referencing_fields:
+            Model = self.env.get(field.model)
+            if Model is None or Model._abstract or Model._transient or not Model._auto:
+                continue
+            references.add((field.model, Model._table, field.name))
+
+        # Only columns that really exist (custom/inherited leftovers can lie)
+        self.env.cr.execute("""
+            SELECT table_name, column_name
+              FROM information_schema.columns
+             WHERE table_schema = current_schema()
+        """)
+        existing = set(self.env.cr.fetchall())
+
+        return sorted(reference for reference in references if reference[1:] in existing)
+
+    @api.model
+    def _get_unique_keys(self, references):
+        """🔐 ``{(table, column): [other columns of each unique index]}`` for the reference columns
+
+        Partial and expression indexes are left out; a conflict on those
+        still skips the whole column.
+        """
+
+        tables = tuple({table for _model, table, _column in references})
+        if not tables:
+            return {}
+
+        self.env.cr.execute("""
+            SELECT c.relname, array_agg(a.attname::text ORDER BY k.position)
+              FROM pg_index i
+              JOIN pg_class c ON c.oid = i.indrelid
+             CROSS JOIN LATERAL unnest(i.indkey::int2[]) WITH ORDINALITY AS k(attnum, position)
+              JOIN pg_attribute a ON a.attrelid = c.oid AND a.attnum = k.attnum
+             WHERE c.relname IN %s
+               AND c.relnamespace = current_schema()::regnamespace
+               AND i.indisunique AND NOT i.indisprimary
+               AND i.indpred IS NULL AND i.indexprs IS NULL
+             GROUP BY c.relname, i.indexrelid
+        """, (tables,))
+
+        unique_keys = {}
+        for table, columns in self.env.cr.fetchall():
+            for _model, ref_table, column in references:
+                if ref_table == table and column in columns:
+                    unique_keys.setdefault((table, column), []).append([name for name in columns if name != column])
+
+        return unique_keys
+
+    def _merge_batch(self, batch_map, model_name, references, unique_keys, hunter):
+        """⚡ Re-point, fill and archive one batch, logging how to undo it"""
+
+        cr = self.env.cr
+        table = self.env[model_name]._table
+        pairs = sorted(batch_map.items())
+        undo = {'references': {}, 'skipped': {}, 'filled': {}, 'archived': []}
+        moved = 0
+
+        for _model, ref_table, column in references:
+            keys = unique_keys.get((ref_table, column), [])
+            query = sql.SQL("""
+                WITH m(loser_id, master_id) AS (VALUES %s)
+                UPDATE {table} AS t
+                   SET {column} = m.master_id
+                  FROM m
+                 WHERE t.{column} = m.loser_id {guards}
+                RETURNING m.loser_id, t.id
+            """).format(
+                table=sql.Identifier(ref_table),
+                column=sql.Identifier(column),
+                guards=self._unique_guards(ref_table, column, keys)
+            )
+
+            try:
+                with cr.savepoint():
+                    rows = execute_values(cr, query.as_string(cr._obj), pairs, page_size=len(pairs), fetch=True)
+            except psycopg2.IntegrityError as e:
+                # Constraints the guards can't see - leave the whole column on the archived loser
+                _logger.warning(f"Bulk merge: {ref_table}.{column} not re-pointed: {e}")
+                rows = []
+
+            if rows:
+                undo['references'][f'{ref_table}.{column}'] = self._group_by_loser(rows)
+                moved += len(rows)
+
+            # Whatever still points at a loser would have broken a unique index
+            cr.execute(
+                sql.SQL("SELECT t.{column}, t.id FROM {table} AS t WHERE t.{column} IN %s").format(
+                    table=sql.Identifier(ref_table), column=sql.Identifier(column)).as_string(cr._obj),
+                (tuple(batch_map),)
+            )
+            skipped = cr.fetchall()
+            if skipped:
+                _logger.warning(f"Bulk merge: {len(skipped)} {ref_table}.{column} rows left on merged records")
+                undo['skipped'][f'{ref_table}.{column}'] = self._group_by_loser(skipped)
+
+        undo['filled'] = self._fill_master_fields(batch_map, table)
+
+        cr.execute(
+            sql.SQL("UPDATE {table} SET active = false WHERE id IN %s AND active RETURNING id").format(
+                table=sql.Identifier(table)).as_string(cr._obj),
+            (tuple(batch_map),)
+        )
+        undo['archived'] = sorted(row[0] for row in cr.fetchall())
+
+        self._sync_after_merge(model_name, references, undo, set(undo['archived']))
+        if model_name == 'res.partner':
+            self._refresh_match_keys(batch_map)
+
+        return self.create({
+            'name': f'Merge Batch - {datetime.now().strftime("%Y-%m-%d %H:%M:%S")}',
+            'hunter_id': hunter.id if hunter else False,
+            'model_name': model_name,
+            'merge_count': len(batch_map),
+            'references_moved': moved,
+            'undo_log': json.dumps({'merges': pairs, **undo}, separators=(',', ':')),
+        })
+
+    def _unique_guards(self, ref_table, column, keys):
+        """🔐 Conditions keeping rows that would duplicate a unique key on their loser
+
+        A row moves only if the master has no row with the same key yet, and
+        only the lowest id moves when several losers of one master share it.
+        """
+
+        guards = []
+        for others in keys:
+            same_key = sql.SQL('').join(
+                sql.SQL(' AND o.{name} = t.{name}').format(name=sql.Identifier(name)) for name in others
+            )
+            guards.append(sql.SQL("""
+                   AND NOT EXISTS (SELECT 1 FROM {table} AS o WHERE o.{column} = m.master_id{same_key})
+                   AND NOT EXISTS (SELECT 1 FROM {table} AS o JOIN m AS m2 ON o.{column} = m2.loser_id
+                                    WHERE m2.master_id = m.master_id AND o.id < t.id{same_key})""").format(
+                table=sql.Identifier(ref_table), column=sql.Identifier(column), same_key=same_key))
+
+        return sql.SQL('').join(guards)
+
+    @staticmethod
+    def _group_by_loser(rows):
+        """📝 ``[(loser_id, [row ids])]`` of ``(loser_id, row_id)`` rows, for the undo log"""
+
+        grouped = {}
+        for loser_id, row_id in rows:
+            grouped.setdefault(loser_id, []).append(row_id)
+        return sorted(grouped.items())
+
+    def _sync_after_merge(self, model_name, references, undo, was_active):
+        """🔄 Redo what ORM write hooks would have done for the raw UPDATEs of a batch
+
+        ``was_active`` is the set of archived/restored ids active before.
+        """
+
+        writer = self.env['datasniffr.fix.writer']
+        reference_models = {f'{table}.{column}': model for model, table, column in references}
+
+        # Stored computes over the re-pointed columns (e.g. commercial_partner_id)
+        for reference, moved_ids in undo.get('references', {}).items():
+            if reference not in reference_models:
+                continue
+            records = self.env[reference_models[reference]].browse(sorted(
+                {row_id for _loser_id, row_ids in moved_ids for row_id in row_ids}))
+            writer._sync_after_write(records, reference.split('.')[1])
+
+        Model = self.env[model_name]
+        for name in MERGE_FILL_FIELDS:
+            masters = Model.browse(sorted(int(master) for master, old in undo.get('filled', {}).items() if name in old))
+            if masters:
+                writer._sync_after_write(masters, name)
+
+        archived = Model.browse(undo.get('archived', []))
+        if archived:
+            archived.invalidate_cache(fnames=['active'], ids=archived.ids)
+            archived.modified(['active'])
+            self.env['base'].flush()
+            if model_name in QUALITY_RULES:
+                self.env['datasniffr.quality.counter']._track_records(archived, {'active'}, was_active)
+
+    def _fill_master_fields(self, batch_map, table):
+        """📇 Copy email/phone from a loser onto masters missing them
+
+        Returns ``{master_id: {field: old_value}}`` for the undo log.
+        """
+
+        cr = self.env.cr
+        ids = tuple(set(batch_map) | set(batch_map.values()))
+        columns = sql.SQL(', ').join(sql.Identifier(name) for name in MERGE_FILL_FIELDS)
+        cr.execute(
+            sql.SQL("SELECT id, {columns} FROM {table} WHERE id IN %s ORDER BY id").format(
+                columns=columns, table=sql.Identifier(table)).as_string(cr._obj),
+            (ids,)
+        )
+        values = {row[0]: dict(zip(MERGE_FILL_FIELDS, row[1:])) for row in cr.fetchall()}
+
+        updates = {}
+        for loser, master in sorted(batch_map.items()):
+            for name in MERGE_FILL_FIELDS:
+                if not values.get(master, {}).get(name) and values.get(loser, {}).get(name):
+                    updates.setdefault(master, {}).setdefault(name, values[loser][name])
+
+        filled = {}
+        for name in MERGE_FILL_FIELDS:
+            rows = [(master, vals[name]) for master, vals in updates.items() if name in vals]
+            if not rows:
+                continue
+            execute_values(
+                cr,
+                sql.SQL("UPDATE {table} AS t SET {column} = v.value FROM (VALUES %s) AS v(id, value) WHERE t.id = v.id").format(
+                    table=sql.Identifier(table), column=sql.Identifier(name)).as_string(cr._obj),
+                rows,
+                page_size=len(rows)
+            )
+            for master, _value in rows:
+                filled.setdefault(str(master), {})[name] = values[master][name]
+
+        return filled
+
+    def _refresh_match_keys(self, batch_map):
+        """🗝️ Drop losers from the match-key index, re-key masters that gained data"""
+
+        self.env.cr.execute("DELETE FROM datasniffr_match_key WHERE partner_id IN %s", (tuple(batch_map),))
+        masters = self.env['res.partner'].browse(sorted(set(batch_map.values())))
+        masters.invalidate_cache()
+        self.env['datasniffr.match.key']._refresh_partner_keys(masters)
+
+    def action_undo_merge(self):
+        """⏪ Put every moved reference, filled field and archived record back"""
+
+        self.env['base'].flush()
+        cr = self.env.cr
+        batches = self.filtered(lambda b: b.state == 'done')
+
+        # Newest batch first so chained merges unwind in order
+        for batch in batches.sorted('id', reverse=True):
+            undo = json.loads(batch.undo_log or '{}')
+            table = self.env[batch.model_name]._table
+
+            for reference, moved_ids in undo.get('references', {}).items():
+                ref_table, column = reference.split('.')
+                rows = [(row_id, loser_id) for loser_id, row_ids in moved_ids for row_id in row_ids]
+                execute_values(
+                    cr,
+                    sql.SQL("UPDATE {table} AS t SET {column} = v.loser_id FROM (VALUES %s) AS v(id, loser_id) WHERE t.id = v.id").format(
+                        table=sql.Identifier(ref_table), column=sql.Identifier(column)).as_string(cr._obj),
+                    rows,
+                    page_size=5000
+                )
+
+            for name in MERGE_FILL_FIELDS:
+                rows = [(int(master), old[name]) for master, old in undo.get('filled', {}).items() if name in old]
+                if rows:
+                    execute_values(
+                        cr,
+                        sql.SQL("UPDATE {table} AS t SET {column} = v.value FROM (VALUES %s) AS v(id, value) WHERE t.id = v.id").format(
+                            table=sql.Identifier(table), column=sql.Identifier(name)).as_string(cr._obj),
+                        rows
+                    )
+
+            if undo.get('archived'):
+                cr.execute(
+                    sql.SQL("UPDATE {table} SET active = true WHERE id IN %s").format(
+                        table=sql.Identifier(table)).as_string(cr._obj),
+                    (tuple(undo['archived']),)
+                )
+
+            batch.state = 'undone'
+            self._sync_after_merge(batch.model_name, self._get_many2one_references(batch.model_name), undo, set())
+
+            if batch.model_name == 'res.partner':
+                involved = {loser for loser, _master in undo.get('merges', [])} | {master for _loser, master in undo.get('merges', [])}
+                partners = self.env['res.partner'].browse(sorted(involved))
+                partners.invalidate_cache()
+                self.env['datasniffr.match.key']._refresh_partner_keys(partners)
+
+        self.env['base'].invalidate_cache()
+
+        return {
+            'success': True,
+            'batches_undone': len(batches),
+            'message': f'⏪ {sum(batches.mapped("merge_count"))} merges undone!'
+        }
@@ -13,6 +13,14 @@ Features:
 - 📊 Duplicate pattern analysis
 - ⚔️ Boss battle integration
 - 🎯 Smart merge suggestions
+- 🧱 Blocking/LSH candidate index (no more O(n²) fuzzy hunts)
+- ⚡ Vectorized batch similarity scoring
+- 🗝️ Persistent match-key index for incremental hunts
+- 🗂️ Duplicate groups streamed into paginated child records
+- 🕸️ Union-find clustering of exact and fuzzy matches
+- 🏭 Multi-process scoring across all cores
+- 🔀 Bulk merges with set-based re-pointing and undo log
+- 📖 Columnar scans of just the matching fields
 - 💾 Safe backup before merging
 - 🎉 Celebration tracking
 
@@ -22,12 +30,34 @@ mmm lol 🐶💾 - No duplicate escapes the hunter! 👥✨
 from odoo import models, fields, api
 import json
 import logging
+import os
 from datetime import datetime
-from difflib import SequenceMatcher
 import re
+from psycopg2.extras import execute_values
+
+from . import datasniffr_match_engine as match_engine
 
 _logger = logging.getLogger(__name__)
 
+# Records compared exhaustively when measuring blocking recall
+RECALL_SAMPLE_SIZE = 2000
+
+# Candidate pairs handed to the batch scorer at once
+SCORING_BATCH_SIZE = 100000
+
+# Partner fields that feed the match-key index
+MATCH_KEY_FIELDS = {'name', 'email', 'phone', 'street', 'zip', 'city', 'is_company'}
+MATCH_KEY_SEEDED_PARAM = 'datasniffr.match_key_index_seeded'
+
+# Duplicate groups written to the database per batch
+GROUP_WRITE_BATCH = 500
+
+# Partner columns read by hunts and the match-key index
+HUNT_SCAN_COLUMNS = ['id', 'name', 'email', 'phone', 'street', 'zip', 'city']
+
+# Worker processes for fuzzy scoring; 0 means one per CPU core
+HUNT_WORKERS_PARAM = 'datasniffr.duplicate_hunt_workers'
+
 class DataSniffRDuplicateHunter(models.Model):
     _name = 'datasniffr.duplicate.hunter'
     _description = 'DataSniffR Duplicate Hunter - Specialized Duplicate Detection 👥🔍'
@@ -46,9 +76,30 @@ class DataSniffRDuplicateHunter(models.Model):
         ('pattern_detection', 'Pattern Detection Hunt 📊'),
         ('full_spectrum', 'Full Spectrum Hunt 🌈'),
     ], string='Hunt Type', default='fuzzy_match', required=True)
+    hunt_mode = fields.Selection([
+        ('full', 'Full Hunt 🌍'),
+        ('incremental', 'Incremental Hunt 🔁'),
+    ], string='Hunt Mode', default='full', required=True)
     
     similarity_threshold = fields.Float(string='Similarity Threshold %', default=85.0)
     fields_to_compare = fields.Text(string='Fields to Compare (JSON)', default='["name", "email", "phone"]')
+    similarity_weights = fields.Text(string='Similarity Weights (JSON)',
+                                     default='{"name": 0.4, "email": 0.3, "phone": 0.2, "address": 0.1}')
+    
+    # Candidate Blocking
+    use_blocking = fields.Boolean(string='Use Blocking Index', default=True,
+                                  help='Only score pairs sharing an LSH, phonetic or phone neighbourhood bucket')
+    measure_blocking_recall = fields.Boolean(string='Measure Blocking Recall', default=False,
+                                             help='Compare blocking against a full pairwise scan on a sample')
+    candidate_pairs_scored = fields.Integer(string='Candidate Pairs Scored', default=0)
+    blocking_recall = fields.Float(string='Blocking Recall %', default=0.0)
+    
+    # Parallel Scoring
+    parallel_workers = fields.Integer(string='Worker Processes', default=1,
+                                      help='Processes scoring blocking partitions; 0 uses every CPU core')
+    partitions_total = fields.Integer(string='Partitions', default=0)
+    partitions_done = fields.Integer(string='Partitions Done', default=0)
+    hunt_progress = fields.Float(string='Progress %', default=0.0)
     
     # Hunt Results
     hunt_status = fields.Selection([
@@ -60,13 +111,15 @@ class DataSniffRDuplicateHunter(models.Model):
     ], string='Hunt Status', default='pending')
     
     total_records_scanned = fields.Integer(string='Records Scanned', default=0)
+    changed_records = fields.Integer(string='Changed Records Hunted', default=0)
     duplicate_groups_found = fields.Integer(string='Duplicate Groups Found', default=0)
     total_duplicates = fields.Integer(string='Total Duplicates', default=0)
     auto_merged = fields.Integer(string='Auto-Merged', default=0)
     manual_review_needed = fields.Integer(string='Manual Review Needed', default=0)
     
     # Hunt Results Data
-    hunt_results = fields.Text(string='Hunt Results (JSON)')
+    duplicate_group_ids = fields.One2many('datasniffr.duplicate.group', 'hunter_id', string='Duplicate Groups')
+    hunt_results = fields.Text(string='Hunt Summary (JSON)')
     merge_suggestions = fields.Text(string='Merge Suggestions (JSON)')
     hunt_statistics = fields.Text(string='Hunt Statistics (JSON)')
     
@@ -75,23 +128,59 @@ class DataSniffRDuplicateHunter(models.Model):
     battle_reward_points = fields.Integer(string='Battle Reward Points', default=0)
     
     @api.model
-    def start_customer_duplicate_hunt(self):
-        """👥 Start comprehensive customer duplicate hunt"""
+    def start_customer_duplicate_hunt(self, incremental=False, workers=None):
+        """👥 Start comprehensive customer duplicate hunt
+        
+        With ``incremental=True`` only partners written since the last
+        completed hunt are hunted, against their match-key neighbours.
+        ``workers`` overrides the datasniffr.duplicate_hunt_workers system
+        parameter (0 = every core) for fuzzy scoring.
+        """
         
-        hunter = self.create({
+        if workers is None:
+            workers = int(self.env['ir.config_parameter'].sudo().get_param(HUNT_WORKERS_PARAM, '1'))
+        
+        vals = {
             'name': f'Customer Hunt - {datetime.now().strftime("%Y-%m-%d %H:%M")}',
             'target_model': 'res.partner',
             'hunt_type': 'full_spectrum',
+            'hunt_mode': 'incremental' if incremental else 'full',
+            'parallel_workers': workers,
             'hunt_status': 'hunting'
-        })
+        }
+        
+        if self.new({'parallel_workers': workers})._get_worker_count() > 1:
+            # Partition progress is published on the hunt row from side
+            # cursors, which only see it once committed: the hunt runs on its
+            # own cursor rather than committing the caller's transaction
+            with self.env.registry.cursor() as cr:
+                hunter = self.with_env(self.env(cr=cr)).create(vals)
+                cr.commit()
+                return hunter.with_context(hunt_own_cursor=True)._run_customer_hunt(incremental)
+        
+        return self.create(vals)._run_customer_hunt(incremental)
+    
+    def _run_customer_hunt(self, incremental=False):
+        """🏃 Run every phase of a freshly created customer hunt"""
         
         try:
-            # Get all customers
-            customers = self.env['res.partner'].search([('is_company', '=', False)])
+            focus_ids = None
+            hunt_mode = self.hunt_mode
+            scope = self._get_incremental_scope() if incremental else None
+            
+            if scope is not None:
+                customers, focus_ids = scope
+            else:
+                # Get all customers, only the columns matching needs
+                customers = self.env['datasniffr.scan.reader'].read_rows(
+                    'res.partner', HUNT_SCAN_COLUMNS, [('is_company', '=', False)]
+                )
+                hunt_mode = 'full'
             
             hunt_results = {
-                'duplicate_groups': [],
                 'statistics': {
+                    'hunt_mode': hunt_mode,
+                    'changed_records': len(focus_ids) if focus_ids is not None else len(customers),
                     'total_scanned': len(customers),
                     'exact_matches': 0,
                     'fuzzy_matches': 0,
@@ -100,71 +189,156 @@ class DataSniffRDuplicateHunter(models.Model):
                     'medium_confidence': 0,
                     'low_confidence': 0
                 },
-                'patterns_found': [],
-                'merge_recommendations': []
+                'patterns_found': {}
             }
+            totals = {'groups': 0, 'duplicates': 0, 'manual_review': 0}
+            
+            match_edges = []
             
             # Phase 1: Exact match detection
-            exact_duplicates = self._find_exact_duplicates(customers)
-            hunt_results['duplicate_groups'].extend(exact_duplicates)
+            exact_duplicates = self._find_exact_duplicates(customers, focus_ids)
+            for group in exact_duplicates:
+                match_edges.extend(self._group_match_edges(group))
             hunt_results['statistics']['exact_matches'] = len(exact_duplicates)
             
             # Phase 2: Fuzzy match detection
-            fuzzy_duplicates = self._find_fuzzy_duplicates(customers)
-            hunt_results['duplicate_groups'].extend(fuzzy_duplicates)
-            hunt_results['statistics']['fuzzy_matches'] = len(fuzzy_duplicates)
+            fuzzy_edges = self._find_fuzzy_edges(customers, focus_ids)
+            match_edges.extend(fuzzy_edges)
+            hunt_results['statistics']['fuzzy_matches'] = len(fuzzy_edges)
+            hunt_results['statistics']['candidate_pairs'] = self.candidate_pairs_scored
+            if self.measure_blocking_recall:
+                hunt_results['statistics']['blocking_recall'] = self.blocking_recall
             
             # Phase 3: AI similarity detection
             ai_duplicates = self._find_ai_similarity_duplicates(customers)
-            hunt_results['duplicate_groups'].extend(ai_duplicates)
+            for group in ai_duplicates:
+                match_edges.extend(self._group_match_edges(group))
             hunt_results['statistics']['ai_matches'] = len(ai_duplicates)
             
-            # Phase 4: Pattern analysis
-            patterns = self._analyze_duplicate_patterns(hunt_results['duplicate_groups'])
-            hunt_results['patterns_found'] = patterns
+            # Every match edge lands in exactly one connected component, so
+            # overlapping email/phone/name/fuzzy groups collapse into one
+            duplicate_groups = self._cluster_match_edges(customers, match_edges)
             
-            # Phase 5: Generate merge suggestions
-            merge_suggestions = self._generate_merge_suggestions(hunt_results['duplicate_groups'])
-            hunt_results['merge_recommendations'] = merge_suggestions
-            
-            # Calculate confidence levels
-            confidence_stats = self._calculate_confidence_distribution(hunt_results['duplicate_groups'])
-            hunt_results['statistics'].update(confidence_stats)
+            # Phases 4 and 5 (patterns, merge suggestions per component) and
+            # the confidence distribution run batch by batch while storing
+            self._store_duplicate_groups(duplicate_groups, hunt_results, totals)
+            patterns = hunt_results['patterns_found']
             
             # Check for boss battle trigger
-            boss_battle = self._check_duplicate_boss_battle(hunt_results)
+            boss_battle = self._check_duplicate_boss_battle(totals['duplicates'])
+            
+            # A full hunt seeds the match-key index the first time around
+            MatchKey = self.env['datasniffr.match.key']
+            if focus_ids is None and not MatchKey._index_seeded():
+                MatchKey._replace_partner_keys([customer.id for customer in customers], customers)
+                MatchKey._mark_index_seeded()
             
             # Update hunter record
-            hunter.write({
+            self.write({
                 'hunt_status': 'completed',
+                'hunt_mode': hunt_mode,
+                'hunt_progress': 100.0,
                 'total_records_scanned': len(customers),
-                'duplicate_groups_found': len(hunt_results['duplicate_groups']),
-                'total_duplicates': sum(len(group['duplicates']) for group in hunt_results['duplicate_groups']),
-                'hunt_results': json.dumps(hunt_results, indent=2),
+                'changed_records': hunt_results['statistics']['changed_records'],
+                'duplicate_groups_found': totals['groups'],
+                'total_duplicates': totals['duplicates'],
+                'manual_review_needed': totals['manual_review'],
+                'hunt_results': json.dumps(hunt_results),
                 'boss_battle_triggered': boss_battle.get('triggered', False),
                 'battle_reward_points': boss_battle.get('reward_points', 0)
             })
             
             return {
                 'success': True,
-                'hunter_id': hunter.id,
-                'duplicate_groups': len(hunt_results['duplicate_groups']),
-                'total_duplicates': hunter.total_duplicates,
+                'hunter_id': self.id,
+                'duplicate_groups': totals['groups'],
+                'total_duplicates': self.total_duplicates,
                 'patterns_found': len(patterns),
                 'boss_battle_triggered': boss_battle.get('triggered', False),
-                'message': f'👥 Hunt complete! Found {hunter.total_duplicates} duplicates in {len(hunt_results["duplicate_groups"])} groups!'
+                'message': f'👥 Hunt complete! Found {self.total_duplicates} duplicates in {totals["groups"]} groups!'
             }
             
         except Exception as e:
-            hunter.write({'hunt_status': 'error'})
+            if self.env.context.get('hunt_own_cursor'):
+                # Nothing else lives in the hunt's own transaction
+                self.env.cr.rollback()
+            self.write({'hunt_status': 'error'})
             return {
                 'success': False,
                 'error': str(e),
                 'message': '❌ Duplicate hunt encountered an error!'
             }
     
-    def _find_exact_duplicates(self, records):
-        """🎯 Find exact duplicate matches"""
+    def _store_duplicate_groups(self, duplicate_groups, hunt_results, totals):
+        """🗂️ Write duplicate groups as child records, batch by batch
+        
+        Each batch also feeds pattern analysis, merge suggestions and the
+        confidence distribution, so the full group list never has to be
+        held or serialized at once.
+        """
+        
+        Group = self.env['datasniffr.duplicate.group']
+        statistics = hunt_results['statistics']
+        
+        for start in range(0, len(duplicate_groups), GROUP_WRITE_BATCH):
+            batch = [group for group in duplicate_groups[start:start + GROUP_WRITE_BATCH] if len(group['duplicates']) >= 2]
+            if not batch:
+                continue
+            
+            vals_list = []
+            for group in batch:
+                totals['groups'] += 1
+                suggestion = self._build_merge_suggestion(group, f"group_{totals['groups']}")
+                vals_list.append(Group._prepare_group_vals(self, group, suggestion))
+                
+                totals['duplicates'] += len(group['duplicates'])
+                if suggestion['merge_strategy'] == 'manual_review':
+                    totals['manual_review'] += 1
+            
+            Group.create(vals_list)
+            
+            hunt_results['patterns_found'] = self._analyze_duplicate_patterns(batch, hunt_results['patterns_found'])
+            for level, count in self._calculate_confidence_distribution(batch).items():
+                statistics[level] = statistics.get(level, 0) + count
+    
+    def _get_incremental_scope(self):
+        """🔁 Partners to hunt incrementally, plus the ids that changed
+        
+        Returns ``(rows, changed_ids)`` where rows are the changed partners
+        and every partner sharing a match key with them, or None
+        when there is no completed hunt or index to build on.
+        """
+        
+        last_hunt = self.search([
+            ('id', '!=', self.id),
+            ('target_model', '=', 'res.partner'),
+            ('hunt_status', '=', 'completed'),
+        ], order='create_date desc', limit=1)
+        
+        MatchKey = self.env['datasniffr.match.key']
+        if not last_hunt or not MatchKey._index_seeded():
+            _logger.info("No completed hunt or match-key index yet, running a full hunt")
+            return None
+        
+        changed_ids = set(self.env['res.partner'].search([
+            ('is_company', '=', False),
+            ('write_date', '>', last_hunt.create_date),
+        ]).ids)
+        
+        neighbour_ids = MatchKey._find_neighbour_partner_ids(list(changed_ids))
+        rows = self.env['datasniffr.scan.reader'].read_rows('res.partner', HUNT_SCAN_COLUMNS, [
+            ('id', 'in', list(neighbour_ids | changed_ids)),
+            ('is_company', '=', False),
+        ])
+        
+        return rows, changed_ids
+    
+    def _find_exact_duplicates(self, records, focus_ids=None):
+        """🎯 Find exact duplicate matches
+        
+        When ``focus_ids`` is given, only groups containing one of those
+        records are reported.
+        """
         
         exact_groups = []
         email_groups = {}
@@ -196,7 +370,7 @@ class DataSniffRDuplicateHunter(models.Model):
         
         # Process email duplicates
         for email, records_list in email_groups.items():
-            if len(records_list) > 1:
+            if len(records_list) > 1 and self._touches_focus(records_list, focus_ids):
                 exact_groups.append({
                     'match_type': 'exact_email',
                     'match_value': email,
@@ -208,7 +382,7 @@ class DataSniffRDuplicateHunter(models.Model):
         
         # Process phone duplicates
         for phone, records_list in phone_groups.items():
-            if len(records_list) > 1:
+            if len(records_list) > 1 and self._touches_focus(records_list, focus_ids):
                 exact_groups.append({
                     'match_type': 'exact_phone',
                     'match_value': phone,
@@ -220,7 +394,7 @@ class DataSniffRDuplicateHunter(models.Model):
         
         # Process name duplicates (lower confidence)
         for name, records_list in name_groups.items():
-            if len(records_list) > 1:
+            if len(records_list) > 1 and self._touches_focus(records_list, focus_ids):
                 exact_groups.append({
                     'match_type': 'exact_name',
                     'match_value': name,
@@ -232,93 +406,202 @@ class DataSniffRDuplicateHunter(models.Model):
         
         return exact_groups
     
-    def _find_fuzzy_duplicates(self, records):
-        """🔍 Find fuzzy duplicate matches using similarity algorithms"""
+    def _touches_focus(self, records, focus_ids):
+        """🔁 Whether a group involves at least one record being hunted"""
         
-        fuzzy_groups = []
-        processed_ids = set()
+        return focus_ids is None or any(record.id in focus_ids for record in records)
+    
+    def _find_fuzzy_duplicates(self, records, focus_ids=None):
+        """🔍 Find fuzzy duplicate matches using similarity algorithms"""
         
-        for i, record1 in enumerate(records):
-            if record1.id in processed_ids:
-                continue
+        return self._cluster_match_edges(records, self._find_fuzzy_edges(records, focus_ids))
+    
+    def _find_fuzzy_edges(self, records, focus_ids=None):
+        """🔍 Match edges for candidate pairs at or above the similarity threshold
+        
+        When ``focus_ids`` is given, only pairs involving one of those
+        records are scored.
+        """
+        
+        # Normalize once per record into a read-only snapshot, then only
+        # score the pairs the blocking index considers plausible
+        profiles = [self._build_match_profile(record) for record in records]
+        scorer = self._build_pair_scorer(profiles)
+        
+        workers = self._get_worker_count()
+        if workers > 1 and self.use_blocking and not self.measure_blocking_recall:
+            publish_progress = self.env.context.get('hunt_own_cursor')
+            if publish_progress:
+                # The hunt row must not be locked by this transaction while
+                # side cursors update it
+                self.env.cr.commit()
+            scored_pairs, candidate_count = match_engine.parallel_match_edges(
+                profiles, scorer, self.similarity_threshold, workers,
+                focus_ids=focus_ids, on_progress=self._report_hunt_progress if publish_progress else None
+            )
+            if publish_progress:
+                # Fresh snapshot including their updates, or writing the row
+                # again fails with a serialization error
+                self.env.cr.commit()
+        else:
+            # Recall measurement needs the full candidate set in one place,
+            # so it always runs on the serial path
+            candidate_pairs = self._generate_candidate_pairs(profiles)
+            if focus_ids is not None:
+                candidate_pairs = {pair for pair in candidate_pairs if pair[0] in focus_ids or pair[1] in focus_ids}
             
-            similar_records = [record1]
+            scored_pairs = self._score_pairs(scorer, candidate_pairs, self.similarity_threshold)
+            candidate_count = len(candidate_pairs)
             
-            for j, record2 in enumerate(records[i+1:], i+1):
-                if record2.id in processed_ids:
-                    continue
-                
-                similarity = self._calculate_record_similarity(record1, record2)
-                
-                if similarity >= self.similarity_threshold:
-                    similar_records.append(record2)
-                    processed_ids.add(record2.id)
+            if self.measure_blocking_recall:
+                self.write({'blocking_recall': self._measure_blocking_recall(scorer, profiles, candidate_pairs)})
+        
+        edges = [
+            (id1, id2, {
+                'match_type': 'fuzzy_similarity',
+                'confidence': similarity,
+                'auto_merge_safe': similarity >= 95,
+                'field_scores': field_scores
+            })
+            for (id1, id2), similarity, field_scores in scored_pairs
+        ]
+        
+        self.write({'candidate_pairs_scored': candidate_count})
+        
+        return edges
+    
+    def _get_worker_count(self):
+        """🏭 Number of scoring processes for this hunt"""
+        
+        if self.parallel_workers == 0:
+            return os.cpu_count() or 1
+        return max(1, self.parallel_workers)
+    
+    def _report_hunt_progress(self, partitions_done, partitions_total):
+        """📈 Publish partition progress from a separate cursor
+        
+        The hunt's transaction is still open while scoring, so progress is
+        written through a short-lived cursor to be visible meanwhile. Only
+        hunts running on their own cursor, with the row committed, publish it.
+        """
+        
+        progress = partitions_done / partitions_total * 100 if partitions_total else 100.0
+        
+        with self.env.registry.cursor() as cr:
+            cr.execute("""
+                UPDATE datasniffr_duplicate_hunter
+                   SET partitions_done = %s, partitions_total = %s, hunt_progress = %s
+                 WHERE id = %s
+            """, (partitions_done, partitions_total, progress, self.id))
+        
+        _logger.info(f"Duplicate hunt {self.id}: {partitions_done}/{partitions_total} partitions scored")
+    
+    def _group_match_edges(self, group):
+        """🔗 Star edges tying every record of a match group to its first record"""
+        
+        evidence = {
+            'match_type': group['match_type'],
+            'match_value': group.get('match_value'),
+            'confidence': group['confidence'],
+            'auto_merge_safe': group.get('auto_merge_safe', False)
+        }
+        
+        anchor = group['duplicates'][0]['id']
+        return [(anchor, dup['id'], evidence) for dup in group['duplicates'][1:]]
+    
+    def _cluster_match_edges(self, records, edges):
+        """🕸️ Turn match edges into one duplicate group per connected component
+        
+        A group is only as confident as its weakest directly matched pair,
+        where each pair counts its strongest piece of evidence.
+        """
+        
+        records_by_id = {record.id: record for record in records}
+        duplicate_groups = []
+        
+        for component in match_engine.cluster_edges(edges):
+            best_evidence = {}
+            for id1, id2, evidence in component['edges']:
+                best = best_evidence.get((id1, id2))
+                if not best or evidence['confidence'] > best['confidence']:
+                    best_evidence[(id1, id2)] = evidence
             
-            if len(similar_records) > 1:
-                processed_ids.add(record1.id)
-                
-                # Calculate average similarity within group
-                avg_similarity = self._calculate_group_similarity(similar_records)
-                
-                fuzzy_groups.append({
-                    'match_type': 'fuzzy_similarity',
-                    'confidence': avg_similarity,
-                    'duplicates': [{'id': r.id, 'name': r.name, 'email': r.email or '', 'phone': r.phone or ''} for r in similar_records],
-                    'merge_priority': 'high' if avg_similarity >= 90 else 'medium' if avg_similarity >= 80 else 'low',
-                    'auto_merge_safe': avg_similarity >= 95,
-                    'similarity_details': self._get_similarity_breakdown(similar_records)
-                })
+            confidence = min(evidence['confidence'] for evidence in best_evidence.values())
+            match_types = sorted({evidence['match_type'] for _id1, _id2, evidence in component['edges']})
+            members = [records_by_id[record_id] for record_id in component['members']]
+            
+            duplicate_groups.append({
+                'match_type': match_types[0] if len(match_types) == 1 else 'multi_evidence',
+                'match_value': next((e.get('match_value') for _i, _j, e in component['edges'] if e.get('match_value')), None),
+                'confidence': confidence,
+                'duplicates': [{'id': r.id, 'name': r.name, 'email': r.email or '', 'phone': r.phone or ''} for r in members],
+                'merge_priority': 'high' if confidence >= 90 else 'medium' if confidence >= 70 else 'low',
+                'auto_merge_safe': all(evidence['auto_merge_safe'] for evidence in best_evidence.values()),
+                'similarity_details': {
+                    'match_types': match_types,
+                    'evidence': [dict(evidence, record1=id1, record2=id2) for id1, id2, evidence in component['edges']]
+                }
+            })
         
-        return fuzzy_groups
+        return duplicate_groups
     
-    def _calculate_record_similarity(self, record1, record2):
-        """📊 Calculate similarity between two records"""
+    def _build_match_profile(self, record):
+        """🧹 Normalized name/email/phone/address profile used for blocking and scoring
         
-        similarities = []
-        weights = {'name': 0.4, 'email': 0.3, 'phone': 0.2, 'address': 0.1}
+        ``record`` is a partner or a scan row with the HUNT_SCAN_COLUMNS.
+        """
         
-        # Name similarity
-        if record1.name and record2.name:
-            name_sim = SequenceMatcher(None, record1.name.lower(), record2.name.lower()).ratio() * 100
-            similarities.append(('name', name_sim, weights['name']))
+        address = ' '.join(filter(None, [record.street, record.zip, record.city]))
+        return match_engine.build_match_profile(record.id, record.name, record.email, record.phone, address)
+    
+    def _get_similarity_weights(self):
+        """⚖️ Configured field weights for similarity scoring"""
         
-        # Email similarity
-        if record1.email and record2.email:
-            email_sim = SequenceMatcher(None, record1.email.lower(), record2.email.lower()).ratio() * 100
-            similarities.append(('email', email_sim, weights['email']))
+        try:
+            weights = json.loads(self.similarity_weights or '{}')
+        except ValueError:
+            _logger.warning(f"Invalid similarity weights on hunt {self.id}, using defaults")
+            weights = {}
+        
+        return weights or dict(match_engine.DEFAULT_WEIGHTS)
+    
+    def _build_pair_scorer(self, profiles):
+        """⚡ Batch scorer with every profile vectorized once"""
         
-        # Phone similarity
-        if record1.phone and record2.phone:
-            phone1 = re.sub(r'[^\d]', '', record1.phone)
-            phone2 = re.sub(r'[^\d]', '', record2.phone)
-            if phone1 and phone2:
-                phone_sim = SequenceMatcher(None, phone1, phone2).ratio() * 100
-                similarities.append(('phone', phone_sim, weights['phone']))
+        return match_engine.PairScorer(profiles, self._get_similarity_weights())
+    
+    def _score_pairs(self, scorer, pairs, min_similarity=0):
+        """📊 Yield ((id1, id2), similarity, field_scores) for pairs scoring at
+        least ``min_similarity``, scored in NumPy batches"""
         
-        # Calculate weighted average
-        if not similarities:
-            return 0
+        return match_engine.score_candidate_pairs(scorer, pairs, min_similarity, SCORING_BATCH_SIZE)
+    
+    def _generate_candidate_pairs(self, profiles):
+        """🧱 Candidate pairs worth scoring (all pairs when blocking is off)"""
         
-        total_weight = sum(weight for _, _, weight in similarities)
-        weighted_sum = sum(similarity * weight for _, similarity, weight in similarities)
+        if not self.use_blocking:
+            return match_engine.all_pairs(profiles)
         
-        return weighted_sum / total_weight if total_weight > 0 else 0
+        return match_engine.generate_candidate_pairs(profiles)
     
-    def _calculate_group_similarity(self, records):
-        """📊 Calculate average similarity within a group"""
+    def _measure_blocking_recall(self, scorer, profiles, candidate_pairs):
+        """📏 Recall of the blocking index against a full pairwise baseline
         
-        if len(records) < 2:
-            return 0
+        The baseline runs on a name-sorted window of the hunted records so
+        that likely duplicates land in the same sample.
+        """
         
-        total_similarity = 0
-        comparisons = 0
+        sample = sorted(profiles, key=lambda p: (p['name'], p['id']))[:RECALL_SAMPLE_SIZE]
         
-        for i, record1 in enumerate(records):
-            for record2 in records[i+1:]:
-                total_similarity += self._calculate_record_similarity(record1, record2)
-                comparisons += 1
+        true_pairs = {
+            pair for pair, _similarity, _field_scores
+            in self._score_pairs(scorer, match_engine.all_pairs(sample), self.similarity_threshold)
+        }
         
-        return total_similarity / comparisons if comparisons > 0 else 0
+        recall = match_engine.blocking_recall(true_pairs, candidate_pairs)
+        _logger.info(f"Blocking recall: {recall:.1f}% of {len(true_pairs)} sampled true pairs kept")
+        
+        return recall
     
     def _find_ai_similarity_duplicates(self, records):
         """🤖 Find AI-powered similarity duplicates"""
@@ -331,16 +614,21 @@ class DataSniffRDuplicateHunter(models.Model):
         
         return ai_groups
     
-    def _analyze_duplicate_patterns(self, duplicate_groups):
-        """📊 Analyze patterns in duplicate data"""
+    def _analyze_duplicate_patterns(self, duplicate_groups, patterns=None):
+        """📊 Analyze patterns in duplicate data
+        
+        Pass the ``patterns`` of earlier batches to keep accumulating.
+        """
         
-        patterns = {
+        patterns = patterns or {
             'common_domains': {},
             'naming_patterns': {},
             'phone_patterns': {},
             'creation_patterns': {},
-            'duplicate_hotspots': []
+            'duplicate_hotspots': [],
+            'groups_analyzed': 0
         }
+        patterns['groups_analyzed'] = patterns.get('groups_analyzed', 0) + len(duplicate_groups)
         
         for group in duplicate_groups:
             duplicates = group['duplicates']
@@ -360,10 +648,11 @@ class DataSniffRDuplicateHunter(models.Model):
                     patterns['naming_patterns'][word] = patterns['naming_patterns'].get(word, 0) + 1
         
         # Identify hotspots (areas with many duplicates)
-        if len(duplicate_groups) > 10:
+        patterns['duplicate_hotspots'] = []
+        if patterns['groups_analyzed'] > 10:
             patterns['duplicate_hotspots'].append({
                 'type': 'high_volume',
-                'description': f'High duplicate volume detected: {len(duplicate_groups)} groups found',
+                'description': f'High duplicate volume detected: {patterns["groups_analyzed"]} groups found',
                 'recommendation': 'Consider data import process review'
             })
         
@@ -396,30 +685,33 @@ class DataSniffRDuplicateHunter(models.Model):
         suggestions = []
         
         for group in duplicate_groups:
-            duplicates = group['duplicates']
-            
-            if len(duplicates) < 2:
+            if len(group['duplicates']) < 2:
                 continue
             
-            # Analyze which record has the most complete data
-            master_candidate = self._find_master_record(duplicates)
-            
-            suggestion = {
-                'group_id': f"group_{len(suggestions) + 1}",
-                'match_type': group['match_type'],
-                'confidence': group['confidence'],
-                'master_record': master_candidate,
-                'records_to_merge': [d for d in duplicates if d['id'] != master_candidate['id']],
-                'merge_strategy': self._determine_merge_strategy(group),
-                'data_conflicts': self._identify_data_conflicts(duplicates),
-                'estimated_time': '5 minutes',
-                'risk_level': 'low' if group.get('auto_merge_safe') else 'medium'
-            }
-            
-            suggestions.append(suggestion)
+            suggestions.append(self._build_merge_suggestion(group, f"group_{len(suggestions) + 1}"))
         
         return suggestions
     
+    def _build_merge_suggestion(self, group, group_id):
+        """💡 Merge suggestion for a single duplicate group"""
+        
+        duplicates = group['duplicates']
+        
+        # Analyze which record has the most complete data
+        master_candidate = self._find_master_record(duplicates)
+        
+        return {
+            'group_id': group_id,
+            'match_type': group['match_type'],
+            'confidence': group['confidence'],
+            'master_record': master_candidate,
+            'records_to_merge': [d for d in duplicates if d['id'] != master_candidate['id']],
+            'merge_strategy': self._determine_merge_strategy(group),
+            'data_conflicts': self._identify_data_conflicts(duplicates),
+            'estimated_time': '5 minutes',
+            'risk_level': 'low' if group.get('auto_merge_safe') else 'medium'
+        }
+    
     def _find_master_record(self, duplicates):
         """🎯 Find the best record to use as master for merging"""
         
@@ -495,11 +787,9 @@ class DataSniffRDuplicateHunter(models.Model):
             'low_confidence': low_confidence
         }
     
-    def _check_duplicate_boss_battle(self, hunt_results):
+    def _check_duplicate_boss_battle(self, total_duplicates):
         """⚔️ Check if duplicate hunt warrants a boss battle"""
         
-        total_duplicates = sum(len(group['duplicates']) for group in hunt_results['duplicate_groups'])
-        
         if total_duplicates >= 50:
             return {
                 'triggered': True,
@@ -524,13 +814,15 @@ class DataSniffRDuplicateHunter(models.Model):
     def execute_merge_suggestion(self, suggestion_id):
         """🔄 Execute a merge suggestion"""
         
-        hunt_results = json.loads(self.hunt_results or '{}')
-        suggestions = hunt_results.get('merge_recommendations', [])
-        
-        suggestion = next((s for s in suggestions if s.get('group_id') == suggestion_id), None)
-        if not suggestion:
+        group = self.env['datasniffr.duplicate.group'].search([
+            ('hunter_id', '=', self.id),
+            ('name', '=', suggestion_id),
+        ], limit=1)
+        if not group:
             return {'error': 'Suggestion not found'}
         
+        suggestion = group._get_merge_suggestion()
+        
         try:
             master_record = self.env['res.partner'].browse(suggestion['master_record']['id'])
             records_to_merge = [self.env['res.partner'].browse(r['id']) for r in suggestion['records_to_merge']]
@@ -542,6 +834,7 @@ class DataSniffRDuplicateHunter(models.Model):
             merge_result = self._execute_record_merge(master_record, records_to_merge, suggestion)
             
             # Update statistics
+            group.state = 'merged'
             self.auto_merged += 1
             
             return {
@@ -596,58 +889,60 @@ class DataSniffRDuplicateHunter(models.Model):
         # Merge strategy based on suggestion
         strategy = suggestion.get('merge_strategy', 'manual_review')
         
+        result = {'strategy_used': strategy, 'success': True}
         if strategy == 'auto_merge':
-            # Safe automatic merge
-            for record in records_to_merge:
-                # Update related records to point to master
-                self._update_related_records(record, master_record)
-                
-                # Merge additional data if master is missing it
-                if not master_record.email and record.email:
-                    master_record.email = record.email
-                if not master_record.phone and record.phone:
-                    master_record.phone = record.phone
-                
-                # Archive the duplicate record
-                record.active = False
+            # Safe automatic merge: references re-pointed, gaps filled, duplicates archived
+            batches = self._update_related_records(records_to_merge, master_record)
+            result['merge_batch_ids'] = batches.ids
         
-        return {'strategy_used': strategy, 'success': True}
+        return result
     
-    def _update_related_records(self, old_record, new_record):
-        """🔗 Update related records to point to new master record"""
-        
-        # Update sale orders
-        sale_orders = self.env['sale.order'].search([('partner_id', '=', old_record.id)])
-        sale_orders.write({'partner_id': new_record.id})
-        
-        # Update invoices
-        invoices = self.env['account.move'].search([('partner_id', '=', old_record.id)])
-        invoices.write({'partner_id': new_record.id})
+    def _update_related_records(self, old_records, new_record):
+        """🔗 Re-point every many2one referencing the old records to the master"""
         
-        # Add more related record updates as needed
-        
-    def _get_similarity_breakdown(self, records):
-        """📊 Get detailed similarity breakdown for records"""
+        return self.env['datasniffr.merge.batch'].merge_records(
+            {record.id: new_record.id for record in old_records},
+            hunter=self
+        )
+    
+    def execute_bulk_merge(self, min_confidence=None):
+        """🔀 Merge every pending auto-merge group of this hunt in one go
+        
+        All merges run in the current transaction through the bulk merger;
+        ``datasniffr.merge.batch.action_undo_merge`` reverts them.
+        """
+        
+        domain = [
+            ('hunter_id', '=', self.id),
+            ('state', '=', 'pending'),
+            ('merge_strategy', '=', 'auto_merge'),
+        ]
+        if min_confidence is not None:
+            domain.append(('confidence', '>=', min_confidence))
+        groups = self.env['datasniffr.duplicate.group'].search(domain)
+        
+        merge_map = {}
+        for group in groups:
+            master_id = group.master_partner_id.id
+            for member in group.member_ids:
+                if member.partner_id.id != master_id:
+                    merge_map[member.partner_id.id] = master_id
+        
+        batches = self.env['datasniffr.merge.batch'].merge_records(merge_map, hunter=self)
+        
+        groups.write({'state': 'merged'})
+        self.auto_merged += len(groups)
         
-        breakdown = {
-            'name_similarity': [],
-            'email_similarity': [],
-            'phone_similarity': [],
-            'overall_patterns': []
+        return {
+            'success': True,
+            'groups_merged': len(groups),
+            'records_merged': sum(batches.mapped('merge_count')),
+            'references_moved': sum(batches.mapped('references_moved')),
+            'merge_batch_ids': batches.ids,
+            'message': f'🔀 {len(groups)} duplicate groups merged in bulk!'
         }
-        
-        for i, record1 in enumerate(records):
-            for record2 in records[i+1:]:
-                if record1.name and record2.name:
-                    name_sim = SequenceMatcher(None, record1.name.lower(), record2.name.lower()).ratio() * 100
-                    breakdown['name_similarity'].append({
-                        'record1': record1.id,
-                        'record2': record2.id,
-                        'similarity': name_sim
-                    })
-        
-        return breakdown
     
+
     @api.model
     def get_duplicate_hunter_dashboard(self):
         """📊 Get duplicate hunter dashboard"""
@@ -676,6 +971,11 @@ class DataSniffRDuplicateHunter(models.Model):
                 'duplicates_found': most_productive.total_duplicates
             }
         
+        # Review queue straight from the indexed group table
+        Group = self.env['datasniffr.duplicate.group']
+        dashboard['pending_groups'] = Group.search_count([('state', '=', 'pending')])
+        dashboard['review_queue'] = Group.get_duplicate_groups(state='pending', limit=10)['groups']
+        
         # Recent hunts
         for hunter in hunters[:5]:
             dashboard['recent_hunts'].append({
@@ -686,4 +986,260 @@ class DataSniffRDuplicateHunter(models.Model):
                 'date': hunter.create_date.isoformat()
             })
         
-        return dashboard
\ No newline at end of file
+        return dashboard
+
+
+class DataSniffRMatchKey(models.Model):
+    _name = 'datasniffr.match.key'
+    _description = 'DataSniffR Match Key - Persistent Duplicate Blocking Index 🗝️'
+    
+    partner_id = fields.Many2one('res.partner', string='Partner', required=True, index=True, ondelete='cascade')
+    key_type = fields.Selection([
+        ('exact', 'Exact Match Key 🎯'),
+        ('blocking', 'Blocking Key 🧱'),
+    ], string='Key Type', required=True)
+    key = fields.Char(string='Match Key', required=True, index=True)
+    
+    @api.model
+    def _index_seeded(self):
+        """🗝️ Whether the match-key index covers every partner yet"""
+        
+        return bool(self.env['ir.config_parameter'].sudo().get_param(MATCH_KEY_SEEDED_PARAM))
+    
+    @api.model
+    def _mark_index_seeded(self):
+        self.env['ir.config_parameter'].sudo().set_param(MATCH_KEY_SEEDED_PARAM, datetime.now().isoformat())
+    
+    @api.model
+    def _refresh_partner_keys(self, partners):
+        """🔄 Replace the match keys of the given partners in bulk"""
+        
+        if not partners:
+            return
+        
+        rows = self.env['datasniffr.scan.reader'].read_rows('res.partner', HUNT_SCAN_COLUMNS, [
+            ('id', 'in', partners.ids),
+            ('is_company', '=', False),
+        ], active_test=False)
+        self._replace_partner_keys(partners.ids, rows)
+    
+    @api.model
+    def _replace_partner_keys(self, partner_ids, rows):
+        """🔄 Drop the keys of ``partner_ids`` and index the given scan rows"""
+        
+        Hunter = self.env['datasniffr.duplicate.hunter']
+        key_rows = [
+            (row.id, key_type, key)
+            for row in rows
+            for key_type, key in match_engine.match_key_strings(Hunter._build_match_profile(row))
+        ]
+        
+        if partner_ids:
+            self.env.cr.execute("DELETE FROM datasniffr_match_key WHERE partner_id IN %s", (tuple(partner_ids),))
+        if key_rows:
+            execute_values(
+                self.env.cr,
+                "INSERT INTO datasniffr_match_key (partner_id, key_type, key) VALUES %s",
+                key_rows,
+                page_size=5000
+            )
+    
+    @api.model
+    def rebuild_match_key_index(self, batch_size=5000):
+        """🏗️ Rebuild the whole match-key index from scratch"""
+        
+        self.env.cr.execute("TRUNCATE datasniffr_match_key")
+        
+        partners_indexed = 0
+        for chunk in self.env['datasniffr.scan.reader'].iter_chunks(
+                'res.partner', HUNT_SCAN_COLUMNS, [('is_company', '=', False)], chunk_size=batch_size):
+            self._replace_partner_keys([], chunk)
+            partners_indexed += len(chunk)
+        
+        self._mark_index_seeded()
+        
+        return {
+            'success': True,
+            'partners_indexed': partners_indexed,
+            'message': f'🗝️ Match-key index rebuilt for {partners_indexed} partners!'
+        }
+    
+    @api.model
+    def _find_neighbour_partner_ids(self, partner_ids):
+        """🤝 Partners sharing a match key with any of the given partners
+        
+        Exact keys are always followed so exact groups stay complete;
+        blocking keys shared by more than MAX_BUCKET_SIZE partners are
+        skipped, like oversized buckets in a full hunt.
+        """
+        
+        if not partner_ids:
+            return set()
+        
+        self.env.cr.execute("""
+            WITH changed_keys AS (
+                SELECT DISTINCT key_type, key FROM datasniffr_match_key WHERE partner_id IN %s
+            ), usable_keys AS (
+                SELECT k.key
+                  FROM datasniffr_match_key k
+                  JOIN changed_keys c ON c.key = k.key AND c.key_type = k.key_type
+                 GROUP BY k.key_type, k.key
+                HAVING k.key_type = 'exact' OR count(*) <= %s
+            )
+            SELECT DISTINCT k.partner_id
+              FROM datasniffr_match_key k
+              JOIN usable_keys u ON u.key = k.key
+        """, (tuple(partner_ids), match_engine.MAX_BUCKET_SIZE))
+        
+        return {row[0] for row in self.env.cr.fetchall()}
+
+
+class ResPartnerMatchKeys(models.Model):
+    _inherit = 'res.partner'
+    
+    @api.model_create_multi
+    def create(self, vals_list):
+        """🗝️ Index match keys of new partners"""
+        partners = super().create(vals_list)
+        self.env['datasniffr.match.key']._refresh_partner_keys(partners)
+        return partners
+    
+    def write(self, vals):
+        """🗝️ Keep match keys in sync when matching fields change"""
+        result = super().write(vals)
+        if MATCH_KEY_FIELDS & set(vals):
+            self.env['datasniffr.match.key']._refresh_partner_keys(self)
+        return result
+
+
+
+class DataSniffRDuplicateGroup(models.Model):
+    _name = 'datasniffr.duplicate.group'
+    _description = 'DataSniffR Duplicate Group - One Group of Suspected Duplicates 🗂️'
+    _order = 'confidence desc, id'
+    
+    name = fields.Char(string='Group Reference', required=True, index=True)
+    hunter_id = fields.Many2one('datasniffr.duplicate.hunter', string='Duplicate Hunt', required=True, index=True, ondelete='cascade')
+    
+    match_type = fields.Char(string='Match Type', index=True)
+    match_value = fields.Char(string='Match Value')
+    confidence = fields.Float(string='Confidence %', index=True)
+    merge_priority = fields.Selection([
+        ('high', 'High'),
+        ('medium', 'Medium'),
+        ('low', 'Low'),
+    ], string='Merge Priority')
+    auto_merge_safe = fields.Boolean(string='Auto-Merge Safe', default=False)
+    similarity_details = fields.Text(string='Similarity Details (JSON)')
+    
+    # Merge Suggestion
+    master_partner_id = fields.Many2one('res.partner', string='Suggested Master', index=True)
+    merge_strategy = fields.Selection([
+        ('auto_merge', 'Auto Merge 🤖'),
+        ('assisted_merge', 'Assisted Merge 🤝'),
+        ('manual_review', 'Manual Review 👀'),
+    ], string='Merge Strategy')
+    data_conflicts = fields.Text(string='Data Conflicts (JSON)')
+    risk_level = fields.Char(string='Risk Level')
+    
+    state = fields.Selection([
+        ('pending', 'Pending 📋'),
+        ('merged', 'Merged ✅'),
+        ('dismissed', 'Dismissed 🙈'),
+    ], string='State', default='pending', index=True)
+    
+    member_ids = fields.One2many('datasniffr.duplicate.group.member', 'group_id', string='Members')
+    member_count = fields.Integer(string='Member Count', default=0)
+    
+    @api.model
+    def _prepare_group_vals(self, hunter, group, suggestion):
+        """🗂️ Create values for one hunted group and its members"""
+        
+        master_id = suggestion['master_record']['id']
+        
+        return {
+            'name': suggestion['group_id'],
+            'hunter_id': hunter.id,
+            'match_type': group['match_type'],
+            'match_value': group.get('match_value'),
+            'confidence': group['confidence'],
+            'merge_priority': group.get('merge_priority'),
+            'auto_merge_safe': group.get('auto_merge_safe', False),
+            'similarity_details': json.dumps(group['similarity_details']) if group.get('similarity_details') else False,
+            'master_partner_id': master_id,
+            'merge_strategy': suggestion['merge_strategy'],
+            'data_conflicts': json.dumps(suggestion['data_conflicts']),
+            'risk_level': suggestion['risk_level'],
+            'member_count': len(group['duplicates']),
+            'member_ids': [(0, 0, {
+                'partner_id': dup['id'],
+                'name': dup.get('name'),
+                'email': dup.get('email'),
+                'phone': dup.get('phone'),
+                'is_master': dup['id'] == master_id,
+            }) for dup in group['duplicates']],
+        }
+    
+    def _get_merge_suggestion(self):
+        """💡 Rebuild the merge suggestion dict for this group"""
+        
+        self.ensure_one()
+        
+        master = self.member_ids.filtered('is_master')[:1]
+        return {
+            'group_id': self.name,
+            'match_type': self.match_type,
+            'confidence': self.confidence,
+            'master_record': master._as_duplicate_dict() if master else {'id': self.master_partner_id.id},
+            'records_to_merge': [m._as_duplicate_dict() for m in self.member_ids if not m.is_master],
+            'merge_strategy': self.merge_strategy,
+            'data_conflicts': json.loads(self.data_conflicts or '[]'),
+            'risk_level': self.risk_level
+        }
+    
+    @api.model
+    def get_duplicate_groups(self, hunter_id=None, state=None, offset=0, limit=50, min_confidence=None):
+        """📄 One page of duplicate groups with their members"""
+        
+        domain = []
+        if hunter_id:
+            domain.append(('hunter_id', '=', hunter_id))
+        if state:
+            domain.append(('state', '=', state))
+        if min_confidence is not None:
+            domain.append(('confidence', '>=', min_confidence))
+        
+        groups = self.search(domain, offset=offset, limit=limit)
+        
+        return {
+            'total': self.search_count(domain),
+            'offset': offset,
+            'limit': limit,
+            'groups': [{
+                'group_id': group.name,
+                'hunter_id': group.hunter_id.id,
+                'match_type': group.match_type,
+                'confidence': group.confidence,
+                'merge_strategy': group.merge_strategy,
+                'state': group.state,
+                'master_record_id': group.master_partner_id.id,
+                'duplicates': [m._as_duplicate_dict() for m in group.member_ids],
+            } for group in groups]
+        }
+
+
+class DataSniffRDuplicateGroupMember(models.Model):
+    _name = 'datasniffr.duplicate.group.member'
+    _description = 'DataSniffR Duplicate Group Member 👤'
+    
+    group_id = fields.Many2one('datasniffr.duplicate.group', string='Duplicate Group', required=True, index=True, ondelete='cascade')
+    partner_id = fields.Many2one('res.partner', string='Partner', required=True, index=True, ondelete='cascade')
+    
+    # Snapshot of the matched values at hunt time
+    name = fields.Char(string='Name')
+    email = fields.Char(string='Email')
+    phone = fields.Char(string='Phone')
+    is_master = fields.Boolean(string='Suggested Master', default=False)
+    
+    def _as_duplicate_dict(self):
+        return {'id': self.partner_id.id, 'name': self.name, 'email': self.email or '', 'phone': self.phone or ''}
@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+"""
+DataSniffR Email Domains 📬🌍
+============================
+
+Domain-level verdict cache for email validation!
+Every distinct domain is checked once, then remembered with a TTL.
+
+Features:
+- 📬 One verdict per domain (valid, undeliverable, disposable, typo)
+- ⏳ TTL on checked verdicts, preloaded verdicts never expire
+- 🗑️ Shipped disposable and typo domain lists
+- 🧺 Bulk lookups: a whole chunk of domains in one query
+- 🔌 Offline resolver stub by default, real DNS only when asked for
+
+mmm lol 🐶💾 - One sniff per domain! 📬✨
+"""
+
+from odoo import models, fields, api
+import logging
+
+from email_validator import validate_email, EmailNotValidError
+from psycopg2.extras import execute_values
+
+_logger = logging.getLogger(__name__)
+
+# Checked verdicts are re-checked after this long
+DOMAIN_VERDICT_TTL_DAYS = 30
+
+# 'offline' (resolver stub, default) or 'dns' (MX lookups through email_validator)
+DOMAIN_RESOLVER_PARAM = 'datasniffr.email_domain_resolver'
+
+# Throwaway inbox providers
+DISPOSABLE_DOMAINS = {
+    '10minutemail.com', 'guerrillamail.com', 'guerrillamail.net', 'mailinator.com',
+    'maildrop.cc', 'sharklasers.com', 'temp-mail.org', 'tempmail.com', 'throwawaymail.com',
+    'trashmail.com', 'yopmail.com', 'getnada.com', 'dispostable.com', 'fakeinbox.com',
+}
+
+# Misspelled webmail domains -> what was meant
+DOMAIN_TYPOS = {
+    'gmai.com': 'gmail.com', 'gmial.com': 'gmail.com', 'gmali.com': 'gmail.com',
+    'gmail.co': 'gmail.com', 'gmail.con': 'gmail.com', 'gnail.com': 'gmail.com',
+    'yahooo.com': 'yahoo.com', 'yaho.com': 'yahoo.com', 'yahoo.con': 'yahoo.com',
+    'hotmial.com': 'hotmail.com', 'hotmil.com': 'hotmail.com', 'hotmail.con': 'hotmail.com',
+    'outlok.com': 'outlook.com', 'outlokc.com': 'outlook.com', 'outlook.con': 'outlook.com',
+}
+
+# Verdicts an address may pass with
+ACCEPTED_VERDICTS = {'valid', 'unverified'}
+
+
+class OfflineDomainResolver:
+    """🔌 Resolver stub: answers from the shipped lists, never touches the network"""
+
+    def check(self, domain):
+        if domain in DISPOSABLE_DOMAINS:
+            return 'disposable', 'Disposable email domain', False
+        if domain in DOMAIN_TYPOS:
+            return 'typo', f'Possible typo, did you mean {DOMAIN_TYPOS[domain]}?', DOMAIN_TYPOS[domain]
+        return 'unverified', False, False
+
+
+class DnsDomainResolver(OfflineDomainResolver):
+    """🌍 Shipped lists first, then an MX lookup through email_validator"""
+
+    def check(self, domain):
+        verdict = super().check(domain)
+        if verdict[0] != 'unverified':
+            return verdict
+        try:
+            validate_email(f'postmaster@{domain}', check_deliverability=True)
+            return 'valid', False, False
+        except EmailNotValidError as e:
+            return 'undeliverable', str(e), False
+
+
+class DataSniffREmailDomain(models.Model):
+    _name = 'datasniffr.email.domain'
+    _description = 'DataSniffR Email Domain - Cached Domain Verdict 📬'
+    _order = 'domain'
+
+    domain = fields.Char(string='Domain', required=True)
+    verdict = fields.Selection([
+        ('valid', 'Deliverable ✅'),
+        ('unverified', 'Not Checked (Offline) 🔌'),
+        ('undeliverable', 'Undeliverable 📭'),
+        ('disposable', 'Disposable 🗑️'),
+        ('typo', 'Typo ✏️'),
+    ], string='Verdict', required=True)
+    error = fields.Char(string='Error')
+    suggestion = fields.Char(string='Suggested Domain')
+    source = fields.Selection([
+        ('preload', 'Shipped List 📦'),
+        ('check', 'Resolver Check 🔎'),
+    ], string='Source', default='check', required=True)
+    checked_at = fields.Datetime(string='Checked At', default=fields.Datetime.now)
+    expires_at = fields.Datetime(string='Expires At', index=True)
+
+    _sql_constraints = [
+        ('domain_unique', 'unique(domain)', 'One verdict per domain!'),
+    ]
+
+    @api.model
+    def _get_resolver(self):
+        """🔌 Offline stub unless DNS checks were switched on"""
+
+        mode = self.env['ir.config_parameter'].sudo().get_param(DOMAIN_RESOLVER_PARAM, 'offline')
+        return DnsDomainResolver() if mode == 'dns' else OfflineDomainResolver()
+
+    @api.model
+    def _upsert_verdicts(self, rows):
+        """🗄️ Insert or refresh ``(domain, verdict, error, suggestion, source, ttl_days)`` rows"""
+
+        if rows:
+            execute_values(self.env.cr, """
+                INSERT INTO datasniffr_email_domain (domain, verdict, error, suggestion, source, checked_at, expires_at)
+                SELECT v.domain, v.verdict, v.error, v.suggestion, v.source, now() at time zone 'UTC',
+                       (now() at time zone 'UTC') + v.ttl_days * interval '1 day'
+                  FROM (VALUES %s) AS v(domain, verdict, error, suggestion, source, ttl_days)
+                ON CONFLICT (domain) DO UPDATE
+                   SET verdict = EXCLUDED.verdict, error = EXCLUDED.error, suggestion = EXCLUDED.suggestion,
+                       source = EXCLUDED.source, checked_at = EXCLUDED.checked_at, expires_at = EXCLUDED.expires_at
+            """, rows, template='(%s, %s, %s, %s, %s, %s::integer)', page_size=5000)
+
+    @api.model
+    def preload_domain_lists(self):
+        """📦 Load the shipped disposable and typo lists as permanent verdicts"""
+
+        resolver = OfflineDomainResolver()
+        rows = []
+        for domain in sorted(DISPOSABLE_DOMAINS | set(DOMAIN_TYPOS)):
+            verdict, error, suggestion = resolver.check(domain)
+            rows.append((domain, verdict, error or None, suggestion or None, 'preload', None))
+        self._upsert_verdicts(rows)
+
+        return {
+            'success': True,
+            'domains_loaded': len(rows),
+            'message': f'📦 {len(rows)} disposable/typo domains preloaded!'
+        }
+
+    @api.model
+    def get_verdicts(self, domains):
+        """📬 ``{domain: (verdict, error)}``, checking only unknown or expired domains"""
+
+        domains = {domain.lower() for domain in domains if domain}
+        if not domains:
+            return {}
+
+        self.env.cr.execute("""
+            SELECT domain, verdict, error FROM datasniffr_email_domain
+             WHERE domain IN %s AND (expires_at IS NULL OR expires_at > now() at time zone 'UTC')
+        """, (tuple(domains),))
+        verdicts = {domain: (verdict, error) for domain, verdict, error in self.env.cr.fetchall()}
+
+        missing = sorted(domains - set(verdicts))
+        if missing:
+            resolver = self._get_resolver()
+            rows = []
+            for domain in missing:
+                verdict, error, suggestion = resolver.check(domain)
+                verdicts[domain] = (verdict, error or None)
+                rows.append((domain, verdict, error or None, suggestion or None, 'check', DOMAIN_VERDICT_TTL_DAYS))
+            self._upsert_verdicts(rows)
+            _logger.info(f"Email domains: {len(missing)} checked, {len(domains) - len(missing)} from cache")
+
+        return verdicts
+
+    @api.model
+    def cleanup_expired_verdicts(self):
+        """🧹 Drop checked verdicts past their TTL"""
+
+        self.env.cr.execute("""
+            DELETE FROM datasniffr_email_domain
+             WHERE expires_at IS NOT NULL AND expires_at <= now() at time zone 'UTC'
+        """)
+        return self.env.cr.rowcount
@@ -7,14 +7,18 @@ Specialized field validation for perfect data formats!
 The ultimate field-by-field quality guardian!
 
 Features:
-- 🔤 Email format validation
-- 📞 Phone number standardization
+- 🔤 Email format validation (deliverability checked once per domain)
+- 📞 Phone number standardization (one parse per distinct number)
 - 💳 VAT/Tax ID verification
 - 🌍 Address format checking
 - 📅 Date format validation
 - 💰 Currency format fixing
-- 🎯 Custom field rules
+- 🎯 Custom field rules (compiled once, pushed down to SQL when possible)
 - 🤖 AI-powered suggestions
+- 📖 Columnar scans of just the validated field
+- 🖊️ Auto-fixes written back in batches with bulk backups
+- 🧠 Cleaner results memoized in a shared process-wide cache
+- 🧮 Write-time quality counters kept in sync on create/write
 
 mmm lol 🐶💾 - Every field perfect, every time! 🔍✨
 """
@@ -23,12 +27,32 @@ from odoo import models, fields, api
 import json
 import logging
 import re
-from datetime import datetime
-import phonenumbers
 from email_validator import validate_email, EmailNotValidError
+from psycopg2.extras import execute_values
+import numpy as np
+from . import datasniffr_phone_engine as phone_engine
+from . import datasniffr_rule_engine as rule_engine
+from .datasniffr_email_domains import ACCEPTED_VERDICTS
+from .datasniffr_normalization_cache import memoized_normalizer
 
 _logger = logging.getLogger(__name__)
 
+# Write-time quality rules: model -> rule -> (field, validator predicate)
+QUALITY_RULES = {
+    'res.partner': {
+        'invalid_email': ('email', '_is_invalid_email'),
+        'invalid_phone': ('phone', '_is_invalid_phone'),
+        'missing_name': ('name', '_is_missing_name'),
+    },
+}
+
+# Counter row holding the number of active records of a watched model
+RECORDS_COUNTER = '__records__'
+
+# Valid / invalid records kept in a custom validation's stored results
+CUSTOM_RESULT_SAMPLE_SIZE = 1000
+
+
 class DataSniffRFieldValidator(models.Model):
     _name = 'datasniffr.field.validator'
     _description = 'DataSniffR Field Validator - Specific Field Validation 🔍✅'
@@ -76,7 +100,7 @@ class DataSniffRFieldValidator(models.Model):
                 record.validation_score = 0.0
     
     @api.model
-    def validate_email_fields(self, model_name='res.partner', field_name='email'):
+    def validate_email_fields(self, model_name='res.partner', field_name='email', batch_size=None, checkpoint=False):
         """📧 Validate and fix email address formats"""
         
         validator = self.create({
@@ -87,8 +111,9 @@ class DataSniffRFieldValidator(models.Model):
         })
         
         try:
-            Model = self.env[model_name]
-            records = Model.search([(field_name, '!=', False)])
+            chunks = self.env['datasniffr.scan.reader'].iter_chunks(model_name, ['id', field_name], [(field_name, '!=', False)])
+            Domains = self.env['datasniffr.email.domain']
+            domain_verdicts = {}
             
             results = {
                 'valid_emails': [],
@@ -101,44 +126,58 @@ class DataSniffRFieldValidator(models.Model):
             valid_count = 0
             invalid_count = 0
             fixed_count = 0
+            fixes = []
             
-            for record in records:
-                total_checked += 1
-                email_value = getattr(record, field_name)
+            for chunk in chunks:
+                # Each domain new to this run is checked once, for the whole chunk at a time
+                cleaned_chunk = [self._clean_email(getattr(row, field_name)) for row in chunk]
+                new_domains = {
+                    cleaned.rpartition('@')[2] for cleaned in cleaned_chunk if cleaned and '@' in cleaned
+                } - set(domain_verdicts)
+                domain_verdicts.update(Domains.get_verdicts(new_domains))
                 
-                if not email_value:
-                    continue
-                
-                # Clean and validate email
-                cleaned_email = self._clean_email(email_value)
-                validation_result = self._validate_email_format(cleaned_email)
-                
-                if validation_result['valid']:
-                    valid_count += 1
-                    results['valid_emails'].append({
-                        'record_id': record.id,
-                        'email': cleaned_email,
-                        'status': 'valid'
-                    })
+                for row, cleaned_email in zip(chunk, cleaned_chunk):
+                    total_checked += 1
+                    email_value = getattr(row, field_name)
                     
-                    # Auto-fix if cleaned version is different
-                    if cleaned_email != email_value and validator.auto_fix_enabled:
-                        self._backup_field_value(record, field_name, email_value)
-                        record.write({field_name: cleaned_email})
-                        fixed_count += 1
-                        results['auto_fixed'].append({
-                            'record_id': record.id,
-                            'original': email_value,
-                            'fixed': cleaned_email
+                    if not email_value:
+                        continue
+                    
+                    # Validate the cleaned email
+                    validation_result = self._validate_email_format(cleaned_email, domain_verdicts=domain_verdicts)
+                    
+                    if validation_result['valid']:
+                        valid_count += 1
+                        results['valid_emails'].append({
+                            'record_id': row.id,
+                            'email': cleaned_email,
+                            'status': 'valid'
+                        })
+                    
+                        # Auto-fix if cleaned version is different
+                        if cleaned_email != email_value and validator.auto_fix_enabled:
+                            fixes.append((row.id, email_value, cleaned_email))
+                            fixed_count += 1
+                            results['auto_fixed'].append({
+                                'record_id': row.id,
+                                'original': email_value,
+                                'fixed': cleaned_email
+                            })
+                    else:
+                        invalid_count += 1
+                        results['invalid_emails'].append({
+                            'record_id': row.id,
+                            'email': email_value,
+                            'error': validation_result['error'],
+                            'suggestion': self._suggest_email_fix(email_value)
                         })
-                else:
-                    invalid_count += 1
-                    results['invalid_emails'].append({
-                        'record_id': record.id,
-                        'email': email_value,
-                        'error': validation_result['error'],
-                        'suggestion': self._suggest_email_fix(email_value)
-                    })
+            
+            # Write the collected fixes back in batches once the scan is done
+            self.env['datasniffr.fix.writer'].apply_fixes(
+                model_name, field_name, fixes, backup=validator.backup_invalid_values,
+                source=f'{validator._name},{validator.id}', batch_size=batch_size, checkpoint=checkpoint
+            )
+            self.env['datasniffr.normalization.entry'].persist_cache()
             
             # Update validator record
             validator.write({
@@ -167,6 +206,7 @@ class DataSniffRFieldValidator(models.Model):
                 'message': '❌ Email validation encountered an error!'
             }
     
+    @memoized_normalizer('clean_email')
     def _clean_email(self, email):
         """🧹 Clean email address"""
         if not email:
@@ -194,8 +234,28 @@ class DataSniffRFieldValidator(models.Model):
         
         return cleaned
     
-    def _validate_email_format(self, email):
-        """✅ Validate email format"""
+    def _validate_email_format(self, email, check_deliverability=True, domain_verdicts=None):
+        """✅ Validate email format
+        
+        Syntax is checked per address; deliverability per domain, through
+        the cached domain verdicts (``domain_verdicts`` when pre-fetched).
+        """
+        syntax = self._check_email_syntax(email)
+        if not syntax['valid'] or not check_deliverability:
+            return {key: value for key, value in syntax.items() if key != 'domain'}
+        
+        domain = syntax['domain']
+        if domain_verdicts is None or domain not in domain_verdicts:
+            domain_verdicts = self.env['datasniffr.email.domain'].get_verdicts([domain])
+        verdict, error = domain_verdicts[domain]
+        
+        if verdict in ACCEPTED_VERDICTS:
+            return {'valid': True}
+        return {'valid': False, 'error': error}
+    
+    @memoized_normalizer('email_syntax')
+    def _check_email_syntax(self, email):
+        """✅ Offline syntax check of an email, plus its lower-cased domain"""
         try:
             # Basic format check
             if not email or '@' not in email:
@@ -214,8 +274,8 @@ class DataSniffRFieldValidator(models.Model):
             
             # Advanced validation with email-validator library
             try:
-                validate_email(email)
-                return {'valid': True}
+                validate_email(email, check_deliverability=False)
+                return {'valid': True, 'domain': domain.lower()}
             except EmailNotValidError as e:
                 return {'valid': False, 'error': str(e)}
             
@@ -249,7 +309,7 @@ class DataSniffRFieldValidator(models.Model):
         return None
     
     @api.model
-    def validate_phone_fields(self, model_name='res.partner', field_name='phone'):
+    def validate_phone_fields(self, model_name='res.partner', field_name='phone', batch_size=None, checkpoint=False):
         """📞 Validate and standardize phone numbers"""
         
         validator = self.create({
@@ -260,8 +320,7 @@ class DataSniffRFieldValidator(models.Model):
         })
         
         try:
-            Model = self.env[model_name]
-            records = Model.search([(field_name, '!=', False)])
+            chunks, country_codes = self._scan_with_country(model_name, field_name, chunked=True)
             
             results = {
                 'valid_phones': [],
@@ -274,46 +333,58 @@ class DataSniffRFieldValidator(models.Model):
             valid_count = 0
             invalid_count = 0
             fixed_count = 0
+            fixes = []
             
-            for record in records:
-                total_checked += 1
-                phone_value = getattr(record, field_name)
-                
-                if not phone_value:
-                    continue
+            for chunk in chunks:
+                # Each distinct (phone, country) of the chunk is parsed once
+                normalized_chunk = phone_engine.normalize_phones(
+                    [getattr(row, field_name) for row in chunk],
+                    [country_codes.get(getattr(row, 'country_id', None)) for row in chunk],
+                    normalize=self._normalize_phone
+                )
                 
-                # Clean and validate phone
-                cleaned_phone = self._clean_phone(phone_value)
-                validation_result = self._validate_phone_format(cleaned_phone, record)
-                
-                if validation_result['valid']:
-                    valid_count += 1
-                    standardized_phone = validation_result.get('standardized', cleaned_phone)
+                for row, normalized in zip(chunk, normalized_chunk):
+                    total_checked += 1
+                    phone_value = getattr(row, field_name)
                     
-                    results['valid_phones'].append({
-                        'record_id': record.id,
-                        'phone': standardized_phone,
-                        'status': 'valid'
-                    })
+                    if not phone_value:
+                        continue
                     
-                    # Auto-fix if standardized version is different
-                    if standardized_phone != phone_value and validator.auto_fix_enabled:
-                        self._backup_field_value(record, field_name, phone_value)
-                        record.write({field_name: standardized_phone})
-                        fixed_count += 1
-                        results['auto_fixed'].append({
-                            'record_id': record.id,
-                            'original': phone_value,
-                            'standardized': standardized_phone
+                    if normalized.valid:
+                        valid_count += 1
+                        standardized_phone = normalized.international or normalized.cleaned
+                        
+                        results['valid_phones'].append({
+                            'record_id': row.id,
+                            'phone': standardized_phone,
+                            'e164': normalized.e164,
+                            'status': 'valid'
+                        })
+                        
+                        # Auto-fix if standardized version is different
+                        if standardized_phone != phone_value and validator.auto_fix_enabled:
+                            fixes.append((row.id, phone_value, standardized_phone))
+                            fixed_count += 1
+                            results['auto_fixed'].append({
+                                'record_id': row.id,
+                                'original': phone_value,
+                                'standardized': standardized_phone
+                            })
+                    else:
+                        invalid_count += 1
+                        results['invalid_phones'].append({
+                            'record_id': row.id,
+                            'phone': phone_value,
+                            'error': normalized.error,
+                            'suggestion': self._suggest_phone_fix(phone_value)
                         })
-                else:
-                    invalid_count += 1
-                    results['invalid_phones'].append({
-                        'record_id': record.id,
-                        'phone': phone_value,
-                        'error': validation_result['error'],
-                        'suggestion': self._suggest_phone_fix(phone_value)
-                    })
+            
+            # Write the collected fixes back in batches once the scan is done
+            self.env['datasniffr.fix.writer'].apply_fixes(
+                model_name, field_name, fixes, backup=validator.backup_invalid_values,
+                source=f'{validator._name},{validator.id}', batch_size=batch_size, checkpoint=checkpoint
+            )
+            self.env['datasniffr.normalization.entry'].persist_cache()
             
             # Update validator record
             validator.write({
@@ -342,51 +413,51 @@ class DataSniffRFieldValidator(models.Model):
                 'message': '❌ Phone validation encountered an error!'
             }
     
+    def _scan_with_country(self, model_name, field_name, chunked=False):
+        """📖 Rows (or row chunks) of ``field_name`` (plus country_id when the
+        model has one) and a ``{country_id: code}`` lookup"""
+        
+        columns = ['id', field_name]
+        country_codes = {}
+        if 'country_id' in self.env[model_name]._fields:
+            columns.append('country_id')
+            country_codes = self.env['datasniffr.scan.reader'].get_country_codes()
+        
+        Reader = self.env['datasniffr.scan.reader']
+        scan = Reader.iter_chunks if chunked else Reader.iter_rows
+        return scan(model_name, columns, [(field_name, '!=', False)]), country_codes
+    
+    @memoized_normalizer('clean_phone')
     def _clean_phone(self, phone):
         """🧹 Clean phone number"""
         if not phone:
             return phone
         
         # Remove common formatting
-        cleaned = str(phone).strip()
-        cleaned = re.sub(r'[^\d\+\(\)\-\s]', '', cleaned)  # Keep only digits and basic formatting
-        
-        return cleaned
+        return phone_engine.clean_phone(phone)
+    
+    @memoized_normalizer('normalize_phone')
+    def _normalize_phone(self, phone, country_code=None):
+        """📞 Full phone engine result of one phone, as a dict"""
+        return phone_engine.normalize_phone(phone, country_code)._asdict()
     
-    def _validate_phone_format(self, phone, record=None):
+    @memoized_normalizer('validate_phone')
+    def _validate_phone_format(self, phone, record=None, country_code=None):
         """✅ Validate phone format using phonenumbers library"""
-        try:
-            if not phone:
-                return {'valid': False, 'error': 'Empty phone number'}
-            
-            # Try to determine country from record
-            country_code = None
-            if record and hasattr(record, 'country_id') and record.country_id:
-                country_code = record.country_id.code
-            
-            # Parse phone number
-            try:
-                parsed_phone = phonenumbers.parse(phone, country_code)
-                
-                if phonenumbers.is_valid_number(parsed_phone):
-                    # Format in international format
-                    standardized = phonenumbers.format_number(parsed_phone, phonenumbers.PhoneNumberFormat.INTERNATIONAL)
-                    return {
-                        'valid': True,
-                        'standardized': standardized
-                    }
-                else:
-                    return {'valid': False, 'error': 'Invalid phone number format'}
-                    
-            except phonenumbers.NumberParseException as e:
-                return {'valid': False, 'error': f'Parse error: {str(e)}'}
-            
-        except Exception as e:
-            # Fallback basic validation
-            if len(re.sub(r'[^\d]', '', phone)) >= 7:  # At least 7 digits
-                return {'valid': True, 'standardized': phone}
-            else:
-                return {'valid': False, 'error': 'Phone too short'}
+        
+        # Try to determine country from record
+        if not country_code and record and hasattr(record, 'country_id') and record.country_id:
+            country_code = record.country_id.code
+        
+        normalized = phone_engine.normalize_phone(phone, country_code)
+        if normalized.valid:
+            # Format in international format
+            return {
+                'valid': True,
+                'standardized': normalized.international or phone,
+                'e164': normalized.e164
+            }
+        return {'valid': False, 'error': normalized.error}
     
     def _suggest_phone_fix(self, invalid_phone):
         """💡 Suggest phone fix"""
@@ -405,7 +476,7 @@ class DataSniffRFieldValidator(models.Model):
         return f"Check format - found {len(digits_only)} digits"
     
     @api.model
-    def validate_vat_fields(self, model_name='res.partner', field_name='vat'):
+    def validate_vat_fields(self, model_name='res.partner', field_name='vat', batch_size=None, checkpoint=False):
         """💳 Validate VAT/Tax ID numbers"""
         
         validator = self.create({
@@ -416,8 +487,7 @@ class DataSniffRFieldValidator(models.Model):
         })
         
         try:
-            Model = self.env[model_name]
-            records = Model.search([(field_name, '!=', False)])
+            rows, country_codes = self._scan_with_country(model_name, field_name)
             
             results = {
                 'valid_vats': [],
@@ -429,22 +499,25 @@ class DataSniffRFieldValidator(models.Model):
             valid_count = 0
             invalid_count = 0
             fixed_count = 0
+            fixes = []
             
-            for record in records:
+            for row in rows:
                 total_checked += 1
-                vat_value = getattr(record, field_name)
+                vat_value = getattr(row, field_name)
                 
                 if not vat_value:
                     continue
                 
                 # Clean and validate VAT
                 cleaned_vat = self._clean_vat(vat_value)
-                validation_result = self._validate_vat_format(cleaned_vat, record)
+                validation_result = self._validate_vat_format(
+                    cleaned_vat, country_code=country_codes.get(getattr(row, 'country_id', None))
+                )
                 
                 if validation_result['valid']:
                     valid_count += 1
                     results['valid_vats'].append({
-                        'record_id': record.id,
+                        'record_id': row.id,
                         'vat': cleaned_vat,
                         'country': validation_result.get('country'),
                         'status': 'valid'
@@ -452,22 +525,28 @@ class DataSniffRFieldValidator(models.Model):
                     
                     # Auto-fix if cleaned version is different
                     if cleaned_vat != vat_value and validator.auto_fix_enabled:
-                        self._backup_field_value(record, field_name, vat_value)
-                        record.write({field_name: cleaned_vat})
+                        fixes.append((row.id, vat_value, cleaned_vat))
                         fixed_count += 1
                         results['auto_fixed'].append({
-                            'record_id': record.id,
+                            'record_id': row.id,
                             'original': vat_value,
                             'fixed': cleaned_vat
                         })
                 else:
                     invalid_count += 1
                     results['invalid_vats'].append({
-                        'record_id': record.id,
+                        'record_id': row.id,
                         'vat': vat_value,
                         'error': validation_result['error']
                     })
             
+            # Write the collected fixes back in batches once the scan is done
+            self.env['datasniffr.fix.writer'].apply_fixes(
+                model_name, field_name, fixes, backup=validator.backup_invalid_values,
+                source=f'{validator._name},{validator.id}', batch_size=batch_size, checkpoint=checkpoint
+            )
+            self.env['datasniffr.normalization.entry'].persist_cache()
+            
             # Update validator record
             validator.write({
                 'total_records_checked': total_checked,
@@ -495,6 +574,7 @@ class DataSniffRFieldValidator(models.Model):
                 'message': '❌ VAT validation encountered an error!'
             }
     
+    @memoized_normalizer('clean_vat')
     def _clean_vat(self, vat):
         """🧹 Clean VAT number"""
         if not vat:
@@ -505,15 +585,14 @@ class DataSniffRFieldValidator(models.Model):
         
         return cleaned
     
-    def _validate_vat_format(self, vat, record=None):
+    def _validate_vat_format(self, vat, record=None, country_code=None):
         """✅ Validate VAT format"""
         try:
             if not vat:
                 return {'valid': False, 'error': 'Empty VAT number'}
             
             # Basic format checks by country
-            country_code = None
-            if record and hasattr(record, 'country_id') and record.country_id:
+            if not country_code and record and hasattr(record, 'country_id') and record.country_id:
                 country_code = record.country_id.code
             
             # Simple validation patterns
@@ -542,30 +621,17 @@ class DataSniffRFieldValidator(models.Model):
         except Exception as e:
             return {'valid': False, 'error': f'Validation error: {str(e)}'}
     
-    def _backup_field_value(self, record, field_name, original_value):
-        """💾 Backup original field value before auto-fix"""
-        
-        if not self.backup_invalid_values:
-            return
-        
-        backup_data = {
-            'model': record._name,
-            'record_id': record.id,
-            'field_name': field_name,
-            'original_value': original_value,
-            'backup_date': datetime.now().isoformat()
-        }
-        
-        # Store in field_value_backup model (would need to be created)
-        try:
-            self.env['datasniffr.field.backup'].create(backup_data)
-        except:
-            # If backup model doesn't exist, log it
-            _logger.info(f"Backed up {record._name}.{field_name} for record {record.id}: {original_value}")
-    
     @api.model
-    def validate_custom_field(self, model_name, field_name, validation_rules):
-        """🎯 Validate field with custom rules"""
+    def validate_custom_field(self, model_name, field_name, validation_rules, stop_on_first_violation=False):
+        """🎯 Validate field with custom rules
+
+        Rules are compiled once. When Postgres can evaluate every rule the
+        whole check runs as one aggregate query, otherwise the field is
+        scanned in chunks and evaluated column-wise. Counts are exact; the
+        stored record lists are capped at ``CUSTOM_RESULT_SAMPLE_SIZE``.
+        With ``stop_on_first_violation`` the Python path stops checking a
+        value at its cheapest violation, so per-rule counts only report it.
+        """
         
         validator = self.create({
             'name': f'Custom Validation - {model_name}.{field_name}',
@@ -576,45 +642,30 @@ class DataSniffRFieldValidator(models.Model):
         })
         
         try:
+            ruleset = rule_engine.compile_rules(validation_rules)
             Model = self.env[model_name]
-            records = Model.search([(field_name, '!=', False)])
+            field = Model._fields.get(field_name)
             
-            results = {
-                'valid_records': [],
-                'invalid_records': [],
-                'rule_violations': {}
-            }
+            predicates = None
+            if field is not None and field.store and field.type in ('char', 'text') and not field.translate:
+                predicates = ruleset.sql_predicates(f'"{Model._table}"."{field_name}"')
             
-            total_checked = 0
-            valid_count = 0
-            invalid_count = 0
+            if predicates is not None:
+                summary = self._custom_validation_in_sql(Model, field_name, predicates)
+            else:
+                summary = self._custom_validation_batched(model_name, field_name, ruleset, stop_on_first_violation)
             
-            for record in records:
-                total_checked += 1
-                field_value = getattr(record, field_name)
-                
-                validation_result = self._apply_custom_validation(field_value, validation_rules)
-                
-                if validation_result['valid']:
-                    valid_count += 1
-                    results['valid_records'].append({
-                        'record_id': record.id,
-                        'value': field_value
-                    })
-                else:
-                    invalid_count += 1
-                    results['invalid_records'].append({
-                        'record_id': record.id,
-                        'value': field_value,
-                        'violations': validation_result['violations']
-                    })
-                    
-                    # Track rule violations
-                    for violation in validation_result['violations']:
-                        rule_name = violation['rule']
-                        if rule_name not in results['rule_violations']:
-                            results['rule_violations'][rule_name] = 0
-                        results['rule_violations'][rule_name] += 1
+            total_checked = summary['total_checked']
+            invalid_count = summary['invalid_count']
+            valid_count = total_checked - invalid_count
+            
+            results = {
+                'valid_records': summary['valid_records'],
+                'invalid_records': summary['invalid_records'],
+                'rule_violations': {name: count for name, count in summary['rule_violations'].items() if count},
+                'evaluated_in': summary['evaluated_in'],
+                'sample_limit': CUSTOM_RESULT_SAMPLE_SIZE
+            }
             
             # Update validator record
             validator.write({
@@ -642,50 +693,132 @@ class DataSniffRFieldValidator(models.Model):
                 'message': '❌ Custom validation encountered an error!'
             }
     
-    def _apply_custom_validation(self, value, rules):
-        """🎯 Apply custom validation rules"""
+    def _custom_validation_in_sql(self, Model, field_name, predicates):
+        """🗄️ Every rule pushed down: one aggregate pass plus two capped sample reads"""
         
-        violations = []
+        cr = self.env.cr
+        Model.flush(fnames=[field_name])
         
-        for rule in rules:
-            rule_type = rule.get('type')
-            rule_name = rule.get('name', rule_type)
-            
-            if rule_type == 'required' and not value:
-                violations.append({
-                    'rule': rule_name,
-                    'message': 'Field is required but empty'
-                })
+        query = Model._where_calc([(field_name, '!=', False)])
+        Model._apply_ir_rules(query, 'read')
+        from_clause, where_clause, where_params = query.get_sql()
+        where_sql = f' WHERE {where_clause}' if where_clause else ' WHERE true'
+        
+        rule_params = [param for _rule, _predicate, params in predicates for param in params]
+        any_violation = f"coalesce(({' OR '.join(predicate for _rule, predicate, _params in predicates) or 'false'}), false)"
+        column = f'"{Model._table}"."{field_name}"'
+        
+        counts = ', '.join(f'count(*) FILTER (WHERE {predicate})' for _rule, predicate, _params in predicates)
+        cr.execute(
+            f'SELECT count(*), count(*) FILTER (WHERE {any_violation})'
+            f'{", " + counts if counts else ""} FROM {from_clause}{where_sql}',
+            rule_params + rule_params + where_params
+        )
+        totals = cr.fetchone()
+        
+        rule_violations = {}
+        for (rule, _predicate, _params), count in zip(predicates, totals[2:]):
+            rule_violations[rule.name] = rule_violations.get(rule.name, 0) + count
+        
+        flags = ''.join(f', coalesce({predicate}, false)' for _rule, predicate, _params in predicates)
+        cr.execute(
+            f'SELECT "{Model._table}"."id", {column}{flags} FROM {from_clause}{where_sql} AND {any_violation}'
+            f' ORDER BY "{Model._table}"."id" LIMIT %s',
+            rule_params + where_params + rule_params + [CUSTOM_RESULT_SAMPLE_SIZE]
+        )
+        by_position = sorted(enumerate(predicates), key=lambda item: item[1][0].position)
+        invalid_records = [{
+            'record_id': row[0],
+            'value': row[1],
+            'violations': [
+                {'rule': rule.name, 'message': rule.message}
+                for index, (rule, _predicate, _params) in by_position if row[2 + index]
+            ]
+        } for row in cr.fetchall()]
+        
+        cr.execute(
+            f'SELECT "{Model._table}"."id", {column} FROM {from_clause}{where_sql} AND NOT {any_violation}'
+            f' ORDER BY "{Model._table}"."id" LIMIT %s',
+            where_params + rule_params + [CUSTOM_RESULT_SAMPLE_SIZE]
+        )
+        valid_records = [{'record_id': row[0], 'value': row[1]} for row in cr.fetchall()]
+        
+        return {
+            'total_checked': totals[0],
+            'invalid_count': totals[1],
+            'rule_violations': rule_violations,
+            'valid_records': valid_records,
+            'invalid_records': invalid_records,
+            'evaluated_in': 'sql'
+        }
+    
+    def _custom_validation_batched(self, model_name, field_name, ruleset, stop_on_first_violation=False):
+        """📊 Chunked column scan, each chunk evaluated by the compiled rule set"""
+        
+        summary = {
+            'total_checked': 0,
+            'invalid_count': 0,
+            'rule_violations': {name: 0 for name in ruleset.rule_names},
+            'valid_records': [],
+            'invalid_records': [],
+            'evaluated_in': 'python'
+        }
+        
+        chunks = self.env['datasniffr.scan.reader'].iter_chunks(model_name, ['id', field_name], [(field_name, '!=', False)])
+        for chunk in chunks:
+            ids, values = zip(*chunk)
+            masks = ruleset.evaluate_batch(values, stop_on_first=stop_on_first_violation)
             
-            elif rule_type == 'min_length' and value and len(str(value)) < rule.get('value', 0):
-                violations.append({
-                    'rule': rule_name,
-                    'message': f'Value too short (minimum {rule.get("value")} characters)'
-                })
+            invalid = np.zeros(len(values), dtype=bool)
+            for rule, mask in masks:
+                invalid |= mask
+                summary['rule_violations'][rule.name] += int(mask.sum())
             
-            elif rule_type == 'max_length' and value and len(str(value)) > rule.get('value', 999):
-                violations.append({
-                    'rule': rule_name,
-                    'message': f'Value too long (maximum {rule.get("value")} characters)'
-                })
+            summary['total_checked'] += len(values)
+            summary['invalid_count'] += int(invalid.sum())
             
-            elif rule_type == 'regex' and value and not re.match(rule.get('pattern', ''), str(value)):
-                violations.append({
-                    'rule': rule_name,
-                    'message': f'Value does not match required pattern'
-                })
-            
-            elif rule_type == 'contains' and value and rule.get('value', '') not in str(value):
-                violations.append({
-                    'rule': rule_name,
-                    'message': f'Value must contain "{rule.get("value")}"'
+            # Only the capped samples pay for per-record dicts
+            by_position = sorted(masks, key=lambda item: item[0].position)
+            for index in np.flatnonzero(invalid)[:CUSTOM_RESULT_SAMPLE_SIZE - len(summary['invalid_records'])]:
+                summary['invalid_records'].append({
+                    'record_id': ids[index],
+                    'value': values[index],
+                    'violations': [
+                        {'rule': rule.name, 'message': rule.message}
+                        for rule, mask in by_position if mask[index]
+                    ]
                 })
+            for index in np.flatnonzero(~invalid)[:CUSTOM_RESULT_SAMPLE_SIZE - len(summary['valid_records'])]:
+                summary['valid_records'].append({'record_id': ids[index], 'value': values[index]})
+        
+        return summary
+    
+    def _apply_custom_validation(self, value, rules):
+        """🎯 Apply custom validation rules (a rule list or a compiled rule set)"""
+        
+        violations = rule_engine.compile_rules(rules).evaluate(value)
         
         return {
             'valid': len(violations) == 0,
             'violations': violations
         }
     
+    def _is_invalid_email(self, value, row=None):
+        """🧮 Quality rule: email that stays invalid after cleaning (syntax only)"""
+        return bool(value) and not self._validate_email_format(self._clean_email(value), check_deliverability=False)['valid']
+    
+    def _is_invalid_phone(self, value, row=None):
+        """🧮 Quality rule: phone that doesn't parse for the record's country"""
+        if not value:
+            return False
+        country_id = getattr(row, 'country_id', None)
+        country_code = self.env['res.country'].browse(country_id).code if country_id else None
+        return not self._validate_phone_format(self._clean_phone(value), country_code=country_code)['valid']
+    
+    def _is_missing_name(self, value, row=None):
+        """🧮 Quality rule: blank name"""
+        return not str(value or '').strip()
+    
     @api.model
     def get_validation_dashboard(self):
         """📊 Get field validation dashboard"""
@@ -729,4 +862,242 @@ class DataSniffRFieldValidator(models.Model):
                 'date': validator.create_date.isoformat()
             })
         
-        return dashboard
\ No newline at end of file
+        return dashboard
+
+class DataSniffRQualityCounter(models.Model):
+    _name = 'datasniffr.quality.counter'
+    _description = 'DataSniffR Quality Counter - Live Offender Count Per Rule 🧮'
+    _order = 'model_name, rule'
+    
+    model_name = fields.Char(string='Model', required=True, index=True)
+    rule = fields.Char(string='Rule', required=True, index=True)
+    offending_count = fields.Integer(string='Offending Records', default=0)
+    seeded_at = fields.Datetime(string='Seeded At')
+    
+    _sql_constraints = [
+        ('model_rule_unique', 'unique(model_name, rule)', 'One counter per model and rule!'),
+    ]
+    
+    @api.model
+    def _is_seeded(self, model_name):
+        """🧮 Counters only move once a full rebuild has seeded them"""
+        
+        self.env.cr.execute(
+            "SELECT 1 FROM datasniffr_quality_counter WHERE model_name = %s AND rule = %s",
+            (model_name, RECORDS_COUNTER)
+        )
+        return bool(self.env.cr.fetchone())
+    
+    @api.model
+    def _scan_columns(self, model_name):
+        """📖 Columns the rules of a model read"""
+        
+        Model = self.env[model_name]
+        columns = ['id'] + sorted({field for field, _predicate in QUALITY_RULES[model_name].values()})
+        for extra in ('active', 'country_id'):
+            if extra in Model._fields:
+                columns.append(extra)
+        return columns
+    
+    @api.model
+    def _evaluate_rows(self, model_name, rows, rules=None):
+        """🧮 ``{rule: {offending ids}}`` for the given scan rows
+        
+        Archived rows never offend.
+        """
+        
+        Validator = self.env['datasniffr.field.validator']
+        rules = rules or list(QUALITY_RULES[model_name])
+        offenders = {rule: set() for rule in rules}
+        
+        for row in rows:
+            if not getattr(row, 'active', True):
+                continue
+            for rule in rules:
+                field, predicate = QUALITY_RULES[model_name][rule]
+                if getattr(Validator, predicate)(getattr(row, field), row):
+                    offenders[rule].add(row.id)
+        
+        return offenders
+    
+    @api.model
+    def _apply_deltas(self, model_name, deltas):
+        """➕ Add ``{rule: delta}`` to the running counters"""
+        
+        rows = [(model_name, rule, delta) for rule, delta in deltas.items() if delta]
+        if rows:
+            execute_values(self.env.cr, """
+                UPDATE datasniffr_quality_counter AS c
+                   SET offending_count = c.offending_count + d.delta
+                  FROM (VALUES %s) AS d(model_name, rule, delta)
+                 WHERE c.model_name = d.model_name AND c.rule = d.rule
+            """, rows)
+            self.invalidate_cache()
+    
+    @api.model
+    def _track_records(self, records, changed_fields=None, was_active=None):
+        """🧮 Re-evaluate rules touched by a create/write of ``records``
+        
+        ``changed_fields`` None means every rule (creation). ``was_active``
+        is the set of ids active before the write, when active changed.
+        """
+        
+        model_name = records._name
+        if not records or not self._is_seeded(model_name):
+            return
+        
+        rules = [
+            rule for rule, (field, _predicate) in QUALITY_RULES[model_name].items()
+            if changed_fields is None or field in changed_fields or changed_fields & {'active', 'country_id'}
+        ]
+        rows = self.env['datasniffr.scan.reader'].read_rows(
+            model_name, self._scan_columns(model_name), [('id', 'in', records.ids)], active_test=False)
+        offenders = self._evaluate_rows(model_name, rows, rules)
+        
+        cr = self.env.cr
+        deltas = {}
+        for rule in rules:
+            added = removed = 0
+            if offenders[rule]:
+                added = len(execute_values(cr, """
+                    INSERT INTO datasniffr_quality_offender (model_name, rule, res_id) VALUES %s
+                    ON CONFLICT (model_name, rule, res_id) DO NOTHING RETURNING res_id
+                """, [(model_name, rule, res_id) for res_id in offenders[rule]], fetch=True))
+            clean_ids = tuple(set(records.ids) - offenders[rule])
+            if clean_ids:
+                cr.execute("""
+                    DELETE FROM datasniffr_quality_offender
+                     WHERE model_name = %s AND rule = %s AND res_id IN %s
+                """, (model_name, rule, clean_ids))
+                removed = cr.rowcount
+            deltas[rule] = added - removed
+        
+        active_now = {row.id for row in rows if getattr(row, 'active', True)}
+        if changed_fields is None:
+            deltas[RECORDS_COUNTER] = len(active_now)
+        elif was_active is not None:
+            deltas[RECORDS_COUNTER] = len(active_now) - len(was_active & set(records.ids))
+        
+        self._apply_deltas(model_name, deltas)
+    
+    @api.model
+    def _forget_records(self, records):
+        """🗑️ Drop deleted records from the offender sets and counters"""
+        
+        model_name = records._name
+        if not records or not self._is_seeded(model_name):
+            return
+        
+        self.env.cr.execute("""
+            DELETE FROM datasniffr_quality_offender
+             WHERE model_name = %s AND res_id IN %s
+         RETURNING rule
+        """, (model_name, tuple(records.ids)))
+        deltas = {}
+        for (rule,) in self.env.cr.fetchall():
+            deltas[rule] = deltas.get(rule, 0) - 1
+        
+        active_field = 'active' in records._fields
+        deltas[RECORDS_COUNTER] = -len(records.filtered('active') if active_field else records)
+        self._apply_deltas(model_name, deltas)
+    
+    @api.model
+    def rebuild_quality_counters(self, model_name='res.partner', batch_size=10000):
+        """🏗️ Full scan that (re)seeds the counters and offender sets of a model"""
+        
+        cr = self.env.cr
+        cr.execute("DELETE FROM datasniffr_quality_offender WHERE model_name = %s", (model_name,))
+        cr.execute("DELETE FROM datasniffr_quality_counter WHERE model_name = %s", (model_name,))
+        
+        totals = {rule: 0 for rule in QUALITY_RULES[model_name]}
+        totals[RECORDS_COUNTER] = 0
+        
+        for chunk in self.env['datasniffr.scan.reader'].iter_chunks(
+                model_name, self._scan_columns(model_name), chunk_size=batch_size):
+            totals[RECORDS_COUNTER] += len(chunk)
+            for rule, ids in self._evaluate_rows(model_name, chunk).items():
+                totals[rule] += len(ids)
+                if ids:
+                    execute_values(
+                        cr,
+                        "INSERT INTO datasniffr_quality_offender (model_name, rule, res_id) VALUES %s",
+                        [(model_name, rule, res_id) for res_id in ids],
+                        page_size=5000
+                    )
+        
+        self.create([{
+            'model_name': model_name,
+            'rule': rule,
+            'offending_count': count,
+            'seeded_at': fields.Datetime.now(),
+        } for rule, count in totals.items()])
+        
+        return {
+            'success': True,
+            'model': model_name,
+            'counters': totals,
+            'message': f'🧮 Quality counters seeded for {totals[RECORDS_COUNTER]} {model_name} records!'
+        }
+    
+    @api.model
+    def get_model_quality(self, model_name):
+        """🧮 ``{rule: offending_count}`` plus RECORDS_COUNTER, or None when
+        the model isn't seeded - one indexed read"""
+        
+        self.env.cr.execute(
+            "SELECT rule, offending_count FROM datasniffr_quality_counter WHERE model_name = %s",
+            (model_name,)
+        )
+        counters = dict(self.env.cr.fetchall())
+        return counters if RECORDS_COUNTER in counters else None
+    
+    @api.model
+    def get_offending_ids(self, model_name, rule, limit=100):
+        """🔎 Ids currently breaking a rule"""
+        
+        self.env.cr.execute("""
+            SELECT res_id FROM datasniffr_quality_offender
+             WHERE model_name = %s AND rule = %s
+             ORDER BY res_id LIMIT %s
+        """, (model_name, rule, limit))
+        return [row[0] for row in self.env.cr.fetchall()]
+
+
+class DataSniffRQualityOffender(models.Model):
+    _name = 'datasniffr.quality.offender'
+    _description = 'DataSniffR Quality Offender - Record Breaking a Quality Rule 🚩'
+    
+    model_name = fields.Char(string='Model', required=True, index=True)
+    rule = fields.Char(string='Rule', required=True, index=True)
+    res_id = fields.Integer(string='Record ID', required=True, index=True)
+    
+    _sql_constraints = [
+        ('offender_unique', 'unique(model_name, rule, res_id)', 'A record offends a rule only once!'),
+    ]
+
+
+class ResPartnerQualityCounters(models.Model):
+    _inherit = 'res.partner'
+    
+    @api.model_create_multi
+    def create(self, vals_list):
+        """🧮 Count quality offences of new partners"""
+        partners = super().create(vals_list)
+        self.env['datasniffr.quality.counter']._track_records(partners)
+        return partners
+    
+    def write(self, vals):
+        """🧮 Re-check quality rules when watched fields change"""
+        watched = {field for field, _predicate in QUALITY_RULES[self._name].values()} | {'active', 'country_id'}
+        if not watched & set(vals):
+            return super().write(vals)
+        
+        was_active = set(self.filtered('active').ids) if 'active' in vals else None
+        result = super().write(vals)
+        self.env['datasniffr.quality.counter']._track_records(self, set(vals), was_active)
+        return result
+    
+    def unlink(self):
+        """🧮 Forget deleted partners"""
+        self.env['datasniffr.quality.counter']._forget_records(self)
+        return super().unlink()
@@ -0,0 +1,286 @@
+#!/usr/bin/env python3
+"""
+DataSniffR Fix Writer 🖊️⚡
+=========================
+
+Batched write-back for validator and format fixer auto-fixes!
+Fixes are collected during the scan and flushed in set-based SQL.
+
+Features:
+- 🧺 Identical target values grouped into one VALUES row
+- ⚡ One UPDATE ... FROM (VALUES ...) per batch instead of one write per record
+- 📼 Originals kept in a compact journal: one compressed row per fix run
+- 🔎 Point lookups by record id, bulk restore of a whole run
+- 🎚️ Tunable batch size (datasniffr.fix_batch_size)
+- 🚩 Optional checkpoint commit after every batch
+- 🔄 Stored computes, quality counters and match keys kept in sync
+
+mmm lol 🐶💾 - Fix in bulk, sleep like a pup! 🖊️✨
+"""
+
+from odoo import models, fields, api
+import json
+import logging
+import zlib
+import numpy as np
+import psycopg2
+from psycopg2 import sql
+from psycopg2.extras import execute_values
+
+from .datasniffr_duplicate_hunter import MATCH_KEY_FIELDS
+from .datasniffr_field_validator import QUALITY_RULES
+
+_logger = logging.getLogger(__name__)
+
+# Fixes written per batch
+FIX_BATCH_SIZE = 5000
+FIX_BATCH_SIZE_PARAM = 'datasniffr.fix_batch_size'
+
+
+class DataSniffRFixJournal(models.Model):
+    _name = 'datasniffr.fix.journal'
+    _description = 'DataSniffR Fix Journal - Compressed Backup of One Fix Run 💾'
+    _order = 'id desc'
+
+    model = fields.Char(string='Model', required=True, index=True)
+    field_name = fields.Char(string='Field', required=True)
+    source = fields.Char(string='Fixed By', help='Validator or fixer run, as "model,id"')
+    entry_count = fields.Integer(string='Values Backed Up', default=0)
+    min_record_id = fields.Integer(string='Lowest Record ID', index=True)
+    max_record_id = fields.Integer(string='Highest Record ID', index=True)
+    # Sorted, delta-encoded int64 ids and aligned JSON value lists, zlib-compressed
+    record_ids_blob = fields.Binary(string='Record IDs', attachment=False)
+    old_values_blob = fields.Binary(string='Original Values', attachment=False)
+    new_values_blob = fields.Binary(string='Fixed Values', attachment=False)
+    backup_date = fields.Datetime(string='Backup Date', default=fields.Datetime.now)
+    restored_at = fields.Datetime(string='Restored At')
+
+    @api.model
+    def _append(self, model_name, field_name, fixes, source=False):
+        """📼 One journal row holding every ``(record_id, original, fixed)`` of ``fixes``
+
+        Returns the new journal id. Raw INSERT, so a run costs one statement
+        however many values it backs up.
+        """
+
+        if not fixes:
+            return False
+
+        entries = sorted({record_id: (original, fixed) for record_id, original, fixed in fixes}.items())
+        ids = np.fromiter((record_id for record_id, _values in entries), dtype=np.int64, count=len(entries))
+
+        self.env.cr.execute("""
+            INSERT INTO datasniffr_fix_journal
+                (model, field_name, source, entry_count, min_record_id, max_record_id,
+                 record_ids_blob, old_values_blob, new_values_blob, backup_date,
+                 create_uid, create_date, write_uid, write_date)
+            VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, now() at time zone 'UTC',
+                    %s, now() at time zone 'UTC', %s, now() at time zone 'UTC')
+            RETURNING id
+        """, (
+            model_name, field_name, source or None, len(entries), int(ids[0]), int(ids[-1]),
+            psycopg2.Binary(_pack_ids(ids)),
+            psycopg2.Binary(_pack_values([values[0] for _record_id, values in entries])),
+            psycopg2.Binary(_pack_values([values[1] for _record_id, values in entries])),
+            self.env.uid, self.env.uid,
+        ))
+        return self.env.cr.fetchone()[0]
+
+    def _read_entries(self):
+        """📖 ``(ids array, original values, fixed values)`` of one journal"""
+
+        self.ensure_one()
+        self.env.cr.execute("""
+            SELECT record_ids_blob, old_values_blob, new_values_blob
+              FROM datasniffr_fix_journal WHERE id = %s
+        """, (self.id,))
+        ids_blob, old_blob, new_blob = self.env.cr.fetchone()
+        return _unpack_ids(ids_blob), _unpack_values(old_blob), _unpack_values(new_blob)
+
+    @api.model
+    def lookup_record(self, model_name, record_id, field_name=None):
+        """🔎 Backed-up values of one record, newest first
+
+        The id range columns prune journals through their index, then a
+        binary search finds the record inside each candidate.
+        """
+
+        domain = [
+            ('model', '=', model_name),
+            ('min_record_id', '<=', record_id),
+            ('max_record_id', '>=', record_id),
+        ]
+        if field_name:
+            domain.append(('field_name', '=', field_name))
+
+        history = []
+        for journal in self.search(domain):
+            ids, old_values, new_values = journal._read_entries()
+            position = int(np.searchsorted(ids, record_id))
+            if position < len(ids) and ids[position] == record_id:
+                history.append({
+                    'journal_id': journal.id,
+                    'field_name': journal.field_name,
+                    'original_value': old_values[position],
+                    'fixed_value': new_values[position],
+                    'backup_date': journal.backup_date,
+                    'source': journal.source,
+                })
+
+        return history
+
+    def action_restore(self, batch_size=None, checkpoint=False):
+        """⏪ Put every original value of the journals back, in bulk"""
+
+        Writer = self.env['datasniffr.fix.writer']
+        restored = 0
+
+        # Newest run first so values fixed twice end up at their oldest original
+        for journal in self.sorted('id', reverse=True):
+            ids, old_values, new_values = journal._read_entries()
+            restored += Writer.apply_fixes(
+                journal.model, journal.field_name,
+                [(int(record_id), fixed, original) for record_id, original, fixed in zip(ids, old_values, new_values)],
+                backup=False, batch_size=batch_size, checkpoint=checkpoint
+            )
+            journal.restored_at = fields.Datetime.now()
+
+        return {
+            'success': True,
+            'journals_restored': len(self),
+            'values_restored': restored,
+            'message': f'⏪ {restored} original values restored!'
+        }
+
+
+def _pack_ids(ids):
+    """🗜️ Sorted ids as zlib-compressed int64 deltas"""
+    return zlib.compress(np.diff(ids, prepend=0).astype('<i8').tobytes())
+
+
+def _unpack_ids(blob):
+    return np.cumsum(np.frombuffer(zlib.decompress(bytes(blob)), dtype='<i8'))
+
+
+def _pack_values(values):
+    """🗜️ A value column as zlib-compressed JSON"""
+    return zlib.compress(json.dumps(values, separators=(',', ':'), default=str).encode())
+
+
+def _unpack_values(blob):
+    return json.loads(zlib.decompress(bytes(blob)))
+
+
+class DataSniffRFixWriter(models.AbstractModel):
+    _name = 'datasniffr.fix.writer'
+    _description = 'DataSniffR Fix Writer - Batched Auto-Fix Write-Back 🖊️'
+
+    @api.model
+    def _get_batch_size(self, batch_size=None):
+        """🎚️ Explicit size, else the system parameter, else FIX_BATCH_SIZE"""
+
+        if not batch_size:
+            batch_size = int(self.env['ir.config_parameter'].sudo().get_param(FIX_BATCH_SIZE_PARAM, FIX_BATCH_SIZE))
+        return max(1, int(batch_size))
+
+    @api.model
+    def apply_fixes(self, model_name, field_name, fixes, backup=True, source=False, batch_size=None, checkpoint=False):
+        """🖊️ Write ``fixes`` (``[(record_id, original, fixed)]``) batch by batch
+
+        The originals are journaled first, as one compressed row per run.
+        With ``checkpoint`` the journal and then each batch are committed,
+        so an interrupted run keeps the batches already done. Don't call this while a scan reader
+        cursor is still open. Returns the number of records written.
+        """
+
+        if not fixes:
+            return 0
+
+        Model = self.env[model_name]
+        batch_size = self._get_batch_size(batch_size)
+
+        # Pending ORM writes must hit the database before raw SQL overwrites them
+        Model.flush(fnames=[field_name])
+
+        # The whole run is journaled before the first write
+        if backup:
+            self._backup_values(model_name, field_name, fixes, source)
+            if checkpoint:
+                self.env.cr.commit()
+
+        # Related/computed fields have no column to UPDATE; their inverse runs through the ORM
+        field = Model._fields[field_name]
+        column_write = field.store and field.column_type
+
+        applied = 0
+        for start in range(0, len(fixes), batch_size):
+            batch = fixes[start:start + batch_size]
+            if column_write:
+                applied += self._write_batch(Model, field_name, batch)
+                self._sync_after_write(Model.browse([record_id for record_id, _original, _fixed in batch]), field_name)
+            else:
+                applied += self._write_batch_orm(Model, field_name, batch)
+
+            if checkpoint:
+                self.env.cr.commit()
+                _logger.info(f"Fix write-back checkpoint: {start + len(batch)}/{len(fixes)} {model_name}.{field_name}")
+
+        return applied
+
+    def _write_batch(self, Model, field_name, batch):
+        """⚡ One UPDATE for the batch, identical fixed values sharing a row"""
+
+        groups = {}
+        for record_id, _original, fixed in batch:
+            groups.setdefault(fixed, []).append(record_id)
+
+        assignments = [sql.SQL('{column} = v.value').format(column=sql.Identifier(field_name))]
+        if Model._log_access:
+            assignments.append(sql.SQL("write_date = (now() at time zone 'UTC')"))
+            assignments.append(sql.SQL('write_uid = {uid}').format(uid=sql.Literal(self.env.uid)))
+
+        cr = self.env.cr
+        query = sql.SQL("""
+            UPDATE {table} AS t
+               SET {assignments}
+              FROM (VALUES %s) AS v(value, ids)
+             WHERE t.id = ANY(v.ids)
+            RETURNING t.id
+        """).format(table=sql.Identifier(Model._table), assignments=sql.SQL(', ').join(assignments))
+
+        rows = execute_values(
+            cr, query.as_string(cr._obj), list(groups.items()),
+            template='(%s, %s::int[])', page_size=len(groups), fetch=True
+        )
+        return len(rows)
+
+    def _write_batch_orm(self, Model, field_name, batch):
+        """🐢 One ORM write per distinct fixed value, for fields without a column"""
+
+        groups = {}
+        for record_id, _original, fixed in batch:
+            groups.setdefault(fixed, []).append(record_id)
+
+        for fixed, record_ids in groups.items():
+            Model.browse(record_ids).write({field_name: fixed})
+        return len(batch)
+
+    @api.model
+    def _backup_values(self, model_name, field_name, fixes, source=False):
+        """💾 Journal the original values of ``fixes`` in one compressed row"""
+
+        return self.env['datasniffr.fix.journal']._append(model_name, field_name, fixes, source)
+
+    def _sync_after_write(self, records, field_name):
+        """🔄 Redo what ORM write hooks would have done for the raw UPDATE"""
+
+        records.invalidate_cache(fnames=[field_name], ids=records.ids)
+
+        # Stored computed fields depending on the field, recomputed as a batch
+        records.modified([field_name])
+        self.env['base'].flush()
+
+        if records._name in QUALITY_RULES:
+            self.env['datasniffr.quality.counter']._track_records(records, {field_name})
+        if records._name == 'res.partner' and field_name in MATCH_KEY_FIELDS:
+            self.env['datasniffr.match.key']._refresh_partner_keys(records)
@@ -8,13 +8,16 @@ Transform messy data into beautiful, consistent formats!
 
 Features:
 - 🔤 Text format standardization
-- 📞 Phone number formatting
+- 📞 Phone number formatting (one parse per distinct number)
 - 📧 Email cleanup and validation
 - 💰 Currency format fixing
 - 📅 Date format standardization
 - 🏠 Address format consistency
 - 🤖 AI-powered format suggestions
 - 📊 Format pattern learning
+- 📖 Columnar scans of just the fixed field
+- 🖊️ Fixes written back in batches with bulk backups
+- 🧠 Cleaner results memoized in a shared process-wide cache
 
 mmm lol 🐶💾 - Making data beautiful, one format at a time! 🔧✨
 """
@@ -23,8 +26,9 @@ from odoo import models, fields, api
 import json
 import logging
 import re
-from datetime import datetime
-import phonenumbers
+
+from . import datasniffr_phone_engine as phone_engine
+from .datasniffr_normalization_cache import memoized_normalizer
 
 _logger = logging.getLogger(__name__)
 
@@ -75,7 +79,7 @@ class DataSniffRFormatFixer(models.Model):
                 record.improvement_score = 0.0
     
     @api.model
-    def fix_phone_number_formats(self, model_name='res.partner'):
+    def fix_phone_number_formats(self, model_name='res.partner', batch_size=None, checkpoint=False):
         """📞 Fix and standardize phone number formats"""
         
         fixer = self.create({
@@ -86,7 +90,13 @@ class DataSniffRFormatFixer(models.Model):
         
         try:
             Model = self.env[model_name]
-            records = Model.search([('phone', '!=', False)])
+            Reader = self.env['datasniffr.scan.reader']
+            columns = ['id', 'phone']
+            country_codes = {}
+            if 'country_id' in Model._fields:
+                columns.append('country_id')
+                country_codes = Reader.get_country_codes()
+            chunks = Reader.iter_chunks(model_name, columns, [('phone', '!=', False)])
             
             fix_results = {
                 'standardized_phones': [],
@@ -97,40 +107,54 @@ class DataSniffRFormatFixer(models.Model):
             
             total_processed = 0
             fixes_applied = 0
+            fixes = []
             
-            for record in records:
-                total_processed += 1
-                original_phone = record.phone
-                
-                # Attempt to fix and standardize phone
-                fixed_phone = self._fix_phone_format(original_phone, record)
+            for chunk in chunks:
+                # Each distinct (phone, country) of the chunk is parsed once
+                normalized_chunk = phone_engine.normalize_phones(
+                    [row.phone for row in chunk],
+                    [country_codes.get(getattr(row, 'country_id', None)) for row in chunk],
+                    normalize=self._normalize_phone
+                )
                 
-                if fixed_phone and fixed_phone != original_phone:
-                    if fixer.backup_original_values:
-                        self._backup_field_value(record, 'phone', original_phone)
+                for row, normalized in zip(chunk, normalized_chunk):
+                    total_processed += 1
+                    original_phone = row.phone
                     
-                    if fixer.auto_apply_fixes:
-                        record.phone = fixed_phone
-                        fixes_applied += 1
+                    # Fixed and standardized phone from the batch parse
+                    fixed_phone = normalized.fixed
+                    
+                    if fixed_phone and fixed_phone != original_phone:
+                        if fixer.auto_apply_fixes:
+                            fixes.append((row.id, original_phone, fixed_phone))
+                            fixes_applied += 1
+                            
+                            fix_results['standardized_phones'].append({
+                                'record_id': row.id,
+                                'original': original_phone,
+                                'fixed': fixed_phone,
+                                'country': normalized.region,
+                                'e164': normalized.e164
+                            })
                         
-                        fix_results['standardized_phones'].append({
-                            'record_id': record.id,
-                            'original': original_phone,
-                            'fixed': fixed_phone,
-                            'country': self._detect_phone_country(fixed_phone)
-                        })
+                        # Learn format patterns
+                        pattern = normalized.pattern
+                        if pattern:
+                            fix_results['format_patterns'][pattern] = fix_results['format_patterns'].get(pattern, 0) + 1
                     
-                    # Learn format patterns
-                    pattern = self._extract_phone_pattern(original_phone)
-                    if pattern:
-                        fix_results['format_patterns'][pattern] = fix_results['format_patterns'].get(pattern, 0) + 1
-                
-                elif not fixed_phone:
-                    fix_results['invalid_phones'].append({
-                        'record_id': record.id,
-                        'phone': original_phone,
-                        'suggestion': self._suggest_phone_fix(original_phone)
-                    })
+                    elif not fixed_phone:
+                        fix_results['invalid_phones'].append({
+                            'record_id': row.id,
+                            'phone': original_phone,
+                            'suggestion': self._suggest_phone_fix(original_phone)
+                        })
+            
+            # Write the collected fixes back in batches once the scan is done
+            self.env['datasniffr.fix.writer'].apply_fixes(
+                model_name, 'phone', fixes, backup=fixer.backup_original_values,
+                source=f'{fixer._name},{fixer.id}', batch_size=batch_size, checkpoint=checkpoint
+            )
+            self.env['datasniffr.normalization.entry'].persist_cache()
             
             # Update fixer record
             fixer.write({
@@ -155,63 +179,35 @@ class DataSniffRFormatFixer(models.Model):
                 'message': '❌ Phone format fix encountered an error!'
             }
     
-    def _fix_phone_format(self, phone, record=None):
+    @memoized_normalizer('normalize_phone')
+    def _normalize_phone(self, phone, country_code=None):
+        """📞 Full phone engine result of one phone, as a dict"""
+        return phone_engine.normalize_phone(phone, country_code)._asdict()
+    
+    @memoized_normalizer('fix_phone')
+    def _fix_phone_format(self, phone, record=None, country_code=None):
         """📞 Fix and standardize phone format"""
         
         if not phone:
             return None
         
-        try:
-            # Clean the phone number first
-            cleaned = re.sub(r'[^\d\+\(\)\-\s]', '', str(phone))
-            
-            # Determine country from record
-            country_code = None
-            if record and hasattr(record, 'country_id') and record.country_id:
-                country_code = record.country_id.code
-            
-            # Try to parse with phonenumbers library
-            try:
-                parsed = phonenumbers.parse(cleaned, country_code)
-                if phonenumbers.is_valid_number(parsed):
-                    # Return in international format
-                    return phonenumbers.format_number(parsed, phonenumbers.PhoneNumberFormat.INTERNATIONAL)
-            except:
-                pass
-            
-            # Fallback formatting for common patterns
-            digits = re.sub(r'[^\d]', '', cleaned)
-            
-            if len(digits) == 10:  # US format
-                return f"({digits[:3]}) {digits[3:6]}-{digits[6:]}"
-            elif len(digits) == 11 and digits.startswith('1'):  # US with country code
-                return f"+1 ({digits[1:4]}) {digits[4:7]}-{digits[7:]}"
-            elif len(digits) >= 7:  # Generic formatting
-                return f"+{digits[:2]} {digits[2:5]} {digits[5:8]} {digits[8:]}"
-            
-            return None
-            
-        except Exception:
-            return None
+        # Determine country from record
+        if not country_code and record and hasattr(record, 'country_id') and record.country_id:
+            country_code = record.country_id.code
+        
+        # International format when valid, else the fallback formatting
+        return phone_engine.normalize_phone(phone, country_code).fixed
     
     def _detect_phone_country(self, phone):
         """🌍 Detect country from phone number"""
         
-        try:
-            parsed = phonenumbers.parse(phone, None)
-            return phonenumbers.region_code_for_number(parsed)
-        except:
-            return 'Unknown'
+        return phone_engine.detect_region(phone)
     
     def _extract_phone_pattern(self, phone):
         """📊 Extract format pattern from phone number"""
         
-        if not phone:
-            return None
-        
         # Replace digits with 'X' to create pattern
-        pattern = re.sub(r'\d', 'X', str(phone))
-        return pattern
+        return phone_engine.phone_pattern(phone)
     
     def _suggest_phone_fix(self, phone):
         """💡 Suggest phone fix"""
@@ -231,7 +227,7 @@ class DataSniffRFormatFixer(models.Model):
         return "Check phone number format"
     
     @api.model
-    def fix_email_formats(self, model_name='res.partner'):
+    def fix_email_formats(self, model_name='res.partner', batch_size=None, checkpoint=False):
         """📧 Fix and clean email formats"""
         
         fixer = self.create({
@@ -241,8 +237,7 @@ class DataSniffRFormatFixer(models.Model):
         })
         
         try:
-            Model = self.env[model_name]
-            records = Model.search([('email', '!=', False)])
+            rows = self.env['datasniffr.scan.reader'].iter_rows(model_name, ['id', 'email'], [('email', '!=', False)])
             
             fix_results = {
                 'cleaned_emails': [],
@@ -253,24 +248,22 @@ class DataSniffRFormatFixer(models.Model):
             
             total_processed = 0
             fixes_applied = 0
+            fixes = []
             
-            for record in records:
+            for row in rows:
                 total_processed += 1
-                original_email = record.email
+                original_email = row.email
                 
                 # Clean and fix email
                 fixed_email = self._fix_email_format(original_email)
                 
                 if fixed_email and fixed_email != original_email:
-                    if fixer.backup_original_values:
-                        self._backup_field_value(record, 'email', original_email)
-                    
                     if fixer.auto_apply_fixes:
-                        record.email = fixed_email
+                        fixes.append((row.id, original_email, fixed_email))
                         fixes_applied += 1
                         
                         fix_results['cleaned_emails'].append({
-                            'record_id': record.id,
+                            'record_id': row.id,
                             'original': original_email,
                             'fixed': fixed_email,
                             'fix_type': self._classify_email_fix(original_email, fixed_email)
@@ -286,12 +279,19 @@ class DataSniffRFormatFixer(models.Model):
                 
                 elif not self._is_valid_email_format(original_email):
                     fix_results['invalid_emails'].append({
-                        'record_id': record.id,
+                        'record_id': row.id,
                         'email': original_email,
                         'issues': self._identify_email_issues(original_email),
                         'suggestion': self._suggest_email_fix(original_email)
                     })
             
+            # Write the collected fixes back in batches once the scan is done
+            self.env['datasniffr.fix.writer'].apply_fixes(
+                model_name, 'email', fixes, backup=fixer.backup_original_values,
+                source=f'{fixer._name},{fixer.id}', batch_size=batch_size, checkpoint=checkpoint
+            )
+            self.env['datasniffr.normalization.entry'].persist_cache()
+            
             # Update fixer record
             fixer.write({
                 'total_records_processed': total_processed,
@@ -315,6 +315,7 @@ class DataSniffRFormatFixer(models.Model):
                 'message': '❌ Email format fix encountered an error!'
             }
     
+    @memoized_normalizer('fix_email')
     def _fix_email_format(self, email):
         """📧 Fix email format issues"""
         
@@ -442,7 +443,7 @@ class DataSniffRFormatFixer(models.Model):
         return "Check email format"
     
     @api.model
-    def fix_name_formats(self, model_name='res.partner'):
+    def fix_name_formats(self, model_name='res.partner', batch_size=None, checkpoint=False):
         """👤 Fix and standardize name formats"""
         
         fixer = self.create({
@@ -452,8 +453,7 @@ class DataSniffRFormatFixer(models.Model):
         })
         
         try:
-            Model = self.env[model_name]
-            records = Model.search([('name', '!=', False)])
+            rows = self.env['datasniffr.scan.reader'].iter_rows(model_name, ['id', 'name'], [('name', '!=', False)])
             
             fix_results = {
                 'standardized_names': [],
@@ -464,29 +464,34 @@ class DataSniffRFormatFixer(models.Model):
             
             total_processed = 0
             fixes_applied = 0
+            fixes = []
             
-            for record in records:
+            for row in rows:
                 total_processed += 1
-                original_name = record.name
+                original_name = row.name
                 
                 # Fix and standardize name
                 fixed_name = self._fix_name_format(original_name)
                 
                 if fixed_name and fixed_name != original_name:
-                    if fixer.backup_original_values:
-                        self._backup_field_value(record, 'name', original_name)
-                    
                     if fixer.auto_apply_fixes:
-                        record.name = fixed_name
+                        fixes.append((row.id, original_name, fixed_name))
                         fixes_applied += 1
                         
                         fix_type = self._classify_name_fix(original_name, fixed_name)
                         fix_results[f"{fix_type}_fixes"].append({
-                            'record_id': record.id,
+                            'record_id': row.id,
                             'original': original_name,
                             'fixed': fixed_name
                         })
             
+            # Write the collected fixes back in batches once the scan is done
+            self.env['datasniffr.fix.writer'].apply_fixes(
+                model_name, 'name', fixes, backup=fixer.backup_original_values,
+                source=f'{fixer._name},{fixer.id}', batch_size=batch_size, checkpoint=checkpoint
+            )
+            self.env['datasniffr.normalization.entry'].persist_cache()
+            
             # Update fixer record
             fixer.write({
                 'total_records_processed': total_processed,
@@ -553,7 +558,7 @@ class DataSniffRFormatFixer(models.Model):
         return 'standardized'
     
     @api.model
-    def comprehensive_format_fix(self, model_name='res.partner'):
+    def comprehensive_format_fix(self, model_name='res.partner', batch_size=None, checkpoint=False):
         """🌈 Apply comprehensive format fixes to all fields"""
         
         fixer = self.create({
@@ -564,9 +569,9 @@ class DataSniffRFormatFixer(models.Model):
         
         try:
             # Run all format fixes
-            phone_result = self.fix_phone_number_formats(model_name)
-            email_result = self.fix_email_formats(model_name)
-            name_result = self.fix_name_formats(model_name)
+            phone_result = self.fix_phone_number_formats(model_name, batch_size, checkpoint)
+            email_result = self.fix_email_formats(model_name, batch_size, checkpoint)
+            name_result = self.fix_name_formats(model_name, batch_size, checkpoint)
             
             comprehensive_results = {
                 'phone_fixes': phone_result,
@@ -606,21 +611,6 @@ class DataSniffRFormatFixer(models.Model):
                 'message': '❌ Comprehensive format fix encountered an error!'
             }
     
-    def _backup_field_value(self, record, field_name, original_value):
-        """💾 Backup original field value before fixing"""
-        
-        backup_data = {
-            'model': record._name,
-            'record_id': record.id,
-            'field_name': field_name,
-            'original_value': original_value,
-            'backup_date': datetime.now().isoformat(),
-            'fixer_id': self.id
-        }
-        
-        # Store backup (would integrate with backup system)
-        _logger.info(f"Format fix backup: {record._name}.{field_name} for record {record.id}")
-    
     @api.model
     def learn_format_patterns(self):
         """🧠 Learn format patterns from successful fixes"""
@@ -0,0 +1,201 @@
+#!/usr/bin/env python3
+"""
+DataSniffR Normalization Cache 🧠🧹
+==================================
+
+Clean each email, phone and VAT once per process, reuse it everywhere!
+The validator and format fixer share one bounded LRU of cleaner results.
+
+Features:
+- 🧠 Process-wide LRU of normalized values and validity verdicts
+- 🔒 Thread-safe (quick scans run checks on a thread pool)
+- 🧷 One decorator turns a pure cleaner method into a memoized one
+- 🗄️ Optional table keyed by input hash, warmed into the LRU on first use
+- 📊 Hit/miss statistics
+
+mmm lol 🐶💾 - Sniff once, remember forever (ish)! 🧠✨
+"""
+
+from odoo import models, fields, api
+import functools
+import hashlib
+import json
+import logging
+import threading
+from collections import OrderedDict
+
+from psycopg2.extras import execute_values
+
+_logger = logging.getLogger(__name__)
+
+# Cleaner results kept per process
+NORMALIZATION_CACHE_SIZE = 100000
+NORMALIZATION_PERSIST_PARAM = 'datasniffr.persist_normalization_cache'
+
+_MISSING = object()
+
+
+class NormalizationCache:
+    """🧠 Bounded, thread-safe LRU of ``(kind, args) -> result``"""
+
+    def __init__(self, maxsize=NORMALIZATION_CACHE_SIZE):
+        self.maxsize = maxsize
+        self.entries = OrderedDict()
+        self.unsaved = set()
+        self.hits = 0
+        self.misses = 0
+        self.lock = threading.Lock()
+
+    def get(self, key):
+        with self.lock:
+            result = self.entries.get(key, _MISSING)
+            if result is _MISSING:
+                self.misses += 1
+            else:
+                self.hits += 1
+                self.entries.move_to_end(key)
+            return result
+
+    def put(self, key, result, saved=False):
+        with self.lock:
+            self.entries[key] = result
+            self.entries.move_to_end(key)
+            if not saved:
+                self.unsaved.add(key)
+            while len(self.entries) > self.maxsize:
+                evicted, _result = self.entries.popitem(last=False)
+                self.unsaved.discard(evicted)
+
+    def take_unsaved(self):
+        """📤 ``[(key, result)]`` added since the last call"""
+        with self.lock:
+            pending = [(key, self.entries[key]) for key in self.unsaved if key in self.entries]
+            self.unsaved.clear()
+            return pending
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+            self.unsaved.clear()
+            self.hits = self.misses = 0
+
+    def stats(self):
+        with self.lock:
+            lookups = self.hits + self.misses
+            return {
+                'size': len(self.entries),
+                'maxsize': self.maxsize,
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': round(self.hits / lookups * 100, 1) if lookups else 0.0,
+            }
+
+
+# Shared by every engine of the process
+NORMALIZATION_CACHE = NormalizationCache()
+
+# Databases whose persisted entries were already loaded in this process
+_warmed_databases = set()
+
+
+def memoized_normalizer(kind):
+    """🧷 Memoize a cleaner method that only depends on its (plain) arguments
+
+    Calls passing a record (e.g. ``record=partner`` to read its country)
+    bypass the cache, since their result depends on more than the input.
+    Dict results are copied so callers can't mutate the cached verdict.
+    """
+
+    def decorator(method):
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            if any(isinstance(value, models.BaseModel) for value in (*args, *kwargs.values())):
+                return method(self, *args, **kwargs)
+
+            key = (kind, args, tuple(sorted(kwargs.items())))
+            try:
+                hash(key)
+            except TypeError:
+                return method(self, *args, **kwargs)
+
+            if self.env.cr.dbname not in _warmed_databases:
+                self.env['datasniffr.normalization.entry']._warm_cache()
+
+            result = NORMALIZATION_CACHE.get(key)
+            if result is _MISSING:
+                result = method(self, *args, **kwargs)
+                NORMALIZATION_CACHE.put(key, result)
+            return dict(result) if isinstance(result, dict) else result
+
+        return wrapper
+
+    return decorator
+
+
+def _key_hash(key):
+    return hashlib.sha256(json.dumps(key, default=str).encode()).hexdigest()
+
+
+class DataSniffRNormalizationEntry(models.Model):
+    _name = 'datasniffr.normalization.entry'
+    _description = 'DataSniffR Normalization Entry - Persisted Cleaner Result 🧠'
+
+    kind = fields.Char(string='Cleaner', required=True, index=True)
+    input_hash = fields.Char(string='Input Hash', required=True)
+    input_key = fields.Text(string='Input (JSON)')
+    result = fields.Text(string='Result (JSON)')
+
+    _sql_constraints = [
+        ('input_hash_unique', 'unique(input_hash)', 'One persisted result per cleaner input!'),
+    ]
+
+    @api.model
+    def _persistence_enabled(self):
+        return bool(self.env['ir.config_parameter'].sudo().get_param(NORMALIZATION_PERSIST_PARAM))
+
+    @api.model
+    def _warm_cache(self):
+        """🔥 Load persisted results into the LRU, once per database and process"""
+
+        _warmed_databases.add(self.env.cr.dbname)
+        if not self._persistence_enabled():
+            return 0
+
+        self.env.cr.execute(
+            "SELECT input_key, result FROM datasniffr_normalization_entry ORDER BY id DESC LIMIT %s",
+            (NORMALIZATION_CACHE.maxsize,)
+        )
+        loaded = 0
+        for input_key, result in self.env.cr.fetchall():
+            kind, args, kwargs = json.loads(input_key)
+            key = (kind, tuple(args), tuple(tuple(item) for item in kwargs))
+            NORMALIZATION_CACHE.put(key, json.loads(result), saved=True)
+            loaded += 1
+
+        _logger.info(f"Normalization cache warmed with {loaded} persisted results")
+        return loaded
+
+    @api.model
+    def persist_cache(self):
+        """💾 Upsert results computed since the last call (when persistence is on)"""
+
+        if not self._persistence_enabled():
+            return 0
+
+        rows = []
+        for key, result in NORMALIZATION_CACHE.take_unsaved():
+            kind, args, kwargs = key
+            rows.append((kind, _key_hash(key), json.dumps([kind, args, kwargs], default=str), json.dumps(result, default=str)))
+
+        if rows:
+            execute_values(self.env.cr, """
+                INSERT INTO datasniffr_normalization_entry (kind, input_hash, input_key, result) VALUES %s
+                ON CONFLICT (input_hash) DO UPDATE SET result = EXCLUDED.result
+            """, rows, page_size=5000)
+
+        return len(rows)
+
+    @api.model
+    def get_cache_stats(self):
+        """📊 Hit/miss statistics of this process's cache"""
+        return NORMALIZATION_CACHE.stats()
@@ -13,18 +13,55 @@ Features:
 - 🚨 Critical issue alerts
 - 🎮 Quick boss battle challenges
 - 📱 Mobile-friendly results
+- 🎲 Random/stratified sampling with confidence intervals
+- 🗄️ Whole-table critical checks pushed down to SQL
+- 🧵 Concurrent per-model checks under one shared deadline
+- 📸 Per-model health snapshots for instant dashboards
+- 🧮 Exact health from write-time quality counters when seeded
 
 mmm lol 🐶💾 - Speed of light data scanning! ⚡✨
 """
 
 from odoo import models, fields, api
+import contextlib
 import json
 import logging
+import math
+import random
+from concurrent.futures import ThreadPoolExecutor, as_completed, TimeoutError as FuturesTimeoutError
 from datetime import datetime
+from statistics import NormalDist
 import time
 
+from .datasniffr_field_validator import RECORDS_COUNTER
+
 _logger = logging.getLogger(__name__)
 
+# Rows drawn per sampling round before the interval is re-checked
+SAMPLE_BATCH_SIZE = 100
+
+# Columns the per-record quick checks look at
+QUICK_CHECK_COLUMNS = ['name', 'email', 'phone']
+
+# Models covered by the lightning health check unless told otherwise
+HEALTH_CHECK_MODELS = ['res.partner', 'sale.order', 'product.template', 'account.move']
+
+# Scan settings copied to the per-thread scan used by concurrent checks
+SAMPLING_SETTINGS = ['sampling_mode', 'sample_size', 'confidence_level', 'max_error_margin',
+                     'max_records_per_model', 'time_limit_seconds']
+
+# Snapshot row holding scan-level aggregates (model_name side)
+SCAN_SNAPSHOT_MODEL = '__scan__'
+
+# Mobile scan reuses a snapshot younger than this instead of recounting
+MOBILE_SNAPSHOT_MAX_AGE = 15 * 60
+
+# Quality counter rules that count as critical issues
+CRITICAL_QUALITY_RULES = {'invalid_email'}
+
+# Offending rows returned per critical check (counts always cover the whole table)
+CRITICAL_SAMPLE_SIZE = 50
+
 class DataSniffRQuickScan(models.Model):
     _name = 'datasniffr.quick.scan'
     _description = 'DataSniffR Quick Scan - Lightning Fast Basic Scans ⚡🔍'
@@ -45,9 +82,22 @@ class DataSniffRQuickScan(models.Model):
     ], string='Scan Type', default='health_check', required=True)
     
     target_models = fields.Text(string='Target Models (JSON)', default='["res.partner", "sale.order", "product.template"]')
-    max_records_per_model = fields.Integer(string='Max Records Per Model', default=1000)
+    max_records_per_model = fields.Integer(string='Max Records Per Model', default=5000)
     time_limit_seconds = fields.Integer(string='Time Limit (seconds)', default=10)
     
+    # Sampling
+    sampling_mode = fields.Selection([
+        ('stratified', 'Stratified by ID Range 🪜'),
+        ('tablesample', 'Random TABLESAMPLE 🎲'),
+    ], string='Sampling Mode', default='stratified', required=True)
+    sample_size = fields.Integer(string='Initial Sample Size', default=SAMPLE_BATCH_SIZE,
+                                 help='Rows drawn per round; rounds repeat until the interval is tight enough')
+    confidence_level = fields.Float(string='Confidence Level %', default=95.0)
+    max_error_margin = fields.Float(string='Max Error Margin (pp)', default=2.0,
+                                    help='Stop sampling once the issue-rate interval half-width is below this')
+    max_parallel_checks = fields.Integer(string='Parallel Model Checks', default=4,
+                                         help='Models checked at once, each on its own database cursor')
+    
     # Scan Results
     scan_status = fields.Selection([
         ('pending', 'Pending ⏳'),
@@ -72,13 +122,18 @@ class DataSniffRQuickScan(models.Model):
     battle_challenge = fields.Text(string='Battle Challenge (JSON)')
     
     @api.model
-    def run_lightning_health_check(self):
-        """❤️ Lightning-fast health check in under 10 seconds"""
+    def run_lightning_health_check(self, target_models=None):
+        """❤️ Lightning-fast health check in under 10 seconds
+        
+        ``target_models`` defaults to HEALTH_CHECK_MODELS; models are checked
+        ``max_parallel_checks`` at a time within the same time limit.
+        """
         
         start_time = time.time()
         scan_record = self.create({
             'name': f'Health Check - {datetime.now().strftime("%H:%M:%S")}',
             'scan_type': 'health_check',
+            'target_models': json.dumps(target_models or HEALTH_CHECK_MODELS),
             'scan_status': 'running'
         })
         
@@ -92,28 +147,40 @@ class DataSniffRQuickScan(models.Model):
             }
             
             # Quick model health checks
-            target_models = ['res.partner', 'sale.order', 'product.template', 'account.move']
+            target_models = json.loads(scan_record.target_models)
             total_issues = 0
             critical_count = 0
             
-            for model_name in target_models:
-                if time.time() - start_time > 8:  # Leave 2 seconds buffer
-                    break
-                    
-                model_results = self._quick_model_check(model_name)
+            # Leave 2 seconds buffer, shared by every model check
+            budget_end = start_time + scan_record.time_limit_seconds - 2
+            
+            for model_results in scan_record._run_model_checks(target_models, budget_end):
                 results['models_checked'].append(model_results)
+                model_name = model_results['model']
                 
                 total_issues += model_results.get('issues_count', 0)
                 critical_count += model_results.get('critical_count', 0)
                 
                 results['quick_stats'][model_name] = {
                     'total_records': model_results.get('total_records', 0),
+                    'sample_size': model_results.get('sample_size', 0),
                     'issues_found': model_results.get('issues_count', 0),
+                    'issue_rate': model_results.get('issue_rate'),
+                    'issue_rate_ci': model_results.get('issue_rate_ci'),
+                    'estimated_issues': model_results.get('estimated_issues'),
                     'health_score': model_results.get('health_score', 100)
                 }
             
-            # Calculate overall health score
-            overall_health = max(0, 100 - (total_issues * 2) - (critical_count * 10))
+            # Overall health is the record-weighted health of the sampled
+            # models, so it doesn't depend on how many rows were drawn
+            weighted = [(m['health_score'], m.get('total_records', 0)) for m in results['models_checked'] if m.get('total_records')]
+            total_weight = sum(weight for _score, weight in weighted)
+            overall_health = sum(score * weight for score, weight in weighted) / total_weight if total_weight else 100
+            results['health_metrics'] = {
+                'overall_health': overall_health,
+                'confidence_level': scan_record.confidence_level,
+                'records_sampled': sum(m.get('sample_size', 0) for m in results['models_checked']),
+            }
             
             # Generate quick recommendations
             recommendations = self._generate_quick_recommendations(results)
@@ -127,6 +194,7 @@ class DataSniffRQuickScan(models.Model):
             scan_record.write({
                 'scan_status': 'completed',
                 'scan_duration': scan_duration,
+                'total_records_scanned': results['health_metrics']['records_sampled'],
                 'issues_found': total_issues,
                 'critical_issues': critical_count,
                 'health_score': overall_health,
@@ -136,6 +204,12 @@ class DataSniffRQuickScan(models.Model):
                 'battle_challenge': json.dumps(boss_battle, indent=2) if boss_battle.get('triggered') else None
             })
             
+            Snapshot = self.env['datasniffr.health.snapshot']
+            for model_results in results['models_checked']:
+                if model_results.get('status') != 'timeout':
+                    Snapshot._record_check(model_results['model'], 'health_check', model_results, scan_record)
+            Snapshot._record_scan(scan_record)
+            
             return {
                 'success': True,
                 'scan_id': scan_record.id,
@@ -159,12 +233,129 @@ class DataSniffRQuickScan(models.Model):
                 'message': '❌ Quick scan encountered an error!'
             }
     
-    def _quick_model_check(self, model_name):
-        """🔍 Quick health check for a specific model"""
+    def _run_model_checks(self, target_models, budget_end):
+        """🧵 Yield per-model check results as they complete
+        
+        Checks run on a bounded thread pool, each on its own cursor. A check
+        gets an equal slice of the budget when it starts; models still
+        queued or running at ``budget_end`` are reported as timed out.
+        """
+        
+        workers = max(1, min(self.max_parallel_checks or 1, len(target_models)))
+        # Each worker works through len/workers models one after another
+        slice_seconds = max(0.0, budget_end - time.time()) * workers / max(len(target_models), 1)
+        
+        if workers == 1:
+            for model_name in target_models:
+                if time.time() >= budget_end:
+                    yield self._timed_out_check(model_name)
+                    continue
+                yield self._quick_model_check(model_name, min(budget_end, time.time() + slice_seconds))
+            return
+        
+        settings = {name: self[name] for name in SAMPLING_SETTINGS}
+        executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='datasniffr_quick_scan')
+        futures = {
+            executor.submit(self._threaded_model_check, model_name, settings, budget_end, slice_seconds): model_name
+            for model_name in target_models
+        }
+        
+        yielded = set()
+        try:
+            for future in as_completed(futures, timeout=max(0.0, budget_end - time.time()) + 1):
+                yielded.add(future)
+                yield future.result()
+        except FuturesTimeoutError:
+            for future, model_name in futures.items():
+                if future in yielded:
+                    continue
+                if future.done():
+                    # Finished right at the deadline, before as_completed handed it out
+                    yield future.result()
+                else:
+                    future.cancel()
+                    yield self._timed_out_check(model_name)
+        finally:
+            # Running checks stop on their own at the deadline (statement timeout)
+            executor.shutdown(wait=False)
+    
+    def _counter_model_check(self, model_name, quality):
+        """🧮 Exact model health read from the write-time quality counters"""
+        
+        total_records = quality.pop(RECORDS_COUNTER)
+        critical_count = sum(count for rule, count in quality.items() if rule in CRITICAL_QUALITY_RULES)
+        issues_count = sum(quality.values()) - critical_count
+        
+        issue_rate = min(100.0, (issues_count + critical_count) / total_records * 100) if total_records else 0.0
+        critical_rate = min(100.0, critical_count / total_records * 100) if total_records else 0.0
+        health_score = max(0, 100 - (issue_rate - critical_rate) * 5 - critical_rate * 15)
+        
+        return {
+            'model': model_name,
+            'total_records': total_records,
+            'sample_size': total_records,
+            'sampling_mode': 'counters',
+            'sampling_rounds': 0,
+            'issues_count': issues_count,
+            'critical_count': critical_count,
+            'issue_rate': round(issue_rate, 2),
+            'issue_rate_ci': [round(issue_rate, 2), round(issue_rate, 2)],
+            'critical_rate': round(critical_rate, 2),
+            'critical_rate_ci': [round(critical_rate, 2), round(critical_rate, 2)],
+            'error_margin': 0.0,
+            'converged': True,
+            'estimated_issues': issues_count + critical_count,
+            'rule_counts': quality,
+            'health_score': health_score,
+            'status': 'empty' if not total_records else 'live'
+        }
+    
+    def _threaded_model_check(self, model_name, settings, budget_end, slice_seconds):
+        """🧵 One model check on a fresh cursor, for a worker thread"""
+        
+        if time.time() >= budget_end:
+            return self._timed_out_check(model_name)
+        deadline = min(budget_end, time.time() + slice_seconds)
+        
+        manage = getattr(api.Environment, 'manage', contextlib.nullcontext)
+        with manage(), self.pool.cursor() as cr:
+            # A slow query can't hold the thread past the shared deadline
+            cr.execute("SET LOCAL statement_timeout = %s", (max(1, int((budget_end - time.time()) * 1000)),))
+            env = api.Environment(cr, self.env.uid, self.env.context)
+            # The scan row isn't committed yet, so threads work on an in-memory copy
+            scan = env[self._name].new(settings)
+            result = scan._quick_model_check(model_name, deadline)
+            cr.rollback()
+        
+        return result
+    
+    def _timed_out_check(self, model_name):
+        """⏰ Placeholder result for a model the budget didn't reach"""
+        
+        return {
+            'model': model_name,
+            'total_records': 0,
+            'issues_count': 0,
+            'critical_count': 0,
+            'health_score': 100,
+            'status': 'timeout'
+        }
+    
+    def _quick_model_check(self, model_name, deadline=None):
+        """🔍 Quick health check for a specific model
+        
+        Draws random rows in rounds until the issue-rate confidence interval
+        is within ``max_error_margin`` or ``deadline`` (epoch seconds) passes.
+        """
         
         try:
             Model = self.env[model_name]
             
+            # Live counters make sampling unnecessary
+            quality = self.env['datasniffr.quality.counter'].get_model_quality(model_name)
+            if quality is not None:
+                return self._counter_model_check(model_name, quality)
+            
             # Quick record count
             total_records = Model.search_count([])
             if total_records == 0:
@@ -177,37 +368,67 @@ class DataSniffRQuickScan(models.Model):
                     'status': 'empty'
                 }
             
-            # Sample records for quick check (max 100)
-            sample_size = min(100, total_records)
-            sample_records = Model.search([], limit=sample_size)
+            deadline = deadline or time.time() + (self.time_limit_seconds or 10)
+            batch_size = self.sample_size or SAMPLE_BATCH_SIZE
+            max_sample = min(total_records, self.max_records_per_model or total_records)
+            margin_target = self.max_error_margin or 2.0
+            columns = [name for name in QUICK_CHECK_COLUMNS
+                       if name in Model._fields and Model._fields[name].store and Model._fields[name].column_type]
             
+            # Drawn raw table ids vs rows actually evaluated: inactive or
+            # rule-hidden rows are drawn but not part of ``total_records``
+            drawn_ids = set()
+            sample_size = 0
             issues = []
             critical_issues = []
+            flagged = 0
+            critical_flagged = 0
+            rounds = 0
+            interval = (0.0, 100.0)
             
-            # Quick checks
-            for record in sample_records:
-                # Check for missing required fields
-                if hasattr(record, 'name') and not record.name:
-                    issues.append('Missing name field')
-                    
-                if hasattr(record, 'email') and record.email and '@' not in str(record.email):
-                    critical_issues.append('Invalid email format')
-                    
-                if hasattr(record, 'phone') and record.phone and len(str(record.phone).replace(' ', '').replace('-', '').replace('(', '').replace(')', '')) < 7:
-                    issues.append('Invalid phone format')
+            while sample_size < max_sample and time.time() < deadline:
+                rounds += 1
+                sample_ids = self._draw_sample_ids(Model, min(batch_size, max_sample - sample_size), drawn_ids, total_records)
+                if not sample_ids:
+                    break
+                drawn_ids.update(sample_ids)
+                
+                # Same active_test and record rules as search_count, so only
+                # rows of the counted population enter the rates
+                for row in self.env['datasniffr.scan.reader'].iter_rows(model_name, ['id'] + columns, [('id', 'in', sample_ids)]):
+                    sample_size += 1
+                    record_issues, record_critical = self._quick_record_issues(row, columns)
+                    issues.extend(record_issues)
+                    critical_issues.extend(record_critical)
+                    flagged += bool(record_issues or record_critical)
+                    critical_flagged += bool(record_critical)
+                
+                interval = self._issue_rate_interval(flagged, sample_size, total_records)
+                if (interval[1] - interval[0]) / 2 <= margin_target:
+                    break
             
-            issues_count = len(issues)
-            critical_count = len(critical_issues)
+            issue_rate = flagged / sample_size * 100 if sample_size else 0.0
+            critical_rate = critical_flagged / sample_size * 100 if sample_size else 0.0
+            critical_interval = self._issue_rate_interval(critical_flagged, sample_size, total_records)
             
-            # Calculate health score for this model
-            health_score = max(0, 100 - (issues_count * 5) - (critical_count * 15))
+            # Calculate health score for this model from the sampled rates
+            health_score = max(0, 100 - (issue_rate - critical_rate) * 5 - critical_rate * 15)
             
             return {
                 'model': model_name,
                 'total_records': total_records,
                 'sample_size': sample_size,
-                'issues_count': issues_count,
-                'critical_count': critical_count,
+                'sampling_mode': self.sampling_mode,
+                'sampling_rounds': rounds,
+                'issues_count': len(issues),
+                'critical_count': len(critical_issues),
+                'issue_rate': round(issue_rate, 2),
+                'issue_rate_ci': [round(bound, 2) for bound in interval],
+                'critical_rate': round(critical_rate, 2),
+                'critical_rate_ci': [round(bound, 2) for bound in critical_interval],
+                'error_margin': round((interval[1] - interval[0]) / 2, 2),
+                'converged': (interval[1] - interval[0]) / 2 <= margin_target,
+                'estimated_issues': round(issue_rate / 100 * total_records),
                 'health_score': health_score,
                 'issues': issues[:5],  # Top 5 issues
                 'critical_issues': critical_issues[:3]  # Top 3 critical
@@ -223,6 +444,88 @@ class DataSniffRQuickScan(models.Model):
                 'error': str(e)
             }
     
+    def _quick_record_issues(self, row, columns):
+        """🔍 (issues, critical issues) of one sampled row"""
+        
+        issues = []
+        critical_issues = []
+        
+        # Check for missing required fields
+        if 'name' in columns and not row.name:
+            issues.append('Missing name field')
+        
+        if 'email' in columns and row.email and '@' not in str(row.email):
+            critical_issues.append('Invalid email format')
+        
+        if 'phone' in columns and row.phone and len(str(row.phone).replace(' ', '').replace('-', '').replace('(', '').replace(')', '')) < 7:
+            issues.append('Invalid phone format')
+        
+        return issues, critical_issues
+    
+    def _draw_sample_ids(self, Model, count, exclude_ids, total_records):
+        """🎲 Up to ``count`` random ids of the model not in ``exclude_ids``
+        
+        ``stratified`` splits the id range into ``count`` equal strata and
+        probes one random id per stratum, so old and new rows are equally
+        represented. ``tablesample`` uses Postgres BERNOULLI sampling.
+        """
+        
+        cr = self.env.cr
+        table = Model._table
+        
+        if self.sampling_mode == 'tablesample':
+            # Oversample 2x so the LIMIT, not the sampling rate, caps the draw
+            percent = min(100.0, count * 2 / max(total_records, 1) * 100)
+            cr.execute(
+                f'SELECT id FROM "{table}" TABLESAMPLE BERNOULLI (%s) REPEATABLE (%s) '
+                f'WHERE NOT (id = ANY(%s)) LIMIT %s',
+                (percent, random.randint(0, 2 ** 31 - 1), list(exclude_ids), count)
+            )
+            return [row[0] for row in cr.fetchall()]
+        
+        cr.execute(f'SELECT min(id), max(id) FROM "{table}"')
+        min_id, max_id = cr.fetchone()
+        if min_id is None:
+            return []
+        
+        sample_ids = []
+        # Id gaps (deleted rows) mean some probes miss; a few extra rounds fill them
+        for _attempt in range(5):
+            missing = count - len(sample_ids)
+            if missing <= 0:
+                break
+            stratum = (max_id - min_id + 1) / missing
+            probes = [int(min_id + stratum * index + random.random() * stratum) for index in range(missing)]
+            cr.execute(
+                f'SELECT t.id FROM unnest(%s) AS p(probe) '
+                f'JOIN LATERAL (SELECT id FROM "{table}" WHERE id >= p.probe ORDER BY id LIMIT 1) t ON true',
+                (probes,)
+            )
+            found = {row[0] for row in cr.fetchall()} - set(exclude_ids) - set(sample_ids)
+            sample_ids.extend(sorted(found)[:missing])
+        
+        return sample_ids
+    
+    def _issue_rate_interval(self, flagged, sample_size, population):
+        """📏 Wilson score interval (in %) for an issue rate, with finite
+        population correction"""
+        
+        if not sample_size:
+            return (0.0, 100.0)
+        
+        z = NormalDist().inv_cdf(0.5 + (self.confidence_level or 95.0) / 200)
+        p = flagged / sample_size
+        
+        # Sampling a large share of the table shrinks the uncertainty
+        fpc = math.sqrt((population - sample_size) / (population - 1)) if population > 1 else 0.0
+        z_adjusted = z * fpc
+        
+        denominator = 1 + z_adjusted ** 2 / sample_size
+        center = (p + z_adjusted ** 2 / (2 * sample_size)) / denominator
+        spread = z_adjusted * math.sqrt(p * (1 - p) / sample_size + z_adjusted ** 2 / (4 * sample_size ** 2)) / denominator
+        
+        return (max(0.0, center - spread) * 100, min(1.0, center + spread) * 100)
+    
     def _generate_quick_recommendations(self, results):
         """💡 Generate lightning-fast recommendations"""
         
@@ -311,8 +614,15 @@ class DataSniffRQuickScan(models.Model):
         ]
         
         critical_issues = []
+        total_found = 0
+        Snapshot = self.env['datasniffr.health.snapshot']
         for check in critical_checks:
+            Snapshot._record_check(check.get('model', 'res.partner'), check['check'], {
+                'issues_count': check['issues_found'],
+                'critical_count': check['critical_found'],
+            })
             if check['issues_found'] > 0:
+                total_found += check['issues_found']
                 critical_issues.extend(check['issues'])
         
         scan_duration = time.time() - start_time
@@ -321,57 +631,73 @@ class DataSniffRQuickScan(models.Model):
             'success': True,
             'scan_type': 'critical_scan',
             'duration': scan_duration,
-            'critical_issues': len(critical_issues),
+            'critical_issues': total_found,
+            'checks': {check['check']: check['issues_found'] for check in critical_checks},
             'issues': critical_issues[:10],  # Top 10 most critical
-            'message': f'🚨 Found {len(critical_issues)} critical issues in {scan_duration:.2f} seconds!'
+            'message': f'🚨 Found {total_found} critical issues in {scan_duration:.2f} seconds!'
         }
     
     def _check_duplicate_customers(self):
-        """👥 Quick duplicate customer check"""
-        
-        # Simple duplicate detection based on email
-        partners = self.env['res.partner'].search([('email', '!=', False)], limit=500)
-        
-        email_counts = {}
-        duplicates = []
-        
-        for partner in partners:
-            email = partner.email.lower().strip()
-            if email in email_counts:
-                duplicates.append({
-                    'type': 'duplicate_customer',
-                    'description': f'Duplicate email: {email}',
-                    'records': [email_counts[email], partner.id],
-                    'severity': 'high'
-                })
-            else:
-                email_counts[email] = partner.id
+        """👥 Quick duplicate customer check
+        
+        One GROUP BY over every active partner email; issues_found counts
+        the extra records, the issues list holds the largest groups.
+        """
+        
+        self.env['res.partner'].flush(['email', 'active'])
+        self.env.cr.execute("""
+            SELECT lower(trim(email)) AS normalized_email,
+                   (array_agg(id ORDER BY id))[1:%(sample)s] AS record_ids,
+                   count(*) AS group_size,
+                   sum(count(*) - 1) OVER () AS extra_records
+              FROM res_partner
+             WHERE active AND email IS NOT NULL AND trim(email) != ''
+             GROUP BY lower(trim(email))
+            HAVING count(*) > 1
+             ORDER BY count(*) DESC, normalized_email
+             LIMIT %(sample)s
+        """, {'sample': CRITICAL_SAMPLE_SIZE})
+        rows = self.env.cr.fetchall()
+        
+        duplicates = [{
+            'type': 'duplicate_customer',
+            'description': f'Duplicate email: {email} ({group_size} records)',
+            'records': record_ids,
+            'severity': 'high'
+        } for email, record_ids, group_size, _extra in rows]
         
         return {
             'check': 'duplicate_customers',
-            'issues_found': len(duplicates),
+            'issues_found': int(rows[0][3]) if rows else 0,
+            'critical_found': 0,
             'issues': duplicates
         }
     
     def _check_invalid_emails(self):
-        """📧 Quick invalid email detection"""
-        
-        partners = self.env['res.partner'].search([('email', '!=', False)], limit=500)
-        
-        invalid_emails = []
-        for partner in partners:
-            email = partner.email
-            if email and ('@' not in email or '.' not in email.split('@')[-1]):
-                invalid_emails.append({
-                    'type': 'invalid_email',
-                    'description': f'Invalid email format: {email}',
-                    'record_id': partner.id,
-                    'severity': 'critical'
-                })
+        """📧 Quick invalid email detection (no @, or no dot after the last @)"""
+        
+        self.env['res.partner'].flush(['email', 'active'])
+        self.env.cr.execute("""
+            SELECT id, email, count(*) OVER () AS total
+              FROM res_partner
+             WHERE active AND email IS NOT NULL AND email != ''
+               AND email !~ '@[^@]*\\.[^@]*$'
+             ORDER BY id
+             LIMIT %s
+        """, (CRITICAL_SAMPLE_SIZE,))
+        rows = self.env.cr.fetchall()
+        
+        invalid_emails = [{
+            'type': 'invalid_email',
+            'description': f'Invalid email format: {email}',
+            'record_id': partner_id,
+            'severity': 'critical'
+        } for partner_id, email, _total in rows]
         
         return {
             'check': 'invalid_emails',
-            'issues_found': len(invalid_emails),
+            'issues_found': rows[0][2] if rows else 0,
+            'critical_found': rows[0][2] if rows else 0,
             'issues': invalid_emails
         }
     
@@ -379,42 +705,63 @@ class DataSniffRQuickScan(models.Model):
         """❗ Quick missing required fields check"""
         
         # Check partners without names
-        partners_no_name = self.env['res.partner'].search([('name', 'in', [False, ''])], limit=100)
-        
-        missing_fields = []
-        for partner in partners_no_name:
-            missing_fields.append({
-                'type': 'missing_required_field',
-                'description': 'Customer without name',
-                'record_id': partner.id,
-                'field': 'name',
-                'severity': 'high'
-            })
+        self.env['res.partner'].flush(['name', 'active'])
+        self.env.cr.execute("""
+            SELECT id, count(*) OVER () AS total
+              FROM res_partner
+             WHERE active AND (name IS NULL OR trim(name) = '')
+             ORDER BY id
+             LIMIT %s
+        """, (CRITICAL_SAMPLE_SIZE,))
+        rows = self.env.cr.fetchall()
+        
+        missing_fields = [{
+            'type': 'missing_required_field',
+            'description': 'Customer without name',
+            'record_id': partner_id,
+            'field': 'name',
+            'severity': 'high'
+        } for partner_id, _total in rows]
         
         return {
             'check': 'missing_required_fields',
-            'issues_found': len(missing_fields),
+            'issues_found': rows[0][1] if rows else 0,
+            'critical_found': 0,
             'issues': missing_fields
         }
     
     def _check_broken_relationships(self):
-        """🔗 Quick relationship integrity check"""
-        
-        # Check sale orders without customers
-        orders_no_customer = self.env['sale.order'].search([('partner_id', '=', False)], limit=50)
-        
-        broken_relationships = []
-        for order in orders_no_customer:
-            broken_relationships.append({
-                'type': 'broken_relationship',
-                'description': 'Sale order without customer',
-                'record_id': order.id,
-                'severity': 'critical'
-            })
+        """🔗 Quick relationship integrity check
+        
+        Sale orders whose customer is missing or no longer exists.
+        """
+        
+        if 'sale.order' not in self.env:
+            return {'check': 'broken_relationships', 'model': 'sale.order', 'issues_found': 0, 'critical_found': 0, 'issues': []}
+        
+        self.env['sale.order'].flush(['partner_id'])
+        self.env.cr.execute("""
+            SELECT so.id, so.partner_id, count(*) OVER () AS total
+              FROM sale_order so
+              LEFT JOIN res_partner p ON p.id = so.partner_id
+             WHERE p.id IS NULL
+             ORDER BY so.id
+             LIMIT %s
+        """, (CRITICAL_SAMPLE_SIZE,))
+        rows = self.env.cr.fetchall()
+        
+        broken_relationships = [{
+            'type': 'broken_relationship',
+            'description': 'Sale order without customer' if not partner_id else f'Sale order pointing at missing customer {partner_id}',
+            'record_id': order_id,
+            'severity': 'critical'
+        } for order_id, partner_id, _total in rows]
         
         return {
             'check': 'broken_relationships',
-            'issues_found': len(broken_relationships),
+            'model': 'sale.order',
+            'issues_found': rows[0][2] if rows else 0,
+            'critical_found': rows[0][2] if rows else 0,
             'issues': broken_relationships
         }
     
@@ -435,15 +782,23 @@ class DataSniffRQuickScan(models.Model):
         
         return {
             'check': 'security_issues',
+            'model': 'res.users',
             'issues_found': len(security_issues),
+            'critical_found': 0,
             'issues': security_issues
         }
     
     @api.model
     def get_quick_scan_dashboard(self):
-        """📊 Get instant dashboard data for mobile/quick view"""
+        """📊 Get instant dashboard data for mobile/quick view
         
-        recent_scans = self.search([], limit=5)
+        Reads the health snapshot table and the last five scans' scalar
+        columns; scan_results JSON is never parsed.
+        """
+        
+        recent_scans = self.search_read([], ['name', 'health_score', 'issues_found', 'scan_duration',
+                                             'scan_status', 'create_date'], limit=5)
+        snapshots = self.env['datasniffr.health.snapshot'].get_snapshot_rows()
         
         dashboard = {
             'last_scan': None,
@@ -461,29 +816,39 @@ class DataSniffRQuickScan(models.Model):
         if recent_scans:
             latest_scan = recent_scans[0]
             dashboard['last_scan'] = {
-                'id': latest_scan.id,
-                'name': latest_scan.name,
-                'health_score': latest_scan.health_score,
-                'issues_found': latest_scan.issues_found,
-                'duration': latest_scan.scan_duration,
-                'status': latest_scan.scan_status
+                'id': latest_scan['id'],
+                'name': latest_scan['name'],
+                'health_score': latest_scan['health_score'],
+                'issues_found': latest_scan['issues_found'],
+                'duration': latest_scan['scan_duration'],
+                'status': latest_scan['scan_status']
             }
             
             # Health trend from recent scans
             for scan in recent_scans:
                 dashboard['health_trend'].append({
-                    'timestamp': scan.create_date.isoformat(),
-                    'health_score': scan.health_score,
-                    'issues_count': scan.issues_found
+                    'timestamp': scan['create_date'].isoformat(),
+                    'health_score': scan['health_score'],
+                    'issues_count': scan['issues_found']
                 })
         
-        # Quick stats (would be calculated from actual data)
-        today_scans = self.search([('create_date', '>=', datetime.now().strftime('%Y-%m-%d 00:00:00'))])
-        dashboard['quick_stats']['total_scans_today'] = len(today_scans)
+        # Quick stats from today's scan aggregate
+        today = snapshots.get((SCAN_SNAPSHOT_MODEL, self.env['datasniffr.health.snapshot']._day_check_name()))
+        if today and today['run_count']:
+            dashboard['quick_stats']['total_scans_today'] = today['run_count']
+            dashboard['quick_stats']['average_health_score'] = today['health_total'] / today['run_count']
+            dashboard['quick_stats']['boss_battles_triggered'] = today['boss_battles']
         
-        if today_scans:
-            dashboard['quick_stats']['average_health_score'] = sum(scan.health_score for scan in today_scans) / len(today_scans)
-            dashboard['quick_stats']['boss_battles_triggered'] = sum(1 for scan in today_scans if scan.boss_battle_triggered)
+        # Latest state of every model and check
+        dashboard['model_health'] = [row for (model_name, _check), row in sorted(snapshots.items()) if model_name != SCAN_SNAPSHOT_MODEL]
+        for row in dashboard['model_health']:
+            if row['critical_count'] or row['check_name'] == 'health_check' and row['health_score'] < 80:
+                dashboard['urgent_actions'].append({
+                    'model': row['model_name'],
+                    'check': row['check_name'],
+                    'issues_found': row['issues_count'],
+                    'health_score': row['health_score'],
+                })
         
         return dashboard
     
@@ -528,8 +893,14 @@ class DataSniffRQuickScan(models.Model):
             'celebration': None
         }
         
-        # Quick customer check
-        partners_no_email = self.env['res.partner'].search_count([('email', '=', False), ('is_company', '=', False)])
+        # Quick customer check, from a fresh snapshot when there is one
+        Snapshot = self.env['datasniffr.health.snapshot']
+        snapshot = Snapshot.get_snapshot_rows(model_names=['res.partner']).get(('res.partner', 'missing_email'))
+        if snapshot and (fields.Datetime.now() - snapshot['scanned_at']).total_seconds() < MOBILE_SNAPSHOT_MAX_AGE:
+            partners_no_email = snapshot['issues_count']
+        else:
+            partners_no_email = self.env['res.partner'].search_count([('email', '=', False), ('is_company', '=', False)])
+            Snapshot._record_check('res.partner', 'missing_email', {'issues_count': partners_no_email})
         
         if partners_no_email > 10:
             mobile_results['health_status'] = 'warning'
@@ -590,18 +961,158 @@ class DataSniffRQuickScan(models.Model):
     
     @api.model
     def get_lightning_scan_stats(self):
-        """📊 Get overall lightning scan statistics"""
+        """📊 Get overall lightning scan statistics (from the running
+        aggregates in the snapshot table)"""
         
-        all_scans = self.search([])
+        totals = [row for (model_name, check_name), row
+                  in self.env['datasniffr.health.snapshot'].get_snapshot_rows(model_names=[SCAN_SNAPSHOT_MODEL]).items()
+                  if not check_name.startswith('day:')]
+        total_scans = sum(row['run_count'] for row in totals)
         
         stats = {
-            'total_scans': len(all_scans),
-            'average_duration': sum(scan.scan_duration for scan in all_scans) / len(all_scans) if all_scans else 0,
-            'average_health_score': sum(scan.health_score for scan in all_scans) / len(all_scans) if all_scans else 0,
-            'total_issues_found': sum(scan.issues_found for scan in all_scans),
-            'boss_battles_triggered': sum(1 for scan in all_scans if scan.boss_battle_triggered),
-            'fastest_scan': min(scan.scan_duration for scan in all_scans) if all_scans else 0,
-            'best_health_score': max(scan.health_score for scan in all_scans) if all_scans else 0
+            'total_scans': total_scans,
+            'average_duration': sum(row['duration_total'] for row in totals) / total_scans if total_scans else 0,
+            'average_health_score': sum(row['health_total'] for row in totals) / total_scans if total_scans else 0,
+            'total_issues_found': sum(row['issues_total'] for row in totals),
+            'boss_battles_triggered': sum(row['boss_battles'] for row in totals),
+            'fastest_scan': min(row['fastest_duration'] for row in totals) if total_scans else 0,
+            'best_health_score': max(row['best_health'] for row in totals) if total_scans else 0
         }
         
-        return stats
\ No newline at end of file
+        return stats
+
+
+class DataSniffRHealthSnapshot(models.Model):
+    _name = 'datasniffr.health.snapshot'
+    _description = 'DataSniffR Health Snapshot - Latest Result Per Model and Check 📸'
+    _order = 'model_name, check_name'
+    
+    model_name = fields.Char(string='Model', required=True, index=True)
+    check_name = fields.Char(string='Check', required=True, index=True)
+    
+    # Latest result
+    total_records = fields.Integer(string='Total Records', default=0)
+    sample_size = fields.Integer(string='Sample Size', default=0)
+    issues_count = fields.Integer(string='Issues', default=0)
+    critical_count = fields.Integer(string='Critical Issues', default=0)
+    issue_rate = fields.Float(string='Issue Rate %', default=0.0)
+    health_score = fields.Float(string='Health Score %', default=100.0)
+    scan_id = fields.Many2one('datasniffr.quick.scan', string='Last Scan', ondelete='set null')
+    scanned_at = fields.Datetime(string='Last Scanned', default=fields.Datetime.now)
+    
+    # Running aggregates (scan-level rows)
+    run_count = fields.Integer(string='Runs', default=0)
+    duration_total = fields.Float(string='Total Duration (s)', default=0.0)
+    health_total = fields.Float(string='Health Score Sum', default=0.0)
+    issues_total = fields.Integer(string='Issues Sum', default=0)
+    boss_battles = fields.Integer(string='Boss Battles', default=0)
+    fastest_duration = fields.Float(string='Fastest Run (s)', default=0.0)
+    best_health = fields.Float(string='Best Health Score %', default=0.0)
+    
+    _sql_constraints = [
+        ('model_check_unique', 'unique(model_name, check_name)', 'One snapshot per model and check!'),
+    ]
+    
+    @api.model
+    def _day_check_name(self, day=None):
+        return f"day:{(day or fields.Datetime.now()).strftime('%Y-%m-%d')}"
+    
+    @api.model
+    def _record_check(self, model_name, check_name, result, scan=None):
+        """📸 Upsert the latest result of one check on one model"""
+        
+        self.env.cr.execute("""
+            INSERT INTO datasniffr_health_snapshot AS s
+                   (model_name, check_name, total_records, sample_size, issues_count, critical_count,
+                    issue_rate, health_score, scan_id, scanned_at, run_count,
+                    create_uid, write_uid, create_date, write_date)
+            VALUES (%(model)s, %(check)s, %(total)s, %(sample)s, %(issues)s, %(critical)s,
+                    %(rate)s, %(health)s, %(scan)s, now() at time zone 'UTC', 1,
+                    %(uid)s, %(uid)s, now() at time zone 'UTC', now() at time zone 'UTC')
+            ON CONFLICT (model_name, check_name) DO UPDATE
+               SET total_records = EXCLUDED.total_records,
+                   sample_size = EXCLUDED.sample_size,
+                   issues_count = EXCLUDED.issues_count,
+                   critical_count = EXCLUDED.critical_count,
+                   issue_rate = EXCLUDED.issue_rate,
+                   health_score = EXCLUDED.health_score,
+                   scan_id = EXCLUDED.scan_id,
+                   scanned_at = EXCLUDED.scanned_at,
+                   run_count = s.run_count + 1,
+                   write_uid = EXCLUDED.write_uid,
+                   write_date = EXCLUDED.write_date
+        """, {
+            'model': model_name,
+            'check': check_name,
+            'total': result.get('total_records', 0),
+            'sample': result.get('sample_size', 0),
+            'issues': result.get('issues_count', 0),
+            'critical': result.get('critical_count', 0),
+            'rate': result.get('issue_rate') or 0.0,
+            'health': result.get('health_score', 100),
+            'scan': scan.id if scan else None,
+            'uid': self.env.uid,
+        })
+        self.invalidate_cache()
+    
+    @api.model
+    def _record_scan(self, scan):
+        """📈 Fold one finished scan into its all-time and today's aggregates"""
+        
+        for check_name in (scan.scan_type, self._day_check_name()):
+            self.env.cr.execute("""
+                INSERT INTO datasniffr_health_snapshot AS s
+                       (model_name, check_name, issues_count, critical_count, health_score, scan_id, scanned_at,
+                        run_count, duration_total, health_total, issues_total, boss_battles,
+                        fastest_duration, best_health,
+                        create_uid, write_uid, create_date, write_date)
+                VALUES (%(model)s, %(check)s, %(issues)s, %(critical)s, %(health)s, %(scan)s, now() at time zone 'UTC',
+                        1, %(duration)s, %(health)s, %(issues)s, %(boss)s,
+                        %(duration)s, %(health)s,
+                        %(uid)s, %(uid)s, now() at time zone 'UTC', now() at time zone 'UTC')
+                ON CONFLICT (model_name, check_name) DO UPDATE
+                   SET issues_count = EXCLUDED.issues_count,
+                       critical_count = EXCLUDED.critical_count,
+                       health_score = EXCLUDED.health_score,
+                       scan_id = EXCLUDED.scan_id,
+                       scanned_at = EXCLUDED.scanned_at,
+                       run_count = s.run_count + 1,
+                       duration_total = s.duration_total + EXCLUDED.duration_total,
+                       health_total = s.health_total + EXCLUDED.health_total,
+                       issues_total = s.issues_total + EXCLUDED.issues_total,
+                       boss_battles = s.boss_battles + EXCLUDED.boss_battles,
+                       fastest_duration = least(s.fastest_duration, EXCLUDED.fastest_duration),
+                       best_health = greatest(s.best_health, EXCLUDED.best_health),
+                       write_uid = EXCLUDED.write_uid,
+                       write_date = EXCLUDED.write_date
+            """, {
+                'model': SCAN_SNAPSHOT_MODEL,
+                'check': check_name,
+                'issues': scan.issues_found,
+                'critical': scan.critical_issues,
+                'health': scan.health_score,
+                'scan': scan.id,
+                'duration': scan.scan_duration,
+                'boss': 1 if scan.boss_battle_triggered else 0,
+                'uid': self.env.uid,
+            })
+        self.invalidate_cache()
+    
+    @api.model
+    def get_snapshot_rows(self, model_names=None):
+        """📸 ``{(model_name, check_name): row}`` in one indexed query
+        
+        Past days' aggregates are left out, so this stays one row per
+        model and check.
+        """
+        
+        domain = ['|', ('check_name', 'not like', 'day:'), ('check_name', '=', self._day_check_name())]
+        if model_names:
+            domain.append(('model_name', 'in', model_names))
+        rows = self.search_read(domain, [
+            'model_name', 'check_name', 'total_records', 'sample_size', 'issues_count', 'critical_count',
+            'issue_rate', 'health_score', 'scanned_at', 'run_count', 'duration_total', 'health_total',
+            'issues_total', 'boss_battles', 'fastest_duration', 'best_health',
+        ])
+        
+        return {(row['model_name'], row['check_name']): row for row in rows}
\ No newline at end of file
@@ -0,0 +1,202 @@
+#!/usr/bin/env python3
+"""
+DataSniffR Rule Engine 🎯⚙️
+==========================
+
+Custom validation rules compiled once, evaluated over whole columns!
+Pure Python + NumPy, no Odoo imports, so it is easy to test and reuse.
+
+Features:
+- 🧩 Rules compiled once (regexes precompiled, parameters parsed)
+- 💸 Cheapest rules first, optional short-circuit on the first violation
+- 📊 Vectorized length checks over column arrays
+- 🗄️ SQL predicates for rules Postgres can evaluate itself
+
+mmm lol 🐶💾 - Compile once, sniff a million! 🎯✨
+"""
+
+import re
+
+import numpy as np
+
+# Relative evaluation cost; cheaper rules run first
+RULE_COSTS = {
+    'required': 0,
+    'min_length': 1,
+    'max_length': 1,
+    'contains': 2,
+    'regex': 3,
+}
+
+
+class CompiledRule:
+    """🧩 One custom validation rule, parsed and ready to run"""
+
+    def __init__(self, rule, position):
+        self.type = rule.get('type')
+        self.name = rule.get('name', self.type)
+        self.position = position
+        self.cost = RULE_COSTS.get(self.type)
+
+        if self.type == 'min_length':
+            self.value = rule.get('value', 0)
+            self.message = f'Value too short (minimum {rule.get("value")} characters)'
+        elif self.type == 'max_length':
+            self.value = rule.get('value', 999)
+            self.message = f'Value too long (maximum {rule.get("value")} characters)'
+        elif self.type == 'regex':
+            self.value = re.compile(rule.get('pattern', ''))
+            self.message = 'Value does not match required pattern'
+        elif self.type == 'contains':
+            self.value = rule.get('value', '')
+            self.message = f'Value must contain "{rule.get("value")}"'
+        else:
+            self.value = None
+            self.message = 'Field is required but empty'
+
+    @property
+    def supported(self):
+        return self.cost is not None
+
+    def violates(self, value):
+        """🔍 Whether a single value breaks this rule"""
+
+        if self.type == 'required':
+            return not value
+        if not value:
+            return False
+        if self.type == 'min_length':
+            return len(str(value)) < self.value
+        if self.type == 'max_length':
+            return len(str(value)) > self.value
+        if self.type == 'regex':
+            return self.value.match(str(value)) is None
+        if self.type == 'contains':
+            return self.value not in str(value)
+        return False
+
+    def violations(self, column, rows=None):
+        """📊 Boolean violation mask over ``column`` (restricted to ``rows``)"""
+
+        if rows is not None:
+            subset = column.take(rows)
+        else:
+            subset = column
+
+        if self.type == 'required':
+            return ~subset.truthy
+        if self.type == 'min_length':
+            return subset.truthy & (subset.lengths < self.value)
+        if self.type == 'max_length':
+            return subset.truthy & (subset.lengths > self.value)
+        if self.type == 'regex':
+            match = self.value.match
+            return np.fromiter(
+                (bool(value) and match(text) is None for value, text in zip(subset.values, subset.texts)),
+                dtype=bool, count=len(subset)
+            )
+        if self.type == 'contains':
+            needle = self.value
+            return np.fromiter(
+                (bool(value) and needle not in text for value, text in zip(subset.values, subset.texts)),
+                dtype=bool, count=len(subset)
+            )
+        return np.zeros(len(subset), dtype=bool)
+
+    def sql(self, column):
+        """🗄️ ``(predicate, params)`` true for violating rows, or None when
+        Postgres can't reproduce the rule exactly (regex dialects differ)"""
+
+        if self.type == 'required':
+            return f"({column} IS NULL OR {column} = '')", []
+        if self.type == 'min_length':
+            return f"({column} <> '' AND char_length({column}) < %s)", [self.value]
+        if self.type == 'max_length':
+            return f"({column} <> '' AND char_length({column}) > %s)", [self.value]
+        if self.type == 'contains':
+            return f"({column} <> '' AND strpos({column}, %s) = 0)", [self.value]
+        return None
+
+
+class Column:
+    """📊 A batch of field values with the derived arrays rules share"""
+
+    def __init__(self, values):
+        self.values = list(values)
+        self.texts = [str(value) if value else '' for value in self.values]
+        self.truthy = np.fromiter((bool(value) for value in self.values), dtype=bool, count=len(self.values))
+        self.lengths = np.fromiter((len(text) for text in self.texts), dtype=np.int64, count=len(self.texts))
+
+    def __len__(self):
+        return len(self.values)
+
+    def take(self, rows):
+        subset = Column.__new__(Column)
+        subset.values = [self.values[row] for row in rows]
+        subset.texts = [self.texts[row] for row in rows]
+        subset.truthy = self.truthy[rows]
+        subset.lengths = self.lengths[rows]
+        return subset
+
+
+class CompiledRuleSet:
+    """⚙️ A whole rule list compiled once and ordered by cost"""
+
+    def __init__(self, rules):
+        compiled = [CompiledRule(rule, position) for position, rule in enumerate(rules or [])]
+        # Unknown rule types never fire, like the interpreted rules did
+        self.rules = sorted((rule for rule in compiled if rule.supported), key=lambda rule: (rule.cost, rule.position))
+
+    @property
+    def rule_names(self):
+        return [rule.name for rule in self.rules]
+
+    def evaluate(self, value):
+        """🎯 Violations of one value, in the original rule order"""
+
+        violations = [rule for rule in self.rules if rule.violates(value)]
+        violations.sort(key=lambda rule: rule.position)
+        return [{'rule': rule.name, 'message': rule.message} for rule in violations]
+
+    def evaluate_batch(self, values, stop_on_first=False):
+        """📊 ``[(rule, violation mask)]`` over a list of values
+
+        With ``stop_on_first`` a row is only checked until its first (i.e.
+        cheapest) violation, so expensive rules skip rows already invalid.
+        """
+
+        column = Column(values)
+        masks = []
+        pending = None
+
+        for rule in self.rules:
+            if pending is None:
+                mask = rule.violations(column)
+            else:
+                rows = np.flatnonzero(pending)
+                mask = np.zeros(len(column), dtype=bool)
+                if len(rows):
+                    mask[rows] = rule.violations(column, rows)
+            masks.append((rule, mask))
+
+            if stop_on_first:
+                pending = ~mask if pending is None else pending & ~mask
+
+        return masks
+
+    def sql_predicates(self, column):
+        """🗄️ ``[(rule, predicate, params)]``, or None if any rule can't be pushed down"""
+
+        predicates = []
+        for rule in self.rules:
+            compiled = rule.sql(column)
+            if compiled is None:
+                return None
+            predicates.append((rule, compiled[0], compiled[1]))
+        return predicates
+
+
+def compile_rules(rules):
+    """⚙️ Compile a custom validation rule list"""
+
+    return rules if isinstance(rules, CompiledRuleSet) else CompiledRuleSet(rules)
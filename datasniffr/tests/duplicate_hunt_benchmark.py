@@ -0,0 +1,374 @@
+#!/usr/bin/env python3
+"""
+DataSniffR Duplicate Hunt Benchmark 🏎️👥
+========================================
+
+Reproducible throughput and recall numbers for the duplicate hunter!
+Synthetic partners with known duplicates go in, JSON comes out.
+
+Features:
+- 🧪 Seeded synthetic partners (10k / 100k / 1M) with typos
+- 🎛️ Controlled duplicate rate and copies per duplicated partner
+- ⏱️ Per-phase wall time and peak memory
+- 🎯 Pairwise precision / recall against the ground truth
+- 📄 JSON report to diff between releases
+
+Two ways to run it:
+
+- Standalone (no Odoo): times the match engine phases (blocking,
+  scoring, clustering)::
+
+      python3 tests/duplicate_hunt_benchmark.py --sizes 10000 100000 --output bench.json
+
+- From ``odoo-bin shell`` on a scratch database: runs the hunter's own
+  phases (exact, fuzzy, clustering, patterns, merge suggestions) on the
+  synthetic rows, inside a rolled back savepoint::
+
+      bench = runpy.run_path('tests/duplicate_hunt_benchmark.py')
+      report = bench['run_benchmark'](env=env, sizes=[10000])
+
+mmm lol 🐶💾 - What gets measured gets de-duplicated! 🏎️✨
+"""
+
+import argparse
+import importlib.util
+import json
+import os
+import platform
+import random
+import resource
+import string
+import sys
+import time
+import tracemalloc
+from collections import namedtuple
+from datetime import datetime
+
+MODELS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'models')
+
+DEFAULT_SIZES = [10000, 100000, 1000000]
+
+# Same columns the hunter scans (HUNT_SCAN_COLUMNS)
+BenchRow = namedtuple('BenchRow', ['id', 'name', 'email', 'phone', 'street', 'zip', 'city'])
+
+FIRST_NAMES = ['john', 'jane', 'maria', 'ahmed', 'li', 'olga', 'pedro', 'emma', 'noah', 'fatima',
+               'lucas', 'sofia', 'kenji', 'amara', 'ivan', 'chloe', 'diego', 'hana', 'omar', 'greta']
+LAST_SYLLABLES = ['son', 'berg', 'ez', 'ski', 'ov', 'ton', 'man', 'ini', 'ardo', 'stein',
+                  'wood', 'field', 'sen', 'ura', 'ic', 'ley', 'mont', 'aux', 'rez', 'ani']
+CITIES = ['Springfield', 'Rivertown', 'Lakeside', 'Hillview', 'Brookfield', 'Fairhaven', 'Oakdale', 'Maplewood']
+STREETS = ['Main St', 'Oak Ave', 'Elm Rd', 'Pine Ln', 'Cedar Blvd', 'Market St', 'Station Rd', 'Park Ave']
+DOMAINS = ['gmail.com', 'yahoo.com', 'outlook.com', 'acme.com', 'example.org', 'mail.net']
+DOMAIN_TYPOS = {'gmail.com': 'gmai.com', 'yahoo.com': 'yaho.com', 'outlook.com': 'outlok.com'}
+
+
+def _load_match_engine():
+    """🔧 Import the match engine by path (the models package needs Odoo)"""
+
+    spec = importlib.util.spec_from_file_location(
+        'datasniffr_match_engine', os.path.join(MODELS_DIR, 'datasniffr_match_engine.py'))
+    module = importlib.util.module_from_spec(spec)
+    # Registered so worker processes can unpickle engine functions
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def _typo(rng, text):
+    """✏️ One random swap, drop, insert or case change"""
+
+    if len(text) < 3:
+        return text
+    position = rng.randrange(1, len(text) - 1)
+    kind = rng.choice(['swap', 'drop', 'insert', 'case'])
+    if kind == 'swap':
+        return text[:position - 1] + text[position] + text[position - 1] + text[position + 1:]
+    if kind == 'drop':
+        return text[:position] + text[position + 1:]
+    if kind == 'insert':
+        return text[:position] + rng.choice(string.ascii_lowercase) + text[position:]
+    return text.upper() if rng.random() < 0.5 else text.title()
+
+
+def _format_phone(rng, digits):
+    """📞 Same number, different punctuation"""
+
+    return rng.choice([
+        digits,
+        f'({digits[:3]}) {digits[3:6]}-{digits[6:]}',
+        f'{digits[:3]}.{digits[3:6]}.{digits[6:]}',
+        f'+1 {digits[:3]} {digits[3:6]} {digits[6:]}',
+    ])
+
+
+def generate_partners(size, duplicate_rate=0.1, max_copies=3, typo_rate=0.5, seed=42):
+    """🧪 ``size`` synthetic partner rows and the entity each one belongs to
+
+    ``duplicate_rate`` of the entities get 1..``max_copies`` extra copies;
+    each copied field gets a typo with probability ``typo_rate``.
+    """
+
+    rng = random.Random(seed)
+    rows = []
+    entity_of = {}
+    entity = 0
+
+    while len(rows) < size:
+        entity += 1
+        first = rng.choice(FIRST_NAMES)
+        last = rng.choice(FIRST_NAMES)[:3] + rng.choice(LAST_SYLLABLES)
+        name = f'{first.title()} {last.title()}'
+        email = f'{first}.{last}{rng.randrange(1000)}@{rng.choice(DOMAINS)}'
+        digits = ''.join(rng.choice(string.digits) for _ in range(10))
+        street = f'{rng.randrange(1, 999)} {rng.choice(STREETS)}'
+        zip_code = f'{rng.randrange(10000, 99999)}'
+        city = rng.choice(CITIES)
+
+        copies = rng.randint(1, max_copies) if rng.random() < duplicate_rate else 0
+        for copy in range(copies + 1):
+            if len(rows) >= size:
+                break
+            row_name, row_email, row_phone = name, email, digits
+            if copy:
+                if rng.random() < typo_rate:
+                    row_name = _typo(rng, row_name)
+                if rng.random() < typo_rate:
+                    local, domain = row_email.split('@')
+                    row_email = f'{local}@{DOMAIN_TYPOS.get(domain, domain)}' if rng.random() < 0.3 else _typo(rng, row_email)
+                if rng.random() < 0.2:
+                    row_email = False
+            rows.append(BenchRow(
+                id=len(rows) + 1,
+                name=row_name,
+                email=row_email,
+                phone=_format_phone(rng, row_phone),
+                street=street,
+                zip=zip_code,
+                city=city,
+            ))
+            entity_of[len(rows)] = entity
+
+    return rows, entity_of
+
+
+def true_duplicate_pairs(entity_of):
+    """🎯 Every pair of rows generated from the same entity"""
+
+    members = {}
+    for row_id, entity in entity_of.items():
+        members.setdefault(entity, []).append(row_id)
+
+    return {
+        (ids[i], ids[j])
+        for ids in members.values() if len(ids) > 1
+        for i in range(len(ids)) for j in range(i + 1, len(ids))
+    }
+
+
+def group_pairs(groups):
+    """🔗 Pairs implied by duplicate groups (lists of member ids)"""
+
+    pairs = set()
+    for members in groups:
+        members = sorted(members)
+        pairs.update((members[i], members[j]) for i in range(len(members)) for j in range(i + 1, len(members)))
+    return pairs
+
+
+def precision_recall(predicted, truth):
+    """📏 Pairwise precision / recall / F1 in percent"""
+
+    hits = len(predicted & truth)
+    precision = hits / len(predicted) * 100 if predicted else 100.0
+    recall = hits / len(truth) * 100 if truth else 100.0
+    f1 = 2 * precision * recall / (precision + recall) if precision + recall else 0.0
+    return {
+        'predicted_pairs': len(predicted),
+        'true_pairs': len(truth),
+        'precision': round(precision, 2),
+        'recall': round(recall, 2),
+        'f1': round(f1, 2),
+    }
+
+
+class _RollbackBenchmark(Exception):
+    """Raised to roll back the benchmark savepoint"""
+
+
+class PhaseTimer:
+    """⏱️ Wall time and peak traced memory per phase"""
+
+    def __init__(self, trace_memory=True):
+        self.trace_memory = trace_memory
+        self.phases = {}
+
+    def run(self, name, func, *args, **kwargs):
+        if self.trace_memory:
+            tracemalloc.start()
+        started = time.perf_counter()
+        try:
+            result = func(*args, **kwargs)
+        finally:
+            elapsed = time.perf_counter() - started
+            peak = tracemalloc.get_traced_memory()[1] if self.trace_memory else None
+            if self.trace_memory:
+                tracemalloc.stop()
+        self.phases[name] = {
+            'seconds': round(elapsed, 3),
+            'peak_memory_mb': round(peak / 1024 / 1024, 1) if peak is not None else None,
+        }
+        return result
+
+
+def _bench_engine(rows, entity_of, timer, min_similarity, workers):
+    """🧠 Match engine phases, no Odoo needed"""
+
+    engine = _load_match_engine()
+
+    profiles = timer.run('profiles', lambda: [
+        engine.build_match_profile(row.id, row.name, row.email, row.phone, ' '.join([row.street, row.zip, row.city]))
+        for row in rows
+    ])
+    scorer = timer.run('vectorize', engine.PairScorer, profiles, engine.DEFAULT_WEIGHTS)
+
+    if workers > 1:
+        edges, candidate_count = timer.run(
+            'blocking_and_scoring', engine.parallel_match_edges, profiles, scorer, min_similarity, workers)
+    else:
+        candidates = timer.run('blocking', engine.generate_candidate_pairs, profiles)
+        candidate_count = len(candidates)
+        edges = timer.run('scoring', lambda: list(engine.score_candidate_pairs(scorer, candidates, min_similarity)))
+
+    clusters = timer.run('clustering', engine.cluster_edges, [(pair[0], pair[1], {}) for pair, _sim, _fields in edges])
+
+    return {
+        'candidate_pairs': candidate_count,
+        'fuzzy_edges': len(edges),
+        'groups': len(clusters),
+        'quality': precision_recall(group_pairs(c['members'] for c in clusters), true_duplicate_pairs(entity_of)),
+    }
+
+
+def _bench_hunter(env, rows, entity_of, timer, min_similarity, workers):
+    """🐶 The hunter's own phases on synthetic scan rows"""
+
+    Hunter = env['datasniffr.duplicate.hunter']
+    hunter = Hunter.create({
+        'name': f'Benchmark - {len(rows)} partners',
+        'target_model': 'res.partner',
+        'hunt_type': 'full_spectrum',
+        'similarity_threshold': min_similarity,
+        'parallel_workers': workers,
+    })
+
+    exact_groups = timer.run('exact', hunter._find_exact_duplicates, rows)
+    fuzzy_edges = timer.run('fuzzy', hunter._find_fuzzy_edges, rows)
+
+    def cluster():
+        edges = list(fuzzy_edges)
+        for group in exact_groups:
+            edges.extend(Hunter._group_match_edges(group))
+        return hunter._cluster_match_edges(rows, edges)
+
+    groups = timer.run('clustering', cluster)
+    timer.run('patterns', hunter._analyze_duplicate_patterns, groups)
+    timer.run('merge_suggestions', lambda: [
+        hunter._build_merge_suggestion(group, f'group_{index}') for index, group in enumerate(groups, 1)
+    ])
+
+    predicted = group_pairs([dup['id'] for dup in group['duplicates']] for group in groups)
+
+    return {
+        'candidate_pairs': hunter.candidate_pairs_scored,
+        'exact_groups': len(exact_groups),
+        'fuzzy_edges': len(fuzzy_edges),
+        'groups': len(groups),
+        'quality': precision_recall(predicted, true_duplicate_pairs(entity_of)),
+    }
+
+
+def run_benchmark(env=None, sizes=None, duplicate_rate=0.1, max_copies=3, typo_rate=0.5,
+                  min_similarity=80.0, workers=1, seed=42, trace_memory=True):
+    """🏎️ Benchmark every dataset size and return the JSON-ready report"""
+
+    report = {
+        'benchmark': 'duplicate_hunt',
+        'mode': 'hunter' if env is not None else 'engine',
+        'generated_at': datetime.now().isoformat(),
+        'python': platform.python_version(),
+        'cpu_count': os.cpu_count(),
+        'parameters': {
+            'duplicate_rate': duplicate_rate,
+            'max_copies': max_copies,
+            'typo_rate': typo_rate,
+            'min_similarity': min_similarity,
+            'workers': workers,
+            'seed': seed,
+        },
+        'runs': [],
+    }
+
+    for size in sizes or DEFAULT_SIZES:
+        timer = PhaseTimer(trace_memory)
+        rows, entity_of = timer.run('generate', generate_partners, size, duplicate_rate, max_copies, typo_rate, seed)
+
+        started = time.perf_counter()
+        if env is not None:
+            # Nothing the benchmark creates should outlive it
+            try:
+                with env.cr.savepoint():
+                    result = _bench_hunter(env, rows, entity_of, timer, min_similarity, workers)
+                    raise _RollbackBenchmark()
+            except _RollbackBenchmark:
+                env['base'].invalidate_cache()
+        else:
+            result = _bench_engine(rows, entity_of, timer, min_similarity, workers)
+        elapsed = time.perf_counter() - started
+
+        report['runs'].append({
+            'size': size,
+            'entities': len(set(entity_of.values())),
+            'total_seconds': round(elapsed, 3),
+            'records_per_second': round(size / elapsed, 1) if elapsed else None,
+            'max_rss_mb': round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1),
+            'phases': timer.phases,
+            **result,
+        })
+
+    return report
+
+
+def main():
+    parser = argparse.ArgumentParser(description='🏎️ DataSniffR duplicate hunt benchmark')
+    parser.add_argument('--sizes', type=int, nargs='+', default=DEFAULT_SIZES)
+    parser.add_argument('--duplicate-rate', type=float, default=0.1)
+    parser.add_argument('--max-copies', type=int, default=3)
+    parser.add_argument('--typo-rate', type=float, default=0.5)
+    parser.add_argument('--min-similarity', type=float, default=80.0)
+    parser.add_argument('--workers', type=int, default=1)
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--no-trace-memory', action='store_true', help='Skip tracemalloc (much faster on 1M rows)')
+    parser.add_argument('--output', help='Write the JSON report here instead of stdout')
+    args = parser.parse_args()
+
+    report = run_benchmark(
+        sizes=args.sizes,
+        duplicate_rate=args.duplicate_rate,
+        max_copies=args.max_copies,
+        typo_rate=args.typo_rate,
+        min_similarity=args.min_similarity,
+        workers=args.workers,
+        seed=args.seed,
+        trace_memory=not args.no_trace_memory,
+    )
+
+    output = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, 'w') as f:
+            f.write(output)
+        print(f"🏎️ Benchmark report written to {args.output}")
+    else:
+        print(output)
+
+
+if __name__ == "__main__":
+    main()